@@ -16,22 +16,26 @@
 #  under the License.
 
 import re
+import time
 import warnings
 from typing import (
     Any,
     Callable,
     Collection,
     Dict,
+    Hashable,
     Iterable,
     List,
     Mapping,
     Optional,
+    Sequence,
     Tuple,
     Union,
 )
 
 from elastic_transport import (
     ApiResponse,
+    ApiResponseMeta,
     AsyncTransport,
     BinaryApiResponse,
     HeadApiResponse,
@@ -47,6 +51,7 @@ from elastic_transport.client_utils import DEFAULT, DefaultType
 
 from ..._otel import OpenTelemetry
 from ..._version import _SERVERLESS_API_VERSION, __versionstr__
+from ...cache import ResponseCache
 from ...compat import warn_stacklevel
 from ...exceptions import (
     HTTP_EXCEPTIONS,
@@ -56,15 +61,55 @@ from ...exceptions import (
     SerializationError,
     UnsupportedProductError,
 )
-from .utils import _TYPE_ASYNC_SNIFF_CALLBACK, _base64_auth_header, _quote_query
+from ...hedging import HedgingPolicy
+from ...lazy import LazyResponseBody
+from ...node_selector import (
+    _ATTRIBUTES_EXTRA,
+    _ROLES_EXTRA,
+    NodeRouting,
+    RoutingSelector,
+    _RequestContext,
+)
+from ...serializer import (
+    Serializer,
+    _BodyFormat,
+    _json_response_mode,
+    _resolve_body_formats,
+)
+from ...streaming import STREAMED_ITEMS_PATHS, StreamingResponseBody
+from .utils import (
+    _TYPE_ASYNC_SNIFF_CALLBACK,
+    _AsyncRequestCoalescer,
+    _AsyncRequestHedger,
+    _base64_auth_header,
+    _call_response_cache,
+    _quote_query,
+)
 
 _WARNING_RE = re.compile(r"\"([^\"]*)\"")
 _COMPAT_MIMETYPE_TEMPLATE = "application/vnd.elasticsearch+%s; compatible-with=" + str(
     __versionstr__.partition(".")[0]
 )
-_COMPAT_MIMETYPE_RE = re.compile(r"application/(json|x-ndjson|vnd\.mapbox-vector-tile)")
+_COMPAT_MIMETYPE_RE = re.compile(
+    r"application/(json|x-ndjson|cbor|vnd\.mapbox-vector-tile)"
+)
 _COMPAT_MIMETYPE_SUB = _COMPAT_MIMETYPE_TEMPLATE % (r"\g<1>",)
 
+# Endpoints using POST which only read data, so concurrent
+# identical requests can share a single in-flight request.
+_COALESCE_POST_ENDPOINTS = frozenset(
+    (
+        "count",
+        "field_caps",
+        "mget",
+        "msearch",
+        "msearch_template",
+        "search",
+        "search_template",
+        "terms_enum",
+    )
+)
+
 
 def resolve_auth_headers(
     headers: Optional[Mapping[str, str]],
@@ -169,6 +214,9 @@ def create_sniff_callback(
         transport: AsyncTransport, sniff_options: SniffOptions
     ) -> List[NodeConfig]:
         for _ in transport.node_pool.all():
+            # Sniffing can run within a request whose response is decoded by
+            # the client, the sniff response is always decoded as usual.
+            token = _json_response_mode.set(None)
             try:
                 meta, node_infos = await transport.perform_request(
                     "GET",
@@ -184,6 +232,8 @@ def create_sniff_callback(
                 )
             except (SerializationError, ConnectionError):
                 continue
+            finally:
+                _json_response_mode.reset(token)
 
             if not 200 <= meta.status <= 299:
                 continue
@@ -204,9 +254,15 @@ def create_sniff_callback(
                     host, port_str = address.rsplit(":", 1)
                     port = int(port_str)
 
+                # Roles and attributes are kept for node selectors to use.
+                extras = meta.node._extras.copy()
+                extras[_ROLES_EXTRA] = tuple(node_info.get("roles", ()))
+                extras[_ATTRIBUTES_EXTRA] = dict(node_info.get("attributes", {}))
+
                 assert sniffed_node_callback is not None
                 sniffed_node = sniffed_node_callback(
-                    node_info, meta.node.replace(host=host, port=port)
+                    node_info,
+                    meta.node.replace(host=host, port=port, _extras=extras),
                 )
                 if sniffed_node is None:
                     continue
@@ -249,6 +305,22 @@ class BaseClient:
         self._retry_backoff_cap: Union[DefaultType, float] = DEFAULT
         self._is_serverless = False
         self._verified_elasticsearch = False
+        self._request_coalescer: Optional[_AsyncRequestCoalescer] = None
+        self._response_cache: Optional[ResponseCache] = None
+        self._hedging: Optional[HedgingPolicy] = None
+        self._request_hedger = _AsyncRequestHedger()
+        self._node_routing: Optional[NodeRouting] = None
+        self._stream_response = False
+        self._lazy_response = False
+        self._body_mimetype: Optional[str] = None
+        self._endpoint_formats: Mapping[str, _BodyFormat] = {}
+        # Requests are routed and tracked if the node pool supports it.
+        node_selector = getattr(
+            getattr(_transport, "node_pool", None), "node_selector", None
+        )
+        self._routing_selector = (
+            node_selector if isinstance(node_selector, RoutingSelector) else None
+        )
         self._otel = OpenTelemetry()
 
     @property
@@ -271,17 +343,165 @@ class BaseClient:
             endpoint_id=endpoint_id,
             path_parts=path_parts or {},
         ) as otel_span:
-            response = await self._perform_request(
-                method,
-                path,
-                params=params,
-                headers=headers,
-                body=body,
-                otel_span=otel_span,
-            )
+            response_cache = self._response_cache
+            if response_cache is not None and not response_cache.is_cached_endpoint(
+                endpoint_id
+            ):
+                response_cache = None
+            request_coalescer = self._request_coalescer
+            if request_coalescer is not None and not (
+                method in ("GET", "HEAD")
+                or (method == "POST" and endpoint_id in _COALESCE_POST_ENDPOINTS)
+            ):
+                request_coalescer = None
+
+            key: Hashable = None
+            if response_cache is not None or request_coalescer is not None:
+                key, body = self._request_key(
+                    method,
+                    path,
+                    params=params,
+                    headers=headers,
+                    body=body,
+                    endpoint_id=endpoint_id,
+                )
+
+            cached_response = None
+            if response_cache is not None:
+                cached_response = await _call_response_cache(
+                    response_cache, response_cache.get, key
+                )
+            if cached_response is not None:
+                response = cached_response
+            elif request_coalescer is not None:
+                response = await request_coalescer.call(
+                    key,
+                    lambda: self._perform_request(
+                        method,
+                        path,
+                        params=params,
+                        headers=headers,
+                        body=body,
+                        endpoint_id=endpoint_id,
+                        otel_span=otel_span,
+                    ),
+                    otel_span,
+                )
+            else:
+                response = await self._perform_request(
+                    method,
+                    path,
+                    params=params,
+                    headers=headers,
+                    body=body,
+                    endpoint_id=endpoint_id,
+                    otel_span=otel_span,
+                )
+            if response_cache is not None and cached_response is None:
+                await _call_response_cache(
+                    response_cache, response_cache.put, key, response, path_parts
+                )
+
             otel_span.set_elastic_cloud_metadata(response.meta.headers)
             return response
 
+    def _check_body_mimetype(self, body_mimetype: Optional[str]) -> None:
+        if body_mimetype is None:
+            return
+        try:
+            self.transport.serializers.get_serializer(body_mimetype)
+        except SerializationError:
+            raise ValueError(
+                f"No serializer is configured for 'body_mimetype' {body_mimetype!r}"
+            ) from None
+
+    def _set_endpoint_formats(
+        self, endpoint_formats: Optional[Mapping[str, Union[str, Sequence[str]]]]
+    ) -> None:
+        self._endpoint_formats = (
+            _resolve_body_formats(endpoint_formats, self.transport.serializers)
+            if endpoint_formats
+            else {}
+        )
+
+    def _negotiate_format(
+        self, endpoint_id: Optional[str], request_headers: HttpHeaders
+    ) -> Tuple[HttpHeaders, Mapping[str, Serializer]]:
+        """Applies the body format of the endpoint (or else the 'body_mimetype')
+        to the headers of a request. Returns the headers and the serializers of
+        the format used instead of the transport's.
+        """
+        body_format = (
+            self._endpoint_formats.get(endpoint_id) if endpoint_id is not None else None
+        )
+        if body_format is not None:
+            content_type, accept = body_format.content_type, body_format.accept
+        else:
+            content_type = accept = self._body_mimetype
+
+        # Bodies sent and received as JSON use the negotiated format instead.
+        for header, mimetype in (("content-type", content_type), ("accept", accept)):
+            if (
+                mimetype is not None
+                and request_headers.get(header) == "application/json"
+            ):
+                if request_headers is self._headers:
+                    request_headers = request_headers.copy()
+                request_headers[header] = mimetype
+        return request_headers, body_format.serializers if body_format else {}
+
+    def _json_serializer(self, endpoint_id: str) -> Serializer:
+        """Returns the serializer of JSON values sent to the endpoint,
+        ie the serializer of the lines of 'bulk' requests in the helpers.
+        """
+        body_format = self._endpoint_formats.get(endpoint_id)
+        if body_format is not None and "application/json" in body_format.serializers:
+            return body_format.serializers["application/json"]
+        return self.transport.serializers.get_serializer("application/json")
+
+    def _request_key(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[Any] = None,
+        endpoint_id: Optional[str] = None,
+    ) -> Tuple[Hashable, Optional[Any]]:
+        """Builds the key identifying identical requests. The body is serialized
+        up-front to be part of the key and is returned so it isn't serialized twice.
+        """
+        request_headers = self._headers.copy()
+        if headers:
+            request_headers.update(headers)
+        request_headers, format_serializers = self._negotiate_format(
+            endpoint_id, request_headers
+        )
+        if body is not None:
+            content_type = request_headers.get("content-type")
+            body_serializer = format_serializers.get(content_type or "")
+            if body_serializer is not None:
+                body = body_serializer.dumps(body)
+            else:
+                body = self.transport.serializers.dumps(body, mimetype=content_type)
+        ignore_status = self._ignore_status
+        if ignore_status is not DEFAULT and ignore_status is not None:
+            ignore_status = tuple(sorted(ignore_status))
+        key = (
+            method,
+            path,
+            _quote_query(params) if params else "",
+            tuple(sorted((k.lower(), v) for k, v in request_headers.items())),
+            body,
+            ignore_status,
+            self._stream_response,
+            self._lazy_response,
+            self._body_mimetype,
+            self._endpoint_formats.get(endpoint_id) if endpoint_id else None,
+        )
+        return key, body
+
     async def _perform_request(
         self,
         method: str,
@@ -290,6 +510,7 @@ class BaseClient:
         params: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, str]] = None,
         body: Optional[Any] = None,
+        endpoint_id: Optional[str] = None,
         otel_span: OpenTelemetrySpan,
     ) -> ApiResponse[Any]:
         if headers:
@@ -298,6 +519,16 @@ class BaseClient:
         else:
             request_headers = self._headers
 
+        request_headers, format_serializers = self._negotiate_format(
+            endpoint_id, request_headers
+        )
+        if format_serializers and body is not None:
+            body_serializer = format_serializers.get(
+                request_headers.get("content-type") or ""
+            )
+            if body_serializer is not None:
+                body = body_serializer.dumps(body)
+
         if self._is_serverless:
             request_headers["elastic-api-version"] = _SERVERLESS_API_VERSION
         else:
@@ -319,25 +550,106 @@ class BaseClient:
         else:
             target = path
 
-        meta, resp_body = await self.transport.perform_request(
-            method,
-            target,
-            headers=request_headers,
-            body=body,
-            request_timeout=self._request_timeout,
-            max_retries=self._max_retries,
-            retry_on_status=self._retry_on_status,
-            retry_on_timeout=self._retry_on_timeout,
-            retry_backoff_base=self._retry_backoff_base,
-            retry_backoff_cap=self._retry_backoff_cap,
-            client_meta=self._client_meta,
-            otel_span=otel_span,
+        # JSON bodies of responses with many items are decoded incrementally.
+        items_path = (
+            STREAMED_ITEMS_PATHS.get(endpoint_id)
+            if self._stream_response and endpoint_id is not None
+            else None
         )
 
+        # With 'lazy_response' other JSON bodies are decoded when accessed.
+        if items_path is not None:
+            response_mode: Optional[str] = "raw"
+        elif self._lazy_response:
+            response_mode = "lazy"
+        elif format_serializers:
+            # Decoded below by the serializers of the negotiated format.
+            response_mode = "raw"
+        else:
+            response_mode = None
+
+        # Contexts of the sent requests, a hedged request
+        # avoids the nodes selected for the first request.
+        request_contexts: List[_RequestContext] = []
+
+        async def send() -> Tuple[ApiResponseMeta, Any]:
+            token = (
+                _json_response_mode.set(response_mode)
+                if response_mode is not None
+                else None
+            )
+            try:
+                if self._routing_selector is not None:
+                    with self._routing_selector._track_request(
+                        self._node_routing,
+                        endpoint_id,
+                        avoid=request_contexts[0] if request_contexts else None,
+                    ) as context:
+                        request_contexts.append(context)
+                        return await send_request()
+                return await send_request()
+            finally:
+                if token is not None:
+                    _json_response_mode.reset(token)
+
+        async def send_request() -> Tuple[ApiResponseMeta, Any]:
+            return await self.transport.perform_request(
+                method,
+                target,
+                headers=request_headers,
+                body=body,
+                request_timeout=self._request_timeout,
+                max_retries=self._max_retries,
+                retry_on_status=self._retry_on_status,
+                retry_on_timeout=self._retry_on_timeout,
+                retry_backoff_base=self._retry_backoff_base,
+                retry_backoff_cap=self._retry_backoff_cap,
+                client_meta=self._client_meta,
+                otel_span=otel_span,
+            )
+
+        hedging = self._hedging
+        if (
+            hedging is not None
+            and endpoint_id is not None
+            and hedging.is_hedged_endpoint(endpoint_id)
+        ):
+
+            async def send_and_observe() -> Tuple[ApiResponseMeta, Any]:
+                start = time.perf_counter()
+                result = await send()
+                hedging.observe(endpoint_id, time.perf_counter() - start)
+                return result
+
+            # Only transport errors (ie connection errors) let the
+            # other request win, error responses are returned as-is.
+            meta, resp_body = await self._request_hedger.call(
+                send_and_observe, hedging.delay(endpoint_id)
+            )
+        else:
+            meta, resp_body = await send()
+
+        if items_path is not None and isinstance(resp_body, bytes):
+            if 200 <= meta.status <= 299:
+                resp_body = StreamingResponseBody(resp_body, items_path)
+            else:
+                # Error responses are decoded as usual.
+                resp_body = self.transport.serializers.loads(resp_body, meta.mimetype)
+        elif items_path is not None and isinstance(resp_body, dict):
+            resp_body = StreamingResponseBody(resp_body, items_path)
+        elif isinstance(resp_body, LazyResponseBody) and not 200 <= meta.status <= 299:
+            resp_body = resp_body.to_dict()
+        elif response_mode == "raw" and isinstance(resp_body, bytes):
+            body_serializer = format_serializers.get(meta.mimetype or "")
+            if body_serializer is not None:
+                resp_body = body_serializer.loads(resp_body)
+            else:
+                resp_body = self.transport.serializers.loads(resp_body, meta.mimetype)
+
         # HEAD with a 404 is returned as a normal response
         # since this is used as an 'exists' functionality.
         if not (method == "HEAD" and meta.status == 404) and (
-            not 200 <= meta.status < 299
+            not 200 <= meta.status <= 299
             and (
                 self._ignore_status is DEFAULT
                 or self._ignore_status is None
@@ -393,7 +705,7 @@ class BaseClient:
 
         if method == "HEAD":
             response = HeadApiResponse(meta=meta)
-        elif isinstance(resp_body, dict):
+        elif isinstance(resp_body, Mapping):
             response = ObjectApiResponse(body=resp_body, meta=meta)  # type: ignore[assignment]
         elif isinstance(resp_body, list):
             response = ListApiResponse(body=resp_body, meta=meta)  # type: ignore[assignment]
@@ -29,6 +29,8 @@ from .utils import (
 )
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
+
     from ...esql import ESQLBase
 
 
@@ -1250,3 +1252,24 @@ class EsqlClient(NamespacedClient):
             endpoint_id="esql.query",
             path_parts=__path_parts,
         )
+
+    async def query_arrow(
+        self, *, query: t.Union[str, "ESQLBase"], **kwargs: t.Any
+    ) -> "pa.RecordBatchReader":
+        """
+        Run an ES|QL query and get the results in the Apache Arrow format.
+
+        Results are returned as a reader of Arrow record batches which are read
+        from the response without copying or converting them to Python values.
+        Use :func:`elasticsearch.esql.to_pandas` or
+        :func:`elasticsearch.esql.to_polars` to get a DataFrame.
+        Requires the ``pyarrow`` package.
+
+        :param query: The ES|QL query.
+        :param kwargs: Other parameters of :meth:`query`.
+        """
+        from ...esql.arrow import _import, _record_batch_reader
+
+        _import("pyarrow")
+        resp = await self.query(query=query, format="arrow", **kwargs)
+        return _record_batch_reader(resp.body)
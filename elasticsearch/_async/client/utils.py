@@ -15,6 +15,22 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import anyio
+from elastic_transport import OpenTelemetrySpan
+
 from ..._sync.client.utils import (
     _TYPE_ASYNC_SNIFF_CALLBACK,
     _TYPE_HOSTS,
@@ -24,6 +40,9 @@ from ..._sync.client.utils import (
     Visibility,
     _availability_warning,
     _base64_auth_header,
+    _copy_error,
+    _InflightRequest,
+    _PendingBatch,
     _quote,
     _quote_query,
     _rewrite_parameters,
@@ -31,6 +50,158 @@ from ..._sync.client.utils import (
     is_requests_http_auth,
     is_requests_node_class,
 )
+from ...cache import ResponseCache
+
+T = TypeVar("T")
+
+
+async def _call_response_cache(
+    response_cache: ResponseCache, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Calls a method of the response cache, from a worker thread
+    if its store does blocking IO to not block the event loop.
+    """
+    if response_cache.store.blocking:
+        return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+    return func(*args, **kwargs)
+
+
+class _AsyncRequestCoalescer:
+    """Shares a single in-flight call between concurrent tasks
+    that ask for the same key ('single-flight'). Callers that arrive
+    while a request is in-flight wait for it and receive the same
+    response object or a copy of the exception instead of sending
+    their own request.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, _InflightRequest] = {}
+
+    async def call(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[T]],
+        otel_span: Optional[OpenTelemetrySpan] = None,
+    ) -> T:
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                inflight = _InflightRequest(anyio.Event(), otel_span)
+                self._inflight[key] = inflight
+                try:
+                    inflight.result = await func()
+                    inflight.done = True
+                    return inflight.result  # type: ignore[no-any-return]
+                except Exception as e:
+                    inflight.error = e
+                    inflight.done = True
+                    raise
+                finally:
+                    del self._inflight[key]
+                    inflight.event.set()
+
+            await inflight.event.wait()
+            # If the leading task was cancelled without a result
+            # we start over with a new request.
+            if inflight.done:
+                return inflight.follow(otel_span)  # type: ignore[no-any-return]
+
+
+class _AsyncMicroBatcher:
+    """Collects items submitted by concurrent tasks into batches
+    that are sent together. The first caller of a batch waits up to
+    ``max_delay`` seconds (or until ``max_batch`` items are collected)
+    and sends the batch, every caller then receives the result at the
+    position of its own item or the exception raised while sending.
+    """
+
+    def __init__(self, max_delay: float, max_batch: int) -> None:
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+
+    async def submit(
+        self,
+        key: Hashable,
+        item: Any,
+        send: Callable[[List[Any]], Awaitable[Sequence[T]]],
+    ) -> T:
+        while True:
+            batch = self._pending.get(key)
+            is_leader = batch is None
+            if batch is None:
+                batch = _PendingBatch(anyio.Event(), anyio.Event())
+                self._pending[key] = batch
+            position = len(batch.items)
+            batch.items.append(item)
+            if len(batch.items) >= self.max_batch:
+                del self._pending[key]
+                batch.ready.set()
+
+            if is_leader:
+                try:
+                    with anyio.move_on_after(self.max_delay):
+                        await batch.ready.wait()
+                    self._close(key, batch)
+                    batch.results = await send(batch.items)
+                except Exception as e:
+                    batch.error = e
+                    raise
+                finally:
+                    self._close(key, batch)
+                    batch.done.set()
+                return batch.results[position]
+
+            await batch.done.wait()
+            if batch.error is not None:
+                raise _copy_error(batch.error) from batch.error
+            # If the leading task was cancelled before sending
+            # the batch the item is resubmitted.
+            if batch.results is not None:
+                return batch.results[position]  # type: ignore[no-any-return]
+
+    def _close(self, key: Hashable, batch: _PendingBatch) -> None:
+        # Items submitted from now on are collected into a new batch.
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+
+
+class _AsyncRequestHedger:
+    """Calls a function and calls it a second time if the first call
+    hasn't completed within a delay. The first successful result is
+    returned and the slower call is cancelled.
+    """
+
+    async def call(self, func: Callable[[], Awaitable[T]], delay: float) -> T:
+        results: List[T] = []
+        errors: List[Exception] = []
+        first_done = anyio.Event()
+
+        async with anyio.create_task_group() as tg:
+
+            async def run(done: Optional[anyio.Event] = None) -> None:
+                try:
+                    results.append(await func())
+                    tg.cancel_scope.cancel()
+                except Exception as e:
+                    errors.append(e)
+                finally:
+                    if done is not None:
+                        done.set()
+
+            tg.start_soon(run, first_done)
+            with anyio.move_on_after(delay):
+                await first_done.wait()
+            if not first_done.is_set():
+                tg.start_soon(run)
+
+        if results:
+            return results[0]
+        raise errors[0]
+
+    async def close(self) -> None:
+        """The calls run in the caller's task group, there is nothing to release"""
+
 
 __all__ = [
     "CLIENT_META_SERVICE",
@@ -40,6 +211,9 @@ __all__ = [
     "_quote_query",
     "_TYPE_HOSTS",
     "SKIP_IN_PATH",
+    "_AsyncMicroBatcher",
+    "_AsyncRequestCoalescer",
+    "_AsyncRequestHedger",
     "Stability",
     "Visibility",
     "client_node_configs",
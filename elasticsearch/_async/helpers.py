@@ -16,11 +16,15 @@
 #  under the License.
 
 import asyncio
+import contextvars
 import logging
+from contextlib import suppress
+from functools import partial
 from typing import (
     Any,
     AsyncIterable,
     AsyncIterator,
+    Awaitable,
     Callable,
     Collection,
     Dict,
@@ -28,13 +32,22 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     TypeVar,
     Union,
 )
 
 import sniffio
-from anyio import create_memory_object_stream, create_task_group, move_on_after
+from anyio import (
+    BrokenResourceError,
+    CancelScope,
+    ClosedResourceError,
+    create_memory_object_stream,
+    create_task_group,
+    move_on_after,
+)
+from anyio.streams.memory import MemoryObjectSendStream
 
 from ..exceptions import ApiError, NotFoundError, TransportError
 from ..helpers.actions import (
@@ -68,12 +81,40 @@ async def _sleep(seconds: float) -> None:
         await asyncio.sleep(seconds)
 
 
+_background_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _start_task(func: Callable[[], Awaitable[None]]) -> CancelScope:
+    """
+    Run ``func`` in a background task that isn't tied to the caller's task
+    group, so it can be started and cancelled from an async generator
+    without holding a cancel scope across ``yield``. ``func`` has to handle
+    its own exceptions, the returned scope cancels the task.
+    """
+    scope = CancelScope()
+
+    async def run() -> None:
+        with scope:
+            await func()
+
+    if sniffio.current_async_library() == "trio":
+        import trio
+
+        trio.lowlevel.spawn_system_task(run, context=contextvars.copy_context())
+    else:
+        task = asyncio.get_running_loop().create_task(run())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    return scope
+
+
 async def _chunk_actions(
     actions: AsyncIterable[_TYPE_BULK_ACTION_HEADER_WITH_META_AND_BODY],
     chunk_size: int,
     max_chunk_bytes: int,
     flush_after_seconds: Optional[float],
     serializer: Serializer,
+    pack_vectors: bool = False,
 ) -> AsyncIterable[
     Tuple[
         List[
@@ -90,7 +131,10 @@ async def _chunk_actions(
     the process.
     """
     chunker = _ActionChunker(
-        chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes, serializer=serializer
+        chunk_size=chunk_size,
+        max_chunk_bytes=max_chunk_bytes,
+        serializer=serializer,
+        pack_vectors=pack_vectors,
     )
 
     action: _TYPE_BULK_ACTION_WITH_META
@@ -230,6 +274,7 @@ async def async_streaming_bulk(
     ignore_status: Union[int, Collection[int]] = (),
     retry_on_status: Union[int, Collection[int]] = (429,),
     *args: Any,
+    pack_vectors: bool = False,
     **kwargs: Any,
 ) -> AsyncIterable[Tuple[bool, Dict[str, Any]]]:
     """
@@ -271,6 +316,9 @@ async def async_streaming_bulk(
     :arg max_backoff: maximum number of seconds a retry will wait
     :arg yield_ok: if set to False will skip successful documents in the output
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg pack_vectors: pack the float32 numpy arrays of documents with
+        :func:`~elasticsearch.helpers.pack_dense_vector`. Only use it when
+        these arrays are indexed into ``dense_vector`` fields of type ``float``.
     """
 
     client = client.options()
@@ -288,7 +336,7 @@ async def async_streaming_bulk(
             else:
                 yield expand_action_callback(item)
 
-    serializer = client.transport.serializers.get_serializer("application/json")
+    serializer = client._json_serializer("bulk")
 
     bulk_data: List[
         Union[
@@ -298,7 +346,12 @@ async def async_streaming_bulk(
     ]
     bulk_actions: List[bytes]
     async for bulk_data, bulk_actions in _chunk_actions(
-        map_actions(), chunk_size, max_chunk_bytes, flush_after_seconds, serializer
+        map_actions(),
+        chunk_size,
+        max_chunk_bytes,
+        flush_after_seconds,
+        serializer,
+        pack_vectors,
     ):
         for attempt in range(max_retries + 1):
             to_retry: List[bytes] = []
@@ -418,6 +471,138 @@ async def async_bulk(
     return success, failed if stats_only else errors
 
 
+async def async_parallel_bulk(
+    client: AsyncElasticsearch,
+    actions: Union[Iterable[_TYPE_BULK_ACTION], AsyncIterable[_TYPE_BULK_ACTION]],
+    thread_count: int = 4,
+    chunk_size: int = 500,
+    max_chunk_bytes: int = 100 * 1024 * 1024,
+    flush_after_seconds: Optional[float] = None,
+    queue_size: int = 4,
+    expand_action_callback: Callable[
+        [_TYPE_BULK_ACTION], _TYPE_BULK_ACTION_HEADER_AND_BODY
+    ] = expand_action,
+    ignore_status: Union[int, Collection[int]] = (),
+    *args: Any,
+    pack_vectors: bool = False,
+    **kwargs: Any,
+) -> AsyncIterable[Tuple[bool, Any]]:
+    """
+    Parallel version of the bulk helper, the chunks are sent by
+    ``thread_count`` tasks at once and the results are yielded in the order
+    the chunks complete.
+
+    :arg client: instance of :class:`~elasticsearch.AsyncElasticsearch` to use
+    :arg actions: iterable or async iterable containing the actions
+    :arg thread_count: number of tasks sending the bulk requests
+    :arg chunk_size: number of docs in one chunk sent to es (default: 500)
+    :arg max_chunk_bytes: the maximum size of the request in bytes (default: 100MB)
+    :arg flush_after_seconds: time in seconds after which a chunk is written even
+        if hasn't reached `chunk_size` or `max_chunk_bytes`. Set to 0 to not use a
+        timeout-based flush. (default: 0)
+    :arg raise_on_error: raise ``BulkIndexError`` containing errors (as `.errors`)
+        from the execution of the last chunk when some occur. By default we raise.
+    :arg raise_on_exception: if ``False`` then don't propagate exceptions from
+        call to ``bulk`` and just report the items that failed as failed.
+    :arg expand_action_callback: callback executed on each action passed in,
+        should return a tuple containing the action line and the data line
+        (`None` if data line should be omitted).
+    :arg queue_size: size of the queue between the task producing chunks to
+        send and the tasks sending them.
+    :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg pack_vectors: pack the float32 numpy arrays of documents with
+        :func:`~elasticsearch.helpers.pack_dense_vector`. Only use it when
+        these arrays are indexed into ``dense_vector`` fields of type ``float``.
+    """
+    client = client.options()
+    client._client_meta = (("h", "bp"),)
+
+    async def map_actions() -> (
+        AsyncIterable[_TYPE_BULK_ACTION_HEADER_WITH_META_AND_BODY]
+    ):
+        async for item in aiter(actions):
+            yield expand_action_callback(item)
+
+    serializer = client._json_serializer("bulk")
+
+    chunk_sender, chunk_receiver = create_memory_object_stream[
+        Tuple[
+            List[
+                Union[
+                    Tuple[_TYPE_BULK_ACTION_HEADER],
+                    Tuple[_TYPE_BULK_ACTION_HEADER, _TYPE_BULK_ACTION_BODY],
+                ]
+            ],
+            List[bytes],
+        ]
+    ](max(queue_size, thread_count))
+    result_sender, result_receiver = create_memory_object_stream[
+        Tuple[List[Tuple[bool, Dict[str, Any]]], Optional[Exception]]
+    ]()
+
+    # The chunks are produced and sent in tasks that aren't tied to a task
+    # group, which would be exited in another task if the caller stops
+    # iterating early. Errors are passed on to the caller through the results.
+    async def send_chunks(
+        sender: MemoryObjectSendStream[
+            Tuple[List[Tuple[bool, Dict[str, Any]]], Optional[Exception]]
+        ],
+    ) -> None:
+        with sender, suppress(BrokenResourceError, ClosedResourceError):
+            try:
+                with chunk_sender:
+                    async for chunk in _chunk_actions(
+                        map_actions(),
+                        chunk_size,
+                        max_chunk_bytes,
+                        flush_after_seconds,
+                        serializer,
+                        pack_vectors,
+                    ):
+                        await chunk_sender.send(chunk)
+            except Exception as e:
+                await sender.send(([], e))
+
+    async def process_chunks(
+        sender: MemoryObjectSendStream[
+            Tuple[List[Tuple[bool, Dict[str, Any]]], Optional[Exception]]
+        ],
+    ) -> None:
+        with sender, suppress(BrokenResourceError, ClosedResourceError):
+            try:
+                async for bulk_data, bulk_actions in chunk_receiver:
+                    results = [
+                        item
+                        async for item in _process_bulk_chunk(
+                            client,
+                            bulk_actions,
+                            bulk_data,
+                            ignore_status=ignore_status,  # type: ignore[misc]
+                            *args,
+                            **kwargs,
+                        )
+                    ]
+                    await sender.send((results, None))
+            except Exception as e:
+                await sender.send(([], e))
+
+    with chunk_receiver, result_receiver:
+        with result_sender:
+            scopes = [_start_task(partial(send_chunks, result_sender.clone()))] + [
+                _start_task(partial(process_chunks, result_sender.clone()))
+                for _ in range(thread_count)
+            ]
+        try:
+            async for results, error in result_receiver:
+                if error is not None:
+                    raise error
+                for item in results:
+                    yield item
+        finally:
+            for scope in scopes:
+                scope.cancel()
+
+
 async def async_scan(
     client: AsyncElasticsearch,
     query: Optional[Any] = None,
@@ -32,7 +32,10 @@ from elastic_transport import (
 )
 from elastic_transport.client_utils import DEFAULT, DefaultType
 
+from ...cache import ResponseCache
 from ...exceptions import ApiError, TransportError
+from ...hedging import HedgingPolicy
+from ...node_selector import NodeRouting, RoutingSelector
 from ...serializer import DEFAULT_SERIALIZERS
 from ._base import (
     BaseClient,
@@ -40,6 +43,7 @@ from ._base import (
     default_sniff_callback,
     resolve_auth_headers,
 )
+from ._batched import BatchedClient
 from .async_search import AsyncSearchClient
 from .autoscaling import AutoscalingClient
 from .cat import CatClient
@@ -88,6 +92,7 @@ from .utils import (
     Stability,
     _availability_warning,
     _quote,
+    _RequestCoalescer,
     _rewrite_parameters,
     client_node_configs,
     is_requests_http_auth,
@@ -187,6 +192,15 @@ class Elasticsearch(BaseClient):
         ] = None,
         meta_header: t.Union[DefaultType, bool] = DEFAULT,
         http_auth: t.Union[DefaultType, t.Any] = DEFAULT,
+        # Client
+        coalesce_requests: bool = False,
+        response_cache: t.Optional[ResponseCache] = None,
+        hedging: t.Optional[HedgingPolicy] = None,
+        node_routing: t.Optional[NodeRouting] = None,
+        body_mimetype: t.Optional[str] = None,
+        endpoint_formats: t.Optional[
+            t.Mapping[str, t.Union[str, t.Sequence[str]]]
+        ] = None,
         # Internal use only
         _transport: t.Optional[Transport] = None,
     ) -> None:
@@ -285,6 +299,18 @@ class Elasticsearch(BaseClient):
                 transport_kwargs["node_pool_class"] = node_pool_class
             if randomize_nodes_in_pool is not DEFAULT:
                 transport_kwargs["randomize_nodes_in_pool"] = randomize_nodes_in_pool
+            if node_routing is not None or hedging is not None:
+                # Hedged requests are routed to another node than the first
+                # request, which needs a 'RoutingSelector' as well.
+                if node_selector_class is DEFAULT:
+                    node_selector_class = RoutingSelector
+                elif node_routing is not None and not issubclass(
+                    node_selector_class, RoutingSelector
+                ):
+                    raise ValueError(
+                        "'node_routing' requires a 'node_selector_class' "
+                        "which is a subclass of 'RoutingSelector'"
+                    )
             if node_selector_class is not DEFAULT:
                 transport_kwargs["node_selector_class"] = node_selector_class
             if dead_node_backoff_factor is not DEFAULT:
@@ -300,7 +326,7 @@ class Elasticsearch(BaseClient):
 
                 # Override compatibility serializers from their non-compat mimetypes too.
                 # So we use the same serializer for requests and responses.
-                for mime_subtype in ("json", "x-ndjson"):
+                for mime_subtype in ("json", "x-ndjson", "cbor"):
                     if f"application/{mime_subtype}" in serializers:
                         compat_mimetype = (
                             f"application/vnd.elasticsearch+{mime_subtype}"
@@ -350,6 +376,15 @@ class Elasticsearch(BaseClient):
 
         self._is_serverless = server_mode == "serverless"
 
+        if coalesce_requests:
+            self._request_coalescer = _RequestCoalescer()
+        self._response_cache = response_cache
+        self._hedging = hedging
+        self._node_routing = node_routing
+        self._check_body_mimetype(body_mimetype)
+        self._body_mimetype = body_mimetype
+        self._set_endpoint_formats(endpoint_formats)
+
         if headers is not DEFAULT and headers is not None:
             self._headers.update(headers)
         if opaque_id is not DEFAULT and opaque_id is not None:  # type: ignore[comparison-overlap]
@@ -446,6 +481,16 @@ class Elasticsearch(BaseClient):
         retry_on_timeout: t.Union[DefaultType, bool] = DEFAULT,
         retry_backoff_base: t.Union[DefaultType, float] = DEFAULT,
         retry_backoff_cap: t.Union[DefaultType, float] = DEFAULT,
+        coalesce_requests: t.Union[DefaultType, bool] = DEFAULT,
+        response_cache: t.Union[DefaultType, None, ResponseCache] = DEFAULT,
+        hedging: t.Union[DefaultType, None, HedgingPolicy] = DEFAULT,
+        node_routing: t.Union[DefaultType, None, NodeRouting] = DEFAULT,
+        stream_response: t.Union[DefaultType, bool] = DEFAULT,
+        lazy_response: t.Union[DefaultType, bool] = DEFAULT,
+        body_mimetype: t.Union[DefaultType, None, str] = DEFAULT,
+        endpoint_formats: t.Union[
+            DefaultType, None, t.Mapping[str, t.Union[str, t.Sequence[str]]]
+        ] = DEFAULT,
     ) -> SelfType:
         client = type(self)(_transport=self.transport)
 
@@ -510,13 +555,84 @@ class Elasticsearch(BaseClient):
         else:
             client._retry_backoff_cap = self._retry_backoff_cap
 
+        # Clients share the in-flight requests of the client they were created
+        # from so that coalescing works across differently configured clients.
+        if coalesce_requests is DEFAULT:
+            client._request_coalescer = self._request_coalescer
+        elif coalesce_requests:
+            client._request_coalescer = self._request_coalescer or _RequestCoalescer()
+        else:
+            client._request_coalescer = None
+
+        if response_cache is not DEFAULT:
+            client._response_cache = response_cache
+        else:
+            client._response_cache = self._response_cache
+
+        if hedging is not DEFAULT:
+            client._hedging = hedging
+        else:
+            client._hedging = self._hedging
+        client._request_hedger = self._request_hedger
+
+        if node_routing is not DEFAULT:
+            if node_routing is not None and client._routing_selector is None:
+                raise ValueError(
+                    "'node_routing' requires a 'node_selector_class' "
+                    "which is a subclass of 'RoutingSelector'"
+                )
+            client._node_routing = node_routing
+        else:
+            client._node_routing = self._node_routing
+
+        if stream_response is not DEFAULT:
+            if not isinstance(stream_response, bool):
+                raise TypeError("'stream_response' must be of type 'bool'")
+            client._stream_response = stream_response
+        else:
+            client._stream_response = self._stream_response
+
+        if lazy_response is not DEFAULT:
+            if not isinstance(lazy_response, bool):
+                raise TypeError("'lazy_response' must be of type 'bool'")
+            client._lazy_response = lazy_response
+        else:
+            client._lazy_response = self._lazy_response
+
+        if body_mimetype is not DEFAULT:
+            client._check_body_mimetype(body_mimetype)
+            client._body_mimetype = body_mimetype
+        else:
+            client._body_mimetype = self._body_mimetype
+
+        if endpoint_formats is not DEFAULT:
+            client._set_endpoint_formats(endpoint_formats)
+        else:
+            client._endpoint_formats = self._endpoint_formats
+
         client._is_serverless = self._is_serverless
 
         return client
 
+    def batched(
+        self, *, max_delay: float = 0.002, max_batch: int = 500
+    ) -> BatchedClient:
+        """Returns a client which sends single document ``get()`` and ``index()``
+        calls made concurrently as a single ``mget`` or ``bulk`` request. Calls
+        wait up to ``max_delay`` seconds for other calls to join their batch,
+        a batch is sent early once it contains ``max_batch`` documents.
+
+        Calls are only batched together when made with the same batched client.
+
+        :arg max_delay: Number of seconds a call waits for other calls.
+        :arg max_batch: Maximum number of documents sent in a single request.
+        """
+        return BatchedClient(self, max_delay=max_delay, max_batch=max_batch)
+
     def close(self) -> None:
         """Closes the Transport and all internal connections"""
         self.transport.close()
+        self._request_hedger.close()
 
     @_rewrite_parameters()
     def ping(
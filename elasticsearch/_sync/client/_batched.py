@@ -0,0 +1,257 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import dataclasses
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from elastic_transport import ApiResponseMeta, ObjectApiResponse
+from elastic_transport.client_utils import DEFAULT
+
+from ...exceptions import HTTP_EXCEPTIONS, ApiError
+from .utils import _MicroBatcher
+
+if TYPE_CHECKING:
+    from . import Elasticsearch
+
+# Status of an error returned for a single document of a multi get request.
+# Elasticsearch doesn't include the status so it's derived from the error type,
+# using the status a single get request fails with. Other errors are raised as
+# an ``ApiError`` with the status of the multi get response.
+_MGET_ERROR_STATUS = {
+    "action_request_validation_exception": 400,
+    "illegal_argument_exception": 400,
+    "invalid_index_name_exception": 400,
+    "routing_missing_exception": 400,
+    "security_exception": 403,
+    "index_not_found_exception": 404,
+    "version_conflict_engine_exception": 409,
+    "es_rejected_execution_exception": 429,
+    "no_shard_available_action_exception": 503,
+}
+
+_BatchItemResult = Tuple[Dict[str, Any], Optional[int], ApiResponseMeta]
+
+
+class BatchedClient:
+    """Sends single document ``get()`` and ``index()`` calls made concurrently
+    as a single multi get (``mget``) or ``bulk`` request.
+
+    The first call of a batch waits up to ``max_delay`` seconds for other
+    calls to join it. A batch is sent early once ``max_batch`` calls are
+    collected. Each caller receives its own document as if it made a
+    single document request, including raising the same errors.
+
+    Use :meth:`~elasticsearch.Elasticsearch.batched` to create a batched
+    client, any other API is sent directly by the wrapped client. The
+    ``get()`` and ``index()`` methods take the same parameters as the
+    methods of the client.
+
+    .. code-block:: python
+
+        batched_client = client.batched(max_delay=0.002, max_batch=500)
+    """
+
+    def __init__(
+        self, client: "Elasticsearch", max_delay: float, max_batch: int
+    ) -> None:
+        if max_delay < 0:
+            raise ValueError("'max_delay' must be zero or greater")
+        if max_batch < 1:
+            raise ValueError("'max_batch' must be one or greater")
+        self._client = client
+        self._batcher = _MicroBatcher(max_delay=max_delay, max_batch=max_batch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def get(
+        self,
+        *,
+        index: str,
+        id: str,
+        preference: Optional[str] = None,
+        realtime: Optional[bool] = None,
+        refresh: Optional[bool] = None,
+        routing: Optional[str] = None,
+        source: Optional[Union[bool, str, Sequence[str]]] = None,
+        source_excludes: Optional[Union[str, Sequence[str]]] = None,
+        source_includes: Optional[Union[str, Sequence[str]]] = None,
+        stored_fields: Optional[Union[str, Sequence[str]]] = None,
+        version: Optional[int] = None,
+        version_type: Optional[
+            Union[str, Literal["external", "external_gte", "internal"]]
+        ] = None,
+    ) -> ObjectApiResponse[Any]:
+        """Get a document by its ID, see :meth:`~elasticsearch.Elasticsearch.get`"""
+        doc: Dict[str, Any] = {"_index": index, "_id": id}
+        if routing is not None:
+            doc["routing"] = routing
+        if source_excludes is not None or source_includes is not None:
+            doc["_source"] = {}
+            if source_includes is not None:
+                doc["_source"]["includes"] = source_includes
+            if source_excludes is not None:
+                doc["_source"]["excludes"] = source_excludes
+        elif source is not None:
+            doc["_source"] = source
+        if stored_fields is not None:
+            doc["stored_fields"] = stored_fields
+        if version is not None:
+            doc["version"] = version
+        if version_type is not None:
+            doc["version_type"] = version_type
+
+        def send(docs: List[Dict[str, Any]]) -> List[_BatchItemResult]:
+            resp = self._client.mget(
+                docs=docs, preference=preference, realtime=realtime, refresh=refresh
+            )
+            results = []
+            for item in resp.body["docs"]:
+                if "error" in item:
+                    status = _MGET_ERROR_STATUS.get(item["error"].get("type"))
+                    error: Dict[str, Any] = {"error": item["error"]}
+                    if status is not None:
+                        error["status"] = status
+                    results.append((error, status, resp.meta))
+                else:
+                    results.append((item, 200 if item.get("found") else 404, resp.meta))
+            return results
+
+        body, status, meta = self._batcher.submit(
+            ("mget", preference, realtime, refresh), doc, send
+        )
+        return self._item_response(body, status, meta)
+
+    def index(
+        self,
+        *,
+        index: str,
+        document: Optional[Mapping[str, Any]] = None,
+        body: Optional[Mapping[str, Any]] = None,
+        id: Optional[str] = None,
+        if_primary_term: Optional[int] = None,
+        if_seq_no: Optional[int] = None,
+        op_type: Optional[Union[str, Literal["create", "index"]]] = None,
+        pipeline: Optional[str] = None,
+        refresh: Optional[
+            Union[bool, str, Literal["false", "true", "wait_for"]]
+        ] = None,
+        require_alias: Optional[bool] = None,
+        require_data_stream: Optional[bool] = None,
+        routing: Optional[str] = None,
+        timeout: Optional[str] = None,
+        version: Optional[int] = None,
+        version_type: Optional[
+            Union[str, Literal["external", "external_gte", "internal"]]
+        ] = None,
+        wait_for_active_shards: Optional[
+            Union[int, Union[str, Literal["all", "index-setting"]]]
+        ] = None,
+    ) -> ObjectApiResponse[Any]:
+        """Create or update a document in an index, see
+        :meth:`~elasticsearch.Elasticsearch.index`
+        """
+        if document is None and body is None:
+            raise ValueError(
+                "Empty value passed for parameters 'document' and 'body', one of them should be set."
+            )
+        elif document is not None and body is not None:
+            raise ValueError("Cannot set both 'document' and 'body'")
+        action: Dict[str, Any] = {"_index": index}
+        if id is not None:
+            action["_id"] = id
+        if if_primary_term is not None:
+            action["if_primary_term"] = if_primary_term
+        if if_seq_no is not None:
+            action["if_seq_no"] = if_seq_no
+        if pipeline is not None:
+            action["pipeline"] = pipeline
+        if require_alias is not None:
+            action["require_alias"] = require_alias
+        if routing is not None:
+            action["routing"] = routing
+        if version is not None:
+            action["version"] = version
+        if version_type is not None:
+            action["version_type"] = version_type
+        op = {(op_type or "index"): action}
+
+        def send(
+            items: List[Tuple[Dict[str, Any], Mapping[str, Any]]],
+        ) -> List[_BatchItemResult]:
+            operations: List[Mapping[str, Any]] = []
+            for item in items:
+                operations.extend(item)
+            resp = self._client.bulk(
+                operations=operations,
+                refresh=refresh,
+                require_data_stream=require_data_stream,
+                timeout=timeout,
+                wait_for_active_shards=wait_for_active_shards,
+            )
+            results = []
+            for item in resp.body["items"]:
+                ((_, result),) = item.items()
+                status = result.pop("status")
+                if "error" in result:
+                    result = {"error": result["error"], "status": status}
+                results.append((result, status, resp.meta))
+            return results
+
+        result, status, meta = self._batcher.submit(
+            ("bulk", refresh, require_data_stream, timeout, wait_for_active_shards),
+            (op, document if document is not None else body),
+            send,
+        )
+        return self._item_response(result, status, meta)
+
+    def _item_response(
+        self, body: Dict[str, Any], status: Optional[int], meta: ApiResponseMeta
+    ) -> ObjectApiResponse[Any]:
+        if status is not None:
+            meta = dataclasses.replace(meta, status=status)
+        ignore_status = self._client._ignore_status
+        if status is None or (
+            not 200 <= status <= 299
+            and (
+                ignore_status is DEFAULT
+                or ignore_status is None
+                or status not in ignore_status
+            )
+        ):
+            message: Any = str(body)
+            error = body.get("error")
+            if error is not None:
+                message = error
+                if isinstance(error, dict) and "type" in error:
+                    message = error["type"]
+            error_class = (
+                ApiError if status is None else HTTP_EXCEPTIONS.get(status, ApiError)
+            )
+            raise error_class(message=message, meta=meta, body=body)
+        return ObjectApiResponse(body=body, meta=meta)
@@ -16,9 +16,12 @@
 #  under the License.
 
 import base64
+import contextvars
 import inspect
+import threading
 import urllib.parse
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import date, datetime
 from enum import Enum, auto
 from functools import wraps
@@ -29,6 +32,7 @@ from typing import (
     Callable,
     Collection,
     Dict,
+    Hashable,
     List,
     Mapping,
     Optional,
@@ -44,6 +48,7 @@ from elastic_transport import (
     AsyncTransport,
     HttpHeaders,
     NodeConfig,
+    OpenTelemetrySpan,
     RequestsHttpNode,
     SniffOptions,
     Transport,
@@ -57,6 +62,7 @@ from elastic_transport.client_utils import (
 )
 
 from ..._version import __versionstr__
+from ...cache import ResponseCache
 from ...compat import to_bytes, to_str, warn_stacklevel
 from ...exceptions import GeneralAvailabilityWarning
 
@@ -106,6 +112,7 @@ _TRANSPORT_OPTIONS = {
 }
 
 F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
 
 
 def client_node_configs(
@@ -263,6 +270,221 @@ def _quote_query(query: Mapping[str, Any]) -> str:
     return "&".join([f"{k}={_quote(v)}" for k, v in query.items()])
 
 
+def _call_response_cache(
+    response_cache: ResponseCache, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Calls a method of the response cache. The async client calls
+    stores doing blocking IO from a worker thread instead.
+    """
+    return func(*args, **kwargs)
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """Copies an error shared by several callers so each raises its own
+    instance, raising a single instance from several threads or tasks
+    would mix up its traceback and context.
+    """
+    copied = type(error).__new__(type(error), *error.args)
+    copied.__dict__.update(error.__dict__)
+    return copied
+
+
+class _InflightRequest:
+    """State of a request shared by every caller waiting on it"""
+
+    def __init__(self, event: Any, otel_span: Optional[OpenTelemetrySpan]) -> None:
+        self.event = event
+        self.otel_span = otel_span
+        self.done = False
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def follow(self, otel_span: Optional[OpenTelemetrySpan]) -> Any:
+        """Returns the result of the finished request to a waiting caller.
+        The span of the caller is linked to the span of the request and the
+        caller raises its own copy of the error.
+        """
+        if (
+            otel_span is not None
+            and otel_span.otel_span is not None
+            and self.otel_span is not None
+            and self.otel_span.otel_span is not None
+        ):
+            otel_span.otel_span.add_link(self.otel_span.otel_span.get_span_context())
+        if self.error is not None:
+            raise _copy_error(self.error) from self.error
+        return self.result
+
+
+class _RequestCoalescer:
+    """Shares a single in-flight call between concurrent threads
+    that ask for the same key ('single-flight'). Callers that arrive
+    while a request is in-flight wait for it and receive the same
+    response object or a copy of the exception instead of sending
+    their own request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, _InflightRequest] = {}
+
+    def call(
+        self,
+        key: Hashable,
+        func: Callable[[], T],
+        otel_span: Optional[OpenTelemetrySpan] = None,
+    ) -> T:
+        while True:
+            with self._lock:
+                inflight = self._inflight.get(key)
+                if inflight is None:
+                    inflight = _InflightRequest(threading.Event(), otel_span)
+                    self._inflight[key] = inflight
+                    is_leader = True
+                else:
+                    is_leader = False
+
+            if is_leader:
+                try:
+                    inflight.result = func()
+                    inflight.done = True
+                    return inflight.result  # type: ignore[no-any-return]
+                except Exception as e:
+                    inflight.error = e
+                    inflight.done = True
+                    raise
+                finally:
+                    with self._lock:
+                        del self._inflight[key]
+                    inflight.event.set()
+
+            inflight.event.wait()
+            # If the leading call was interrupted without a result
+            # (ie KeyboardInterrupt) we start over with a new request.
+            if inflight.done:
+                return inflight.follow(otel_span)  # type: ignore[no-any-return]
+
+
+class _PendingBatch:
+    """Items collected for a single batched request"""
+
+    def __init__(self, ready: Any, done: Any) -> None:
+        self.ready = ready
+        self.done = done
+        self.items: List[Any] = []
+        self.results: Optional[Sequence[Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class _MicroBatcher:
+    """Collects items submitted by concurrent threads into batches
+    that are sent together. The first caller of a batch waits up to
+    ``max_delay`` seconds (or until ``max_batch`` items are collected)
+    and sends the batch, every caller then receives the result at the
+    position of its own item or the exception raised while sending.
+    """
+
+    def __init__(self, max_delay: float, max_batch: int) -> None:
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+
+    def submit(
+        self,
+        key: Hashable,
+        item: Any,
+        send: Callable[[List[Any]], Sequence[T]],
+    ) -> T:
+        while True:
+            with self._lock:
+                batch = self._pending.get(key)
+                is_leader = batch is None
+                if batch is None:
+                    batch = _PendingBatch(threading.Event(), threading.Event())
+                    self._pending[key] = batch
+                position = len(batch.items)
+                batch.items.append(item)
+                if len(batch.items) >= self.max_batch:
+                    del self._pending[key]
+                    batch.ready.set()
+
+            if is_leader:
+                try:
+                    batch.ready.wait(self.max_delay)
+                    self._close(key, batch)
+                    batch.results = send(batch.items)
+                except Exception as e:
+                    batch.error = e
+                    raise
+                finally:
+                    self._close(key, batch)
+                    batch.done.set()
+                return batch.results[position]
+
+            batch.done.wait()
+            if batch.error is not None:
+                raise _copy_error(batch.error) from batch.error
+            # If the leading call was interrupted before sending
+            # the batch (ie KeyboardInterrupt) the item is resubmitted.
+            if batch.results is not None:
+                return batch.results[position]  # type: ignore[no-any-return]
+
+    def _close(self, key: Hashable, batch: _PendingBatch) -> None:
+        # Items submitted from now on are collected into a new batch.
+        with self._lock:
+            if self._pending.get(key) is batch:
+                del self._pending[key]
+
+
+class _RequestHedger:
+    """Calls a function in a thread pool and calls it a second time
+    if the first call hasn't completed within a delay. The first
+    successful result is returned. Running threads can't be cancelled
+    so the result of the slower call is discarded.
+    """
+
+    # Both calls of every hedged request run in the pool, threads
+    # are only started when there's no idle thread to reuse.
+    _max_workers = 128
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def call(self, func: Callable[[], T], delay: float) -> T:
+        executor = self._get_executor()
+        futures = [executor.submit(contextvars.copy_context().run, func)]
+        if not wait(futures, timeout=delay).done:
+            futures.append(executor.submit(contextvars.copy_context().run, func))
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in futures:
+                if future in done and future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+        # Both calls failed, the error of the first call is raised.
+        return futures[0].result()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="elasticsearch-hedging",
+                )
+            return self._executor
+
+
 def _merge_kwargs_no_duplicates(kwargs: Dict[str, Any], values: Dict[str, Any]) -> None:
     for key, val in values.items():
         if key in kwargs:
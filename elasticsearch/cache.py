@@ -0,0 +1,332 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import copy
+import dataclasses
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Hashable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from elastic_transport import ApiResponse
+
+__all__ = [
+    "DEFAULT_CACHED_ENDPOINTS",
+    "CacheEntry",
+    "CacheStore",
+    "FileCacheStore",
+    "InMemoryCacheStore",
+    "ResponseCache",
+]
+
+# Read endpoints whose responses are cached by default.
+DEFAULT_CACHED_ENDPOINTS = frozenset(
+    (
+        "cluster.state",
+        "count",
+        "get",
+        "indices.get_mapping",
+        "mget",
+        "search",
+    )
+)
+
+
+class CacheEntry(NamedTuple):
+    #: Time (as given by 'time.time()') after which the entry is stale.
+    expires_at: float
+    #: Index names or patterns the request targeted. An empty
+    #: tuple means the request wasn't restricted to any index.
+    indices: Tuple[str, ...]
+    response: ApiResponse[Any]
+
+
+class CacheStore:
+    """Storage used by :class:`~elasticsearch.cache.ResponseCache`"""
+
+    #: Set by stores doing blocking IO, the async client
+    #: then accesses them from a worker thread.
+    blocking: bool = False
+
+    def get(self, key: str) -> Optional[CacheEntry]:  # pragma: nocover
+        raise NotImplementedError()
+
+    def put(self, key: str, entry: CacheEntry) -> None:  # pragma: nocover
+        raise NotImplementedError()
+
+    def delete_matching(
+        self, predicate: Callable[[CacheEntry], bool]
+    ) -> None:  # pragma: nocover
+        raise NotImplementedError()
+
+    def clear(self) -> None:  # pragma: nocover
+        raise NotImplementedError()
+
+
+class InMemoryCacheStore(CacheStore):
+    """Stores responses in-process, evicting the least
+    recently used entries once ``max_size`` is reached.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete_matching(self, predicate: Callable[[CacheEntry], bool]) -> None:
+        with self._lock:
+            for key in [
+                key for key, entry in self._entries.items() if predicate(entry)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileCacheStore(CacheStore):
+    """Stores responses as files in a local directory so they can be shared
+    between worker processes on the same host. Entries are written atomically
+    and the least recently used entries are removed once ``max_size`` is reached.
+
+    Entries are stored using :mod:`pickle` so the directory must only be
+    writable by trusted processes.
+    """
+
+    blocking = True
+
+    _suffix = ".cache"
+
+    def __init__(self, path: str, max_size: int = 1024) -> None:
+        self.path = path
+        self.max_size = max_size
+        os.makedirs(path, exist_ok=True)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        filepath = self._filepath(key)
+        try:
+            with open(filepath, "rb") as f:
+                entry: CacheEntry = pickle.load(f)
+            # The modification time is used for least recently used eviction.
+            os.utime(filepath)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        entry = entry._replace(response=_picklable_response(entry.response))
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._filepath(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._evict()
+
+    def delete_matching(self, predicate: Callable[[CacheEntry], bool]) -> None:
+        for filepath in self._filepaths():
+            try:
+                with open(filepath, "rb") as f:
+                    entry = pickle.load(f)
+                if predicate(entry):
+                    os.unlink(filepath)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                continue
+
+    def clear(self) -> None:
+        for filepath in self._filepaths():
+            try:
+                os.unlink(filepath)
+            except OSError:
+                continue
+
+    def _filepath(self, key: str) -> str:
+        return os.path.join(self.path, key + self._suffix)
+
+    def _filepaths(self) -> Tuple[str, ...]:
+        return tuple(
+            os.path.join(self.path, filename)
+            for filename in os.listdir(self.path)
+            if filename.endswith(self._suffix)
+        )
+
+    def _evict(self) -> None:
+        filepaths = self._filepaths()
+        if len(filepaths) <= self.max_size:
+            return
+        by_last_use = []
+        for filepath in filepaths:
+            try:
+                by_last_use.append((os.stat(filepath).st_mtime, filepath))
+            except OSError:
+                continue
+        by_last_use.sort()
+        for _, filepath in by_last_use[: len(by_last_use) - self.max_size]:
+            try:
+                os.unlink(filepath)
+            except OSError:
+                continue
+
+
+def _picklable_response(response: ApiResponse[Any]) -> ApiResponse[Any]:
+    # The 'NodeConfig' of the response may hold objects which can't be
+    # pickled like an 'SSLContext' or a custom 'requests' auth object.
+    node = response.meta.node
+    if node is None or (node.ssl_context is None and not node._extras):
+        return response
+    body, meta = response.__getstate__()
+    response = copy.copy(response)
+    response.__setstate__(
+        (
+            body,
+            dataclasses.replace(meta, node=node.replace(ssl_context=None, _extras={})),
+        )
+    )
+    return response
+
+
+class ResponseCache:
+    """Client-side cache of responses from read endpoints.
+
+    Pass an instance to the ``response_cache`` parameter of
+    :class:`~elasticsearch.Elasticsearch` or
+    :meth:`~elasticsearch.Elasticsearch.options` to cache successful
+    responses of the given endpoints for ``ttl`` seconds. Requests
+    are only served from the cache when the method, path, query
+    parameters, headers and body are all equal.
+
+    Cached response objects are shared between callers and
+    must not be modified.
+
+    :arg ttl: Number of seconds a response is served from the cache.
+    :arg endpoints: Endpoint IDs (ie ``search`` or ``indices.get_mapping``)
+        whose responses are cached. Defaults to ``get``, ``mget``, ``search``,
+        ``count``, ``indices.get_mapping`` and ``cluster.state``.
+    :arg max_size: Maximum number of responses kept in the default
+        in-process store. Ignored if ``store`` is given.
+    :arg store: :class:`~elasticsearch.cache.CacheStore` holding the cached
+        responses, defaults to an :class:`~elasticsearch.cache.InMemoryCacheStore`.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        endpoints: Collection[str] = DEFAULT_CACHED_ENDPOINTS,
+        max_size: int = 1024,
+        store: Optional[CacheStore] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.endpoints = frozenset(endpoints)
+        self.store = store if store is not None else InMemoryCacheStore(max_size)
+
+    def is_cached_endpoint(self, endpoint_id: Optional[str]) -> bool:
+        return endpoint_id in self.endpoints
+
+    def get(self, key: Hashable) -> Optional[ApiResponse[Any]]:
+        entry = self.store.get(self._store_key(key))
+        if entry is None or entry.expires_at <= time.time():
+            return None
+        return entry.response
+
+    def put(
+        self,
+        key: Hashable,
+        response: ApiResponse[Any],
+        path_parts: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        if not 200 <= response.meta.status < 300:
+            return
+        indices: Tuple[str, ...] = ()
+        if path_parts and path_parts.get("index"):
+            indices = tuple(
+                urllib.parse.unquote(index)
+                for index in str(path_parts["index"]).split(",")
+            )
+        self.store.put(
+            self._store_key(key),
+            CacheEntry(
+                expires_at=time.time() + self.ttl, indices=indices, response=response
+            ),
+        )
+
+    def invalidate(self, index: Union[str, Collection[str]]) -> None:
+        """Removes all cached responses which may contain data from the given
+        indices. Responses of requests that weren't restricted to an index
+        or that used a wildcard matching the index are removed as well.
+        Aliases aren't resolved so invalidate the names used in requests.
+
+        :arg index: Name of the index or list of index names to invalidate.
+        """
+        invalidated = (index,) if isinstance(index, str) else tuple(index)
+
+        def predicate(entry: CacheEntry) -> bool:
+            if not entry.indices:
+                return True
+            return any(
+                cached == "_all" or fnmatchcase(name, cached)
+                for cached in entry.indices
+                for name in invalidated
+            )
+
+        self.store.delete_matching(predicate)
+
+    def clear(self) -> None:
+        """Removes all cached responses"""
+        self.store.clear()
+
+    @staticmethod
+    def _store_key(key: Hashable) -> str:
+        return hashlib.sha256(repr(key).encode("utf-8", "surrogatepass")).hexdigest()
@@ -109,11 +109,14 @@ from .mapping import AsyncMapping, Mapping
 from .query import Q, Query
 from .response import AggResponse, Response, UpdateByQueryResponse
 from .search import (
+    AsyncCompiledSearch,
     AsyncEmptySearch,
     AsyncMultiSearch,
     AsyncSearch,
+    CompiledSearch,
     EmptySearch,
     MultiSearch,
+    Placeholder,
     Search,
 )
 from .update_by_query import AsyncUpdateByQuery, UpdateByQuery
@@ -126,6 +129,7 @@ __all__ = [
     "AggResponse",
     "AggregateMetricDouble",
     "Alias",
+    "AsyncCompiledSearch",
     "AsyncComposableIndexTemplate",
     "AsyncDocument",
     "AsyncEmptySearch",
@@ -141,6 +145,7 @@ __all__ = [
     "Binary",
     "Boolean",
     "Byte",
+    "CompiledSearch",
     "Completion",
     "ComposableIndexTemplate",
     "ConstantKeyword",
@@ -196,6 +201,7 @@ __all__ = [
     "Object",
     "Passthrough",
     "Percolator",
+    "Placeholder",
     "Point",
     "Q",
     "Query",
@@ -16,12 +16,14 @@
 #  under the License.
 
 import collections.abc
+import contextlib
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterable,
     AsyncIterator,
     Dict,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -31,9 +33,9 @@ from typing import (
 
 from typing_extensions import Self, dataclass_transform
 
-from ...exceptions import NotFoundError, RequestError
-from ...helpers import async_bulk
+from ...helpers import async_bulk, async_parallel_bulk, async_streaming_bulk
 from .._async.index import AsyncIndex
+from .._concurrency import _async_concurrent_map
 from ..async_connections import get_connection
 from ..document_base import DocumentBase, DocumentMeta, mapped_field
 from ..exceptions import IllegalOperation
@@ -216,41 +218,59 @@ class AsyncDocument(DocumentBase, metaclass=AsyncIndexMeta):
             ]
         }
         results = await es.mget(index=cls._default_index(index), body=body, **kwargs)
+        return cls._from_mget(results, raise_on_error, missing)
 
-        objs: List[Optional[Self]] = []
-        error_docs: List[Self] = []
-        missing_docs: List[Self] = []
-        for doc in results["docs"]:
-            if doc.get("found"):
-                if error_docs or missing_docs:
-                    # We're going to raise an exception anyway, so avoid an
-                    # expensive call to cls.from_es().
-                    continue
-
-                objs.append(cls.from_es(doc))
-
-            elif doc.get("error"):
-                if raise_on_error:
-                    error_docs.append(doc)
-                if missing == "none":
-                    objs.append(None)
-
-            # The doc didn't cause an error, but the doc also wasn't found.
-            elif missing == "raise":
-                missing_docs.append(doc)
-            elif missing == "none":
-                objs.append(None)
-
-        if error_docs:
-            error_ids = [doc["_id"] for doc in error_docs]
-            message = "Required routing not provided for documents %s."
-            message %= ", ".join(error_ids)
-            raise RequestError(400, message, error_docs)  # type: ignore[arg-type]
-        if missing_docs:
-            missing_ids = [doc["_id"] for doc in missing_docs]
-            message = f"Documents {', '.join(missing_ids)} not found."
-            raise NotFoundError(404, message, {"docs": missing_docs})  # type: ignore[arg-type]
-        return objs
+    @classmethod
+    async def get_many(
+        cls,
+        docs: Iterable[Any],
+        using: Optional[AsyncUsingType] = None,
+        index: Optional[str] = None,
+        raise_on_error: bool = True,
+        missing: str = "none",
+        chunk_size: int = 1000,
+        max_concurrent_chunks: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[Optional[Self]]:
+        r"""
+        Retrieve documents by their ``id``\s with ``mget`` requests of at most
+        ``chunk_size`` documents and yield the instances as the requests
+        complete. Takes the same arguments as :meth:`mget`, ``docs`` can be
+        any iterable. A generator that isn't exhausted should be closed
+        explicitly by the code iterating it, which stops the requests running
+        ahead of the consumer.
+
+        :arg chunk_size: maximum number of documents requested at once
+        :arg max_concurrent_chunks: number of requests sent concurrently, at
+            most this many chunks are requested ahead of the consumer
+        :arg ordered: yield the documents in the order they were requested,
+            otherwise in the order the requests complete
+
+        An error or a missing document with ``missing='raise'`` is raised when
+        the request of its chunk completes, after the documents of the
+        previous chunks have been yielded.
+        """
+        if missing not in ("raise", "skip", "none"):
+            raise ValueError("'missing' must be 'raise', 'skip', or 'none'.")
+        es = cls._get_connection(using)
+        index = cls._default_index(index)
+
+        async def mget(body: Dict[str, Any]) -> List[Any]:
+            results = await es.mget(index=index, body=body, **kwargs)
+            return cls._from_mget(results, raise_on_error, missing)
+
+        async with contextlib.aclosing(
+            _async_concurrent_map(
+                mget,
+                cls._mget_bodies(docs, chunk_size),
+                max_concurrent_chunks,
+                ordered,
+            )
+        ) as chunks:
+            async for objs in chunks:
+                for obj in objs:
+                    yield obj
 
     async def delete(
         self,
@@ -461,7 +481,7 @@ class AsyncDocument(DocumentBase, metaclass=AsyncIndexMeta):
         actions: AsyncIterable[Union[Self, Dict[str, Any]]],
         using: Optional[AsyncUsingType] = None,
         index: Optional[str] = None,
-        validate: bool = True,
+        validate: Union[bool, int] = True,
         skip_empty: bool = True,
         **kwargs: Any,
     ) -> Tuple[int, Union[int, List[Any]]]:
@@ -473,7 +493,8 @@ class AsyncDocument(DocumentBase, metaclass=AsyncIndexMeta):
         :arg using: connection alias to use, defaults to ``'default'``
         :arg index: Elasticsearch index to use, if the ``Document`` is
             associated with an index this can be omitted.
-        :arg validate: set to ``False`` to skip validating the documents
+        :arg validate: set to ``False`` to skip validating the documents or to
+            a number ``N`` to validate one in ``N`` documents
         :arg skip_empty: if set to ``False`` will cause empty values (``None``,
             ``[]``, ``{}``) to be left on the document. Those values will be
             stripped out otherwise as they make no difference in Elasticsearch.
@@ -488,40 +509,75 @@ class AsyncDocument(DocumentBase, metaclass=AsyncIndexMeta):
         i = cls._default_index(index)
         assert i is not None
 
-        class Generate:
-            def __init__(
-                self,
-                doc_iterator: AsyncIterable[Union[AsyncDocument, Dict[str, Any]]],
-            ):
-                self.doc_iterator = doc_iterator.__aiter__()
+        return await async_bulk(
+            es,
+            actions,  # type: ignore[arg-type]
+            index=i,
+            expand_action_callback=cls._bulk_expander(validate, skip_empty),
+            **kwargs,
+        )
+
+    @classmethod
+    async def streaming_bulk(
+        cls,
+        actions: AsyncIterable[Union[Self, Dict[str, Any]]],
+        using: Optional[AsyncUsingType] = None,
+        index: Optional[str] = None,
+        validate: Union[bool, int] = True,
+        skip_empty: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[Tuple[bool, Dict[str, Any]]]:
+        """
+        Perform multiple indexing operations in chunks and yield the result of
+        each operation. Takes the same arguments as :meth:`bulk`, any
+        additional keyword arguments are passed to
+        ``helpers.streaming_bulk`` unchanged.
+
+        :arg validate: ``True`` to validate every document, ``False`` to skip
+            validation or a number ``N`` to validate one in ``N`` documents
+        """
+        es = cls._get_connection(using)
 
-            def __aiter__(self) -> Self:
-                return self
+        async for ok, item in async_streaming_bulk(
+            es,
+            actions,  # type: ignore[arg-type]
+            index=cls._default_index(index),
+            expand_action_callback=cls._bulk_expander(validate, skip_empty),
+            **kwargs,
+        ):
+            yield ok, item
 
-            async def __anext__(self) -> Dict[str, Any]:
-                doc: Optional[Union[AsyncDocument, Dict[str, Any]]] = (
-                    await self.doc_iterator.__anext__()
-                )
+    @classmethod
+    async def parallel_bulk(
+        cls,
+        actions: AsyncIterable[Union[Self, Dict[str, Any]]],
+        using: Optional[AsyncUsingType] = None,
+        index: Optional[str] = None,
+        validate: Union[bool, int] = True,
+        skip_empty: bool = True,
+        thread_count: int = 4,
+        **kwargs: Any,
+    ) -> AsyncIterator[Tuple[bool, Any]]:
+        """
+        Perform multiple indexing operations in chunks sent concurrently and
+        yield the result of each operation. Takes the same arguments as
+        :meth:`streaming_bulk`, any additional keyword arguments are passed
+        to ``helpers.parallel_bulk`` unchanged.
 
-                if isinstance(doc, dict):
-                    action = doc
-                    doc = None
-                    if "_source" in action and isinstance(
-                        action["_source"], AsyncDocument
-                    ):
-                        doc = action["_source"]
-                        if validate:  # pragma: no cover
-                            doc.full_clean()
-                        action["_source"] = doc.to_dict(
-                            include_meta=False, skip_empty=skip_empty
-                        )
-                elif doc is not None:
-                    if validate:  # pragma: no cover
-                        doc.full_clean()
-                    action = doc.to_dict(include_meta=True, skip_empty=skip_empty)
-                return action
-
-        return await async_bulk(es, Generate(actions), index=i, **kwargs)
+        :arg thread_count: number of chunks sent concurrently, by threads
+            with ``Document`` and by tasks with ``AsyncDocument``
+        """
+        es = cls._get_connection(using)
+
+        async for ok, item in async_parallel_bulk(
+            es,
+            actions,  # type: ignore[arg-type]
+            thread_count=thread_count,
+            index=cls._default_index(index),
+            expand_action_callback=cls._bulk_expander(validate, skip_empty),
+            **kwargs,
+        ):
+            yield ok, item
 
     @classmethod
     async def esql_execute(
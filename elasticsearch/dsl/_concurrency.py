@@ -0,0 +1,280 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import suppress
+from itertools import islice
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+
+
+def _concurrent_map(
+    func: Callable[[_T], _U],
+    items: Iterable[_T],
+    concurrency: int,
+    ordered: bool,
+) -> Generator[_U, None, None]:
+    """
+    Call ``func`` for the items in threads, ``concurrency`` of them ahead of
+    the consumer, and yield the results in the order of the items or as they
+    complete.
+    """
+    if concurrency <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    pending = iter(items)
+    futures: List["Future[_U]"] = []
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def fill() -> None:
+        for item in islice(pending, concurrency - len(futures)):
+            futures.append(executor.submit(func, item))
+
+    try:
+        fill()
+        while futures:
+            if ordered:
+                future = futures[0]
+            else:
+                wait(futures, return_when=FIRST_COMPLETED)
+                future = next(f for f in futures if f.done())
+            futures.remove(future)
+            result = future.result()
+            fill()
+            yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _async_concurrent_map(
+    func: Callable[[_T], Awaitable[_U]],
+    items: Iterable[_T],
+    concurrency: int,
+    ordered: bool,
+) -> AsyncGenerator[_U, None]:
+    """
+    Call ``func`` for the items in tasks, ``concurrency`` of them ahead of
+    the consumer, and yield the results in the order of the items or as they
+    complete.
+
+    The tasks run in a task group of the task iterating the generator, which
+    has to close the generator when it stops iterating early.
+    """
+    if concurrency <= 1:
+        for item in items:
+            yield await func(item)
+        return
+
+    import anyio
+
+    pending = enumerate(items)
+    sender, receiver = anyio.create_memory_object_stream[
+        Tuple[int, Optional[_U], Optional[Exception]]
+    ](concurrency)
+    running: Set[int] = set()
+    results: Dict[int, _U] = {}
+    errors: List[Exception] = []
+
+    async def run(i: int, item: _T) -> None:
+        result: Tuple[int, Optional[_U], Optional[Exception]]
+        try:
+            result = (i, await func(item), None)
+        except Exception as e:
+            result = (i, None, e)
+        with suppress(anyio.BrokenResourceError, anyio.ClosedResourceError):
+            sender.send_nowait(result)
+
+    with sender, receiver:
+        async with anyio.create_task_group() as tg:
+
+            def fill() -> None:
+                for i, item in islice(
+                    pending, concurrency - len(running) - len(results)
+                ):
+                    running.add(i)
+                    tg.start_soon(run, i, item)
+
+            # Errors are raised once the task group is exited, and closing
+            # the generator stops the iteration, so that neither of them is
+            # wrapped in an exception group.
+            try:
+                fill()
+                next_index = 0
+                while running:
+                    i, result, e = await receiver.receive()
+                    running.discard(i)
+                    if e is not None:
+                        errors.append(e)
+                        break
+                    result = cast(_U, result)
+                    if not ordered:
+                        fill()
+                        yield result
+                        continue
+                    results[i] = result
+                    while next_index in results:
+                        result = results.pop(next_index)
+                        next_index += 1
+                        fill()
+                        yield result
+            except GeneratorExit:
+                pass
+            finally:
+                tg.cancel_scope.cancel()
+
+    if errors:
+        raise errors[0]
+
+
+async def _async_merge_iterators(
+    iterators: List[AsyncIterator[_T]], prefetch: bool
+) -> AsyncGenerator[_T, None]:
+    """
+    Advance the iterators concurrently in tasks and yield their items as they
+    arrive. An iterator is advanced again once its previous item has been
+    consumed or, with ``prefetch``, while it is being consumed.
+
+    Like with :func:`_async_concurrent_map` the tasks run in a task group of
+    the task iterating the generator.
+    """
+    if len(iterators) == 1 and not prefetch:
+        async for item in iterators[0]:
+            yield item
+        return
+
+    import anyio
+
+    sender, receiver = anyio.create_memory_object_stream[
+        Tuple[int, bool, Optional[_T], Optional[Exception]]
+    ](len(iterators) * 2)
+    tokens = [anyio.Semaphore(2 if prefetch else 1) for _ in iterators]
+    errors: List[Exception] = []
+
+    def send(i: int, done: bool, item: Optional[_T], e: Optional[Exception]) -> None:
+        with suppress(anyio.BrokenResourceError, anyio.ClosedResourceError):
+            sender.send_nowait((i, done, item, e))
+
+    async def run(i: int, iterator: AsyncIterator[_T]) -> None:
+        try:
+            while True:
+                await tokens[i].acquire()
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    send(i, True, None, None)
+                    return
+                send(i, False, item, None)
+        except Exception as e:
+            send(i, True, None, e)
+
+    with sender, receiver:
+        async with anyio.create_task_group() as tg:
+            for i, iterator in enumerate(iterators):
+                tg.start_soon(run, i, iterator)
+            try:
+                remaining = len(iterators)
+                while remaining:
+                    i, done, result, e = await receiver.receive()
+                    if e is not None:
+                        errors.append(e)
+                        break
+                    if done:
+                        remaining -= 1
+                        continue
+                    yield cast(_T, result)
+                    tokens[i].release()
+            except GeneratorExit:
+                pass
+            finally:
+                tg.cancel_scope.cancel()
+
+    if errors:
+        raise errors[0]
+
+
+def _merge_iterators(
+    iterators: List[Iterator[_T]], prefetch: bool
+) -> Generator[_T, None, None]:
+    """
+    Advance the iterators concurrently in threads and yield their items as
+    they arrive. An iterator is advanced again once its previous item has
+    been consumed or, with ``prefetch``, while it is being consumed.
+    """
+    if len(iterators) == 1 and not prefetch:
+        yield from iterators[0]
+        return
+
+    items: "queue.Queue[Tuple[int, bool, Optional[_T], Optional[Exception]]]" = (
+        queue.Queue()
+    )
+    tokens = [threading.Semaphore(2 if prefetch else 1) for _ in iterators]
+    stopped = threading.Event()
+
+    def run(i: int, iterator: Iterator[_T]) -> None:
+        try:
+            while True:
+                tokens[i].acquire()
+                if stopped.is_set():
+                    return
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    items.put((i, True, None, None))
+                    return
+                items.put((i, False, item, None))
+        except Exception as e:
+            items.put((i, True, None, e))
+
+    with ThreadPoolExecutor(max_workers=len(iterators)) as executor:
+        try:
+            for i, iterator in enumerate(iterators):
+                executor.submit(run, i, iterator)
+            remaining = len(iterators)
+            while remaining:
+                i, done, result, e = items.get()
+                if e is not None:
+                    raise e
+                if done:
+                    remaining -= 1
+                    continue
+                yield cast(_T, result)
+                tokens[i].release()
+        finally:
+            stopped.set()
+            for semaphore in tokens:
+                semaphore.release()
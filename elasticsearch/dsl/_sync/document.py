@@ -16,6 +16,7 @@
 #  under the License.
 
 import collections.abc
+import contextlib
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -31,8 +32,8 @@ from typing import (
 
 from typing_extensions import Self, dataclass_transform
 
-from ...exceptions import NotFoundError, RequestError
-from ...helpers import bulk
+from ...helpers import bulk, parallel_bulk, streaming_bulk
+from .._concurrency import _concurrent_map
 from .._sync.index import Index
 from ..connections import get_connection
 from ..document_base import DocumentBase, DocumentMeta, mapped_field
@@ -212,41 +213,59 @@ class Document(DocumentBase, metaclass=IndexMeta):
             ]
         }
         results = es.mget(index=cls._default_index(index), body=body, **kwargs)
+        return cls._from_mget(results, raise_on_error, missing)
 
-        objs: List[Optional[Self]] = []
-        error_docs: List[Self] = []
-        missing_docs: List[Self] = []
-        for doc in results["docs"]:
-            if doc.get("found"):
-                if error_docs or missing_docs:
-                    # We're going to raise an exception anyway, so avoid an
-                    # expensive call to cls.from_es().
-                    continue
-
-                objs.append(cls.from_es(doc))
-
-            elif doc.get("error"):
-                if raise_on_error:
-                    error_docs.append(doc)
-                if missing == "none":
-                    objs.append(None)
-
-            # The doc didn't cause an error, but the doc also wasn't found.
-            elif missing == "raise":
-                missing_docs.append(doc)
-            elif missing == "none":
-                objs.append(None)
-
-        if error_docs:
-            error_ids = [doc["_id"] for doc in error_docs]
-            message = "Required routing not provided for documents %s."
-            message %= ", ".join(error_ids)
-            raise RequestError(400, message, error_docs)  # type: ignore[arg-type]
-        if missing_docs:
-            missing_ids = [doc["_id"] for doc in missing_docs]
-            message = f"Documents {', '.join(missing_ids)} not found."
-            raise NotFoundError(404, message, {"docs": missing_docs})  # type: ignore[arg-type]
-        return objs
+    @classmethod
+    def get_many(
+        cls,
+        docs: Iterable[Any],
+        using: Optional[UsingType] = None,
+        index: Optional[str] = None,
+        raise_on_error: bool = True,
+        missing: str = "none",
+        chunk_size: int = 1000,
+        max_concurrent_chunks: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Optional[Self]]:
+        r"""
+        Retrieve documents by their ``id``\s with ``mget`` requests of at most
+        ``chunk_size`` documents and yield the instances as the requests
+        complete. Takes the same arguments as :meth:`mget`, ``docs`` can be
+        any iterable. A generator that isn't exhausted should be closed
+        explicitly by the code iterating it, which stops the requests running
+        ahead of the consumer.
+
+        :arg chunk_size: maximum number of documents requested at once
+        :arg max_concurrent_chunks: number of requests sent concurrently, at
+            most this many chunks are requested ahead of the consumer
+        :arg ordered: yield the documents in the order they were requested,
+            otherwise in the order the requests complete
+
+        An error or a missing document with ``missing='raise'`` is raised when
+        the request of its chunk completes, after the documents of the
+        previous chunks have been yielded.
+        """
+        if missing not in ("raise", "skip", "none"):
+            raise ValueError("'missing' must be 'raise', 'skip', or 'none'.")
+        es = cls._get_connection(using)
+        index = cls._default_index(index)
+
+        def mget(body: Dict[str, Any]) -> List[Any]:
+            results = es.mget(index=index, body=body, **kwargs)
+            return cls._from_mget(results, raise_on_error, missing)
+
+        with contextlib.closing(
+            _concurrent_map(
+                mget,
+                cls._mget_bodies(docs, chunk_size),
+                max_concurrent_chunks,
+                ordered,
+            )
+        ) as chunks:
+            for objs in chunks:
+                for obj in objs:
+                    yield obj
 
     def delete(
         self,
@@ -457,7 +476,7 @@ class Document(DocumentBase, metaclass=IndexMeta):
         actions: Iterable[Union[Self, Dict[str, Any]]],
         using: Optional[UsingType] = None,
         index: Optional[str] = None,
-        validate: bool = True,
+        validate: Union[bool, int] = True,
         skip_empty: bool = True,
         **kwargs: Any,
     ) -> Tuple[int, Union[int, List[Any]]]:
@@ -469,7 +488,8 @@ class Document(DocumentBase, metaclass=IndexMeta):
         :arg using: connection alias to use, defaults to ``'default'``
         :arg index: Elasticsearch index to use, if the ``Document`` is
             associated with an index this can be omitted.
-        :arg validate: set to ``False`` to skip validating the documents
+        :arg validate: set to ``False`` to skip validating the documents or to
+            a number ``N`` to validate one in ``N`` documents
         :arg skip_empty: if set to ``False`` will cause empty values (``None``,
             ``[]``, ``{}``) to be left on the document. Those values will be
             stripped out otherwise as they make no difference in Elasticsearch.
@@ -484,38 +504,75 @@ class Document(DocumentBase, metaclass=IndexMeta):
         i = cls._default_index(index)
         assert i is not None
 
-        class Generate:
-            def __init__(
-                self,
-                doc_iterator: Iterable[Union[Document, Dict[str, Any]]],
-            ):
-                self.doc_iterator = doc_iterator.__iter__()
+        return bulk(
+            es,
+            actions,  # type: ignore[arg-type]
+            index=i,
+            expand_action_callback=cls._bulk_expander(validate, skip_empty),
+            **kwargs,
+        )
+
+    @classmethod
+    def streaming_bulk(
+        cls,
+        actions: Iterable[Union[Self, Dict[str, Any]]],
+        using: Optional[UsingType] = None,
+        index: Optional[str] = None,
+        validate: Union[bool, int] = True,
+        skip_empty: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+        """
+        Perform multiple indexing operations in chunks and yield the result of
+        each operation. Takes the same arguments as :meth:`bulk`, any
+        additional keyword arguments are passed to
+        ``helpers.streaming_bulk`` unchanged.
+
+        :arg validate: ``True`` to validate every document, ``False`` to skip
+            validation or a number ``N`` to validate one in ``N`` documents
+        """
+        es = cls._get_connection(using)
 
-            def __iter__(self) -> Self:
-                return self
+        for ok, item in streaming_bulk(
+            es,
+            actions,  # type: ignore[arg-type]
+            index=cls._default_index(index),
+            expand_action_callback=cls._bulk_expander(validate, skip_empty),
+            **kwargs,
+        ):
+            yield ok, item
 
-            def __next__(self) -> Dict[str, Any]:
-                doc: Optional[Union[Document, Dict[str, Any]]] = (
-                    self.doc_iterator.__next__()
-                )
+    @classmethod
+    def parallel_bulk(
+        cls,
+        actions: Iterable[Union[Self, Dict[str, Any]]],
+        using: Optional[UsingType] = None,
+        index: Optional[str] = None,
+        validate: Union[bool, int] = True,
+        skip_empty: bool = True,
+        thread_count: int = 4,
+        **kwargs: Any,
+    ) -> Iterator[Tuple[bool, Any]]:
+        """
+        Perform multiple indexing operations in chunks sent concurrently and
+        yield the result of each operation. Takes the same arguments as
+        :meth:`streaming_bulk`, any additional keyword arguments are passed
+        to ``helpers.parallel_bulk`` unchanged.
 
-                if isinstance(doc, dict):
-                    action = doc
-                    doc = None
-                    if "_source" in action and isinstance(action["_source"], Document):
-                        doc = action["_source"]
-                        if validate:  # pragma: no cover
-                            doc.full_clean()
-                        action["_source"] = doc.to_dict(
-                            include_meta=False, skip_empty=skip_empty
-                        )
-                elif doc is not None:
-                    if validate:  # pragma: no cover
-                        doc.full_clean()
-                    action = doc.to_dict(include_meta=True, skip_empty=skip_empty)
-                return action
-
-        return bulk(es, Generate(actions), index=i, **kwargs)
+        :arg thread_count: number of chunks sent concurrently, by threads
+            with ``Document`` and by tasks with ``AsyncDocument``
+        """
+        es = cls._get_connection(using)
+
+        for ok, item in parallel_bulk(
+            es,
+            actions,  # type: ignore[arg-type]
+            thread_count=thread_count,
+            index=cls._default_index(index),
+            expand_action_callback=cls._bulk_expander(validate, skip_empty),
+            **kwargs,
+        ):
+            yield ok, item
 
     @classmethod
     def esql_execute(
@@ -23,19 +23,47 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Tuple,
     cast,
 )
 
 from typing_extensions import Self
 
-from ...exceptions import ApiError
 from ...helpers import scan
+from .._concurrency import _concurrent_map, _merge_iterators
 from ..connections import get_connection
 from ..response import Response
-from ..search_base import MultiSearchBase, SearchBase
+from ..search_base import (
+    CompiledSearchBase,
+    MultiSearchBase,
+    SearchBase,
+    _MultiSearchBatch,
+)
 from ..utils import _R, AttrDict, UsingType
 
 
+class CompiledSearch(CompiledSearchBase[_R]):
+    """
+    Search compiled with ``compile()``.
+    """
+
+    if TYPE_CHECKING:
+        _search: Search[_R]  # noqa: F821
+
+    def execute(self, **params: Any) -> Response[_R]:
+        """
+        Execute the search with the placeholders replaced by the values given
+        as keyword arguments and return an instance of ``Response`` wrapping
+        all the data.
+        """
+        s = self._search
+        es = get_connection(s._using)
+        return s._response_class(
+            s,
+            (es.search(index=s._index, body=self.to_dict(**params), **s._params)).body,
+        )
+
+
 class Search(SearchBase[_R]):
     _using: UsingType
 
@@ -64,8 +92,8 @@ class Search(SearchBase[_R]):
         Return the number of hits matching the query and filters. Note that
         only the actual number is returned.
         """
-        if hasattr(self, "_response") and self._response.hits.total.relation == "eq":  # type: ignore[attr-defined]
-            return cast(int, self._response.hits.total.value)  # type: ignore[attr-defined]
+        if hasattr(self, "_response") and self._response.hits.total.relation == "eq":
+            return cast(int, self._response.hits.total.value)
 
         es = get_connection(self._using)
 
@@ -98,6 +126,17 @@ class Search(SearchBase[_R]):
             )
         return self._response
 
+    def compile(self) -> CompiledSearch[_R]:
+        """
+        Compile the search into a template of its body. Values given as
+        :class:`~elasticsearch.dsl.Placeholder` instances are filled in when
+        the compiled search is executed with ``execute(**params)``.
+
+        Executing a compiled search doesn't serialize the queries again, which
+        is useful for searches with the same shape executed many times.
+        """
+        return CompiledSearch(self._clone())
+
     def scan(self) -> Iterator[_R]:
         """
         Turn the search into a scan search and return a generator that will
@@ -152,26 +191,66 @@ class Search(SearchBase[_R]):
         search = self.index().extra(pit={"id": pit["id"], "keep_alive": keep_alive})
         if not search._sort:
             search = search.sort("_shard_doc")
-        yield search
-        es.close_point_in_time(id=pit["id"])
+        try:
+            yield search
+        finally:
+            es.close_point_in_time(id=pit["id"])
 
-    def iterate(self, keep_alive: str = "1m") -> Iterator[_R]:
+    def _pages(self) -> Iterator[Response[_R]]:
+        """
+        Yield the pages of results of a search in a point in time.
+        """
+        s = self
+        while True:
+            r = s.execute()
+            if len(r.hits) == 0:
+                break
+            yield r
+            s = s.search_after()
+
+    def iterate(
+        self,
+        keep_alive: str = "1m",
+        size: Optional[int] = None,
+        slices: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[_R]:
         """
         Return a generator that iterates over all the documents matching the query.
 
         This method uses a point in time to provide consistent results even when
-        the index is changing. It should be preferred over ``scan()``.
+        the index is changing. It should be preferred over ``scan()``. The
+        point in time is closed when the iteration ends, also when the
+        generator is closed early or an error is raised. A generator that
+        isn't exhausted should be closed explicitly by the code iterating it,
+        which stops the searches running ahead of the consumer.
 
         :arg keep_alive: the time to live for the point in time, renewed with each new search request
+        :arg size: number of hits retrieved with each request
+        :arg slices: split the search into this many slices of the point in
+            time which are searched concurrently, the hits of the slices are
+            yielded in the order the pages arrive
+        :arg prefetch: request the next page of results while the hits of
+            the current page are being consumed
         """
+        if slices is not None and slices < 1:
+            raise ValueError("slices must be at least 1")
+
         with self.point_in_time(keep_alive=keep_alive) as s:
-            while True:
-                r = s.execute()
-                for hit in r:
-                    yield hit
-                if len(r.hits) == 0:
-                    break
-                s = s.search_after()
+            if size is not None:
+                s = s.extra(size=size)
+            if slices is None or slices == 1:
+                searches = [s]
+            else:
+                searches = [
+                    s.extra(slice={"id": i, "max": slices}) for i in range(slices)
+                ]
+            with contextlib.closing(
+                _merge_iterators([search._pages() for search in searches], prefetch)
+            ) as pages:
+                for page in pages:
+                    for hit in page:
+                        yield hit
 
 
 class MultiSearch(MultiSearchBase[_R]):
@@ -187,32 +266,80 @@ class MultiSearch(MultiSearchBase[_R]):
         def add(self, search: Search[_R]) -> Self: ...  # type: ignore[override]
 
     def execute(
-        self, ignore_cache: bool = False, raise_on_error: bool = True
+        self,
+        ignore_cache: bool = False,
+        raise_on_error: bool = True,
+        batch_size: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        max_concurrent_batches: int = 1,
     ) -> List[Response[_R]]:
         """
         Execute the multi search request and return a list of search results.
+
+        By default all the searches are sent in a single ``msearch`` request.
+        See :meth:`stream` for the parameters to split them into batches.
         """
         if ignore_cache or not hasattr(self, "_response"):
-            es = get_connection(self._using)
-
-            responses = es.msearch(
-                index=self._index, body=self.to_dict(), **self._params
-            )
-
-            out: List[Response[_R]] = []
-            for s, r in zip(self._searches, responses["responses"]):
-                if r.get("error", False):
-                    if raise_on_error:
-                        raise ApiError("N/A", meta=responses.meta, body=r)
-                    r = None
-                else:
-                    r = Response(s, r)
-                out.append(r)
+            out: List[Any] = [None] * len(self._searches)
+            for i, r in self.stream(
+                batch_size=batch_size,
+                max_batch_bytes=max_batch_bytes,
+                max_concurrent_batches=max_concurrent_batches,
+                raise_on_error=raise_on_error,
+            ):
+                out[i] = r
 
             self._response = out
 
         return self._response
 
+    def stream(
+        self,
+        batch_size: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        max_concurrent_batches: int = 1,
+        ordered: bool = True,
+        raise_on_error: bool = True,
+    ) -> Iterator[Tuple[int, Optional[Response[_R]]]]:
+        """
+        Execute the multi search request split into batches and yield the
+        index of each search along with its results as the batches complete.
+        A generator that isn't exhausted should be closed explicitly by the
+        code iterating it, which stops the requests running ahead of the
+        consumer.
+
+        Parameters of the request added with ``params()``, ie
+        ``max_concurrent_searches``, are sent with each batch.
+
+        :arg batch_size: maximum number of searches sent in one request
+        :arg max_batch_bytes: maximum size in bytes of the body of a request,
+            a larger search is sent in a request of its own
+        :arg max_concurrent_batches: number of requests sent concurrently
+        :arg ordered: yield the results in the order of the searches,
+            otherwise in the order the batches complete
+        :arg raise_on_error: raise ``ApiError`` for a failed search,
+            otherwise its results are ``None``
+        """
+        es = get_connection(self._using)
+
+        def msearch(
+            batch: _MultiSearchBatch[_R],
+        ) -> List[Tuple[int, Optional[Response[_R]]]]:
+            responses = es.msearch(index=self._index, body=batch[2], **self._params)
+            return self._batch_responses(batch, responses, raise_on_error)
+
+        with contextlib.closing(
+            _concurrent_map(
+                msearch,
+                self._batches(batch_size, max_batch_bytes),
+                max_concurrent_batches,
+                ordered,
+            )
+        ) as batches:
+            for responses in batches:
+                for item in responses:
+                    yield item
+
 
 class EmptySearch(Search[_R]):
     def count(self) -> int:
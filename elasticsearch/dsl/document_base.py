@@ -15,6 +15,7 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import collections.abc
 import json
 from datetime import date, datetime
 from fnmatch import fnmatch
@@ -25,6 +26,8 @@ from typing import (
     ClassVar,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -46,12 +49,14 @@ try:
 except ImportError:
     UnionType = None  # type: ignore[assignment, misc]
 
-from typing_extensions import dataclass_transform
+from typing_extensions import Self, dataclass_transform
 
+from ..exceptions import NotFoundError, RequestError
+from ..helpers.actions import expand_action
 from .exceptions import ValidationException
 from .field import Binary, Boolean, Date, Field, Float, Integer, Nested, Object, Text
 from .mapping import Mapping
-from .utils import DOC_META_FIELDS, ObjectBase
+from .utils import DOC_META_FIELDS, ObjectBase, _SerializationPlan
 
 if TYPE_CHECKING:
     from elastic_transport import ObjectApiResponse
@@ -309,6 +314,8 @@ class DocumentOptions:
 
         # create the mapping instance
         self.mapping: Mapping = getattr(meta, "mapping", Mapping())
+        # compiled by ObjectBase when documents are first (de)serialized
+        self._serialization_plan: Optional[_SerializationPlan] = None
 
         # register the document's fields, which can be given in a few formats:
         #
@@ -609,6 +616,145 @@ class DocumentBase(ObjectBase):
     def _default_index(cls, index: Optional[str] = None) -> str:
         return index or cls._index._name
 
+    @staticmethod
+    def _mget_bodies(docs: Iterable[Any], chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """
+        Split the requested documents into bodies of ``mget`` requests with
+        at most ``chunk_size`` documents.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        chunk: List[Any] = []
+        for doc in docs:
+            chunk.append(
+                doc if isinstance(doc, collections.abc.Mapping) else {"_id": doc}
+            )
+            if len(chunk) == chunk_size:
+                yield {"docs": chunk}
+                chunk = []
+        if chunk:
+            yield {"docs": chunk}
+
+    @classmethod
+    def _bulk_expander(
+        cls, validate: Union[bool, int], skip_empty: bool
+    ) -> Callable[[Any], Tuple[Dict[str, Any], Any]]:
+        """
+        Return the ``expand_action_callback`` of the bulk helpers for the
+        documents and actions passed to the bulk methods.
+
+        Documents are serialized with ``to_dict()`` and the header of the
+        documents without an ``id`` or ``routing`` is shared per index. With
+        ``validate=N`` only one in ``N`` documents is validated.
+        """
+        every = 1 if validate is True else int(validate)
+        headers: Dict[Optional[str], Dict[str, Any]] = {}
+        count = 0
+
+        def clean(doc: DocumentBase) -> None:
+            nonlocal count
+            sampled = every and count % every == 0
+            count += 1
+            if sampled:
+                doc.full_clean()
+
+        def expand(action: Any) -> Tuple[Dict[str, Any], Any]:
+            if isinstance(action, DocumentBase):
+                clean(action)
+                body = action.to_dict(skip_empty=skip_empty)
+                index = action._get_index(required=False)
+                meta = action.meta
+                if "id" not in meta and "routing" not in meta:
+                    header = headers.get(index)
+                    if header is None:
+                        header = headers[index] = {
+                            "index": {"_index": index} if index is not None else {}
+                        }
+                    return header, body
+                op: Dict[str, Any] = {}
+                if index is not None:
+                    op["_index"] = index
+                if "id" in meta:
+                    op["_id"] = meta.id
+                if "routing" in meta:
+                    op["routing"] = meta.routing
+                return {"index": op}, body
+
+            if isinstance(action, dict) and isinstance(
+                action.get("_source"), DocumentBase
+            ):
+                doc = action["_source"]
+                clean(doc)
+                action = {
+                    **action,
+                    "_source": doc.to_dict(include_meta=False, skip_empty=skip_empty),
+                }
+            return expand_action(action)
+
+        return expand
+
+    @classmethod
+    def _from_mget(
+        cls,
+        results: Union[Dict[str, Any], "ObjectApiResponse[Any]"],
+        raise_on_error: bool,
+        missing: str,
+    ) -> List[Optional[Self]]:
+        """
+        Return the documents of an ``mget`` response in the requested order.
+        """
+        docs = results["docs"]
+        if missing == "skip":
+            # the documents which weren't found are left out, so the list
+            # is built in one go and only checked for errors if it is short
+            objs: List[Optional[Self]] = [
+                cls.from_es(doc) for doc in docs if doc.get("found")
+            ]
+            if raise_on_error and len(objs) < len(docs):
+                cls._raise_for_mget([doc for doc in docs if doc.get("error")], [])
+            return objs
+
+        objs = []
+        error_docs: List[Dict[str, Any]] = []
+        missing_docs: List[Dict[str, Any]] = []
+        for doc in docs:
+            if doc.get("found"):
+                if error_docs or missing_docs:
+                    # We're going to raise an exception anyway, so avoid an
+                    # expensive call to cls.from_es().
+                    continue
+
+                objs.append(cls.from_es(doc))
+
+            elif doc.get("error"):
+                if raise_on_error:
+                    error_docs.append(doc)
+                if missing == "none":
+                    objs.append(None)
+
+            # The doc didn't cause an error, but the doc also wasn't found.
+            elif missing == "raise":
+                missing_docs.append(doc)
+            elif missing == "none":
+                objs.append(None)
+
+        cls._raise_for_mget(error_docs, missing_docs)
+        return objs
+
+    @staticmethod
+    def _raise_for_mget(
+        error_docs: List[Dict[str, Any]], missing_docs: List[Dict[str, Any]]
+    ) -> None:
+        if error_docs:
+            error_ids = [doc["_id"] for doc in error_docs]
+            message = "Required routing not provided for documents %s."
+            message %= ", ".join(error_ids)
+            raise RequestError(400, message, error_docs)  # type: ignore[arg-type]
+        if missing_docs:
+            missing_ids = [doc["_id"] for doc in missing_docs]
+            message = f"Documents {', '.join(missing_ids)} not found."
+            raise NotFoundError(404, message, {"docs": missing_docs})  # type: ignore[arg-type]
+
     def _get_index(
         self, index: Optional[str] = None, required: bool = True
     ) -> Optional[str]:
@@ -18,8 +18,10 @@
 import base64
 import collections.abc
 import ipaddress
+import struct
+import sys
 from copy import deepcopy
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -59,6 +61,26 @@ if TYPE_CHECKING:
 unicode = str
 
 
+def _unpack_dense_vector(data: str) -> Tuple[float, ...]:
+    byte_array = base64.b64decode(data)
+    return struct.unpack(f">{len(byte_array) // 4}f", byte_array)
+
+
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.fromisoformat
+else:
+
+    def _fromisoformat(data: str) -> datetime:
+        # the "Z" suffix of UTC dates is supported since Python 3.11
+        if data.endswith("Z"):
+            data = data[:-1] + "+00:00"
+        return datetime.fromisoformat(data)
+
+
+# Divisors of the date formats of numbers to get the seconds since the epoch.
+_EPOCH_FORMATS = {"epoch_millis": 1000.0, "epoch_second": 1.0}
+
+
 def construct_field(
     name_or_field: Union[
         str,
@@ -1343,14 +1365,37 @@ class Date(Field):
             self._default_timezone = default_timezone
         super().__init__(*args, **kwargs)
 
+    def _parse(self, data: str) -> datetime:
+        try:
+            # fast path for the ISO 8601 dates returned by Elasticsearch
+            return _fromisoformat(data)
+        except ValueError:
+            pass
+
+        if hasattr(self, "format"):
+            for date_format in str(self.format).split("||"):
+                if date_format in _EPOCH_FORMATS:
+                    try:
+                        seconds = float(data) / _EPOCH_FORMATS[date_format]
+                    except ValueError:
+                        continue
+                    value = datetime.fromtimestamp(seconds, tz=timezone.utc)
+                    # Without a default timezone a naive UTC datetime is
+                    # returned, as for integer values.
+                    if not self._default_timezone:
+                        return value.replace(tzinfo=None)
+                    return value.astimezone(self._default_timezone)
+
+        try:
+            return parser.parse(data)
+        except Exception as e:
+            raise ValidationException(
+                f"Could not parse date from the value ({data!r})", e
+            )
+
     def _deserialize(self, data: Any) -> Union[datetime, date]:
         if isinstance(data, str):
-            try:
-                data = parser.parse(data)
-            except Exception as e:
-                raise ValidationException(
-                    f"Could not parse date from the value ({data!r})", e
-                )
+            data = self._parse(data)
             # we treat the yyyy-MM-dd format as a special case
             if hasattr(self, "format") and self.format == "yyyy-MM-dd":
                 data = data.date()
@@ -1363,7 +1408,9 @@ class Date(Field):
             return data
         if isinstance(data, int):
             # Divide by a float to preserve milliseconds on the datetime.
-            return datetime.utcfromtimestamp(data / 1000.0)
+            return datetime.fromtimestamp(data / 1000.0, tz=timezone.utc).replace(
+                tzinfo=None
+            )
 
         raise ValidationException(f"Could not parse date from the value ({data!r})")
 
@@ -1582,6 +1629,9 @@ class DenseVector(Field):
     :arg dynamic:
     :arg fields:
     :arg synthetic_source_keep:
+    :arg pack: If `True`, float32 numpy arrays are sent as base64
+        encoded strings, which are faster to encode and decode than
+        arrays of numbers. Only use it with `float` vectors.
     """
 
     name = "dense_vector"
@@ -1616,6 +1666,7 @@ class DenseVector(Field):
         synthetic_source_keep: Union[
             Literal["none", "arrays", "all"], "DefaultType"
         ] = DEFAULT,
+        pack: Union[bool, "DefaultType"] = DEFAULT,
         **kwargs: Any,
     ):
         if dims is not DEFAULT:
@@ -1643,8 +1694,24 @@ class DenseVector(Field):
         self._element_type = kwargs.get("element_type", "float")
         if self._element_type in ["float", "byte"]:
             kwargs["multi"] = True
+        self._pack = pack is True
         super().__init__(*args, **kwargs)
 
+    def _serialize(self, data: Any, skip_empty: bool) -> Any:
+        # float32 numpy arrays are sent packed, which is faster to encode
+        # and decode than a JSON array of numbers and loses no precision.
+        if self._pack and self._element_type == "float":
+            from ..helpers.actions import _is_float32_vector, pack_dense_vector
+
+            if _is_float32_vector(data):
+                return pack_dense_vector(data)
+        return data
+
+    def _deserialize(self, data: Any) -> Any:
+        if self._element_type == "float" and isinstance(data, str):
+            return list(_unpack_dense_vector(data))
+        return data
+
 
 class NumpyDenseVector(DenseVector):
     """A dense vector field that uses numpy arrays.
@@ -1663,6 +1730,11 @@ class NumpyDenseVector(DenseVector):
             import numpy as np
 
             return np.array(data, dtype=self._dtype)
+        if self._element_type == "float" and isinstance(data, str):
+            import numpy as np
+
+            vector = np.frombuffer(base64.b64decode(data), dtype=">f4")
+            return vector.astype(self._dtype or np.float32)
         return super().deserialize(data)
 
     def clean(self, data: Any) -> Any:
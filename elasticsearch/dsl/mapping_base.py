@@ -22,7 +22,7 @@ from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 from typing_extensions import Self
 
 from .field import Field, Nested, Text, construct_field
-from .utils import DslBase
+from .utils import DslBase, _MappingVersion
 
 META_FIELDS = frozenset(
     (
@@ -45,6 +45,7 @@ class Properties(DslBase):
 
     def __init__(self) -> None:
         super().__init__()
+        self._version = _MappingVersion()
 
     def __repr__(self) -> str:
         return "Properties()"
@@ -65,6 +66,7 @@ class Properties(DslBase):
 
     def field(self, name: str, *args: Any, **kwargs: Any) -> Self:
         self.properties[name] = construct_field(*args, **kwargs)
+        self._version.value += 1
         return self
 
     def _collect_fields(self) -> Iterator[Field]:
@@ -91,6 +93,7 @@ class Properties(DslBase):
                     our[name].update(other[name])
                 continue
             our[name] = other[name]
+        self._version.value += 1
 
 
 class MappingBase:
@@ -104,6 +107,7 @@ class MappingBase:
     def _clone(self) -> Self:
         m = self.__class__()
         m.properties._params = self.properties._params.copy()
+        m.properties._version = self.properties._version
         return m
 
     def resolve_nested(
@@ -18,6 +18,7 @@
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Generic,
     Iterator,
@@ -28,9 +29,10 @@ from typing import (
     Tuple,
     Union,
     cast,
+    overload,
 )
 
-from ..utils import _R, AttrDict, AttrList, _wrap
+from ..utils import _R, META_FIELDS, AttrDict, AttrList, _wrap
 from .hit import Hit, HitMeta
 
 if TYPE_CHECKING:
@@ -42,6 +44,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "Response",
+    "Hits",
     "AggResponse",
     "UpdateByQueryResponse",
     "Hit",
@@ -86,7 +89,7 @@ class Response(AttrDict[Any], Generic[_R]):
     _search: "SearchBase[_R]"
     _faceted_search: "FacetedSearchBase[_R]"
     _doc_class: Optional[_R]
-    _hits: List[_R]
+    _hits: "Hits[_R]"
 
     took: int
     timed_out: bool
@@ -142,7 +145,7 @@ class Response(AttrDict[Any], Generic[_R]):
     def __setstate__(
         self, state: Tuple[Dict[str, Any], "Request[_R]", Optional[_R]]  # type: ignore[override]
     ) -> None:
-        super(AttrDict, self).__setattr__("_d_", state[0])
+        super().__setstate__((state[0],))
         super(AttrDict, self).__setattr__("_search", state[1])
         super(AttrDict, self).__setattr__("_doc_class", state[2])
 
@@ -150,15 +153,10 @@ class Response(AttrDict[Any], Generic[_R]):
         return self._shards.total == self._shards.successful and not self.timed_out
 
     @property
-    def hits(self) -> List[_R]:
+    def hits(self) -> "Hits[_R]":
         if not hasattr(self, "_hits"):
             h = cast(AttrDict[Any], self._d_["hits"])
-
-            try:
-                hits = AttrList(list(map(self._search._get_result, h["hits"])))
-            except AttributeError as e:
-                # avoid raising AttributeError since it will be hidden by the property
-                raise TypeError("Could not parse hits.", e)
+            hits = Hits[_R](h["hits"], self._search._get_result)
 
             # avoid assigning _hits into self._d_
             super(AttrDict, self).__setattr__("_hits", hits)
@@ -293,6 +291,125 @@ AggregateResponseType = Union[
 ]
 
 
+# Placeholder for the hits which haven't been hydrated yet.
+_NOT_HYDRATED: Any = object()
+
+
+class Hits(AttrList[_R]):
+    """The hits of a search response.
+
+    Each hit is turned into a ``Hit`` or ``Document`` instance the first
+    time it's accessed. Use :meth:`column` to read one field of all the hits
+    without creating the instances.
+    """
+
+    def __init__(
+        self, hits: List[Dict[str, Any]], get_result: Callable[[Any], _R]
+    ) -> None:
+        super().__init__([_NOT_HYDRATED] * len(hits))
+        self._raw_hits = hits
+        self._get_result = get_result
+
+    def _hydrate(self, index: int) -> _R:
+        result = self._l_[index]
+        if result is _NOT_HYDRATED:
+            try:
+                result = self._l_[index] = self._get_result(self._raw_hits[index])
+            except AttributeError as e:
+                # avoid raising AttributeError since it will be hidden by the property
+                raise TypeError("Could not parse hits.", e)
+        return result
+
+    def _hydrate_all(self) -> List[_R]:
+        for index in range(len(self._l_)):
+            self._hydrate(index)
+        return self._l_
+
+    @overload
+    def __getitem__(self, k: int) -> _R: ...
+
+    @overload
+    def __getitem__(self, k: slice) -> AttrList[_R]: ...
+
+    def __getitem__(self, k: Union[int, slice]) -> Any:
+        if isinstance(k, slice):
+            return AttrList[_R]([self._hydrate(i) for i in range(len(self._l_))[k]])
+        return self._hydrate(range(len(self._l_))[k])
+
+    def __iter__(self) -> Iterator[_R]:
+        return map(self._hydrate, range(len(self._l_)))
+
+    def __repr__(self) -> str:
+        return repr(self._hydrate_all())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, AttrList):
+            other = other.to_list()
+        return bool(self._hydrate_all() == other)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._hydrate_all(), name)
+
+    def __getstate__(  # type: ignore[override]
+        self,
+    ) -> Tuple[List[_R], None, List[Dict[str, Any]]]:
+        return self._hydrate_all(), None, self._raw_hits
+
+    def __setstate__(  # type: ignore[override]
+        self, state: Tuple[List[_R], None, List[Dict[str, Any]]]
+    ) -> None:
+        hits, obj_wrapper, self._raw_hits = state
+        super().__setstate__((hits, obj_wrapper))
+
+    def to_list(self) -> List[_R]:
+        return self._hydrate_all()
+
+    def column(self, field: str, default: Any = None, dtype: Any = None) -> Any:
+        """
+        Return the values of a field of all the hits without creating
+        ``Hit`` or ``Document`` instances. The values are as they are in
+        the response, they aren't deserialized by the document's fields.
+
+        Example::
+
+            user_ids = response.hits.column("user.id")
+            scores = response.hits.column("_score", dtype="float32")
+
+        :arg field: path of the field in the ``_source`` of the hits, using
+            dots for inner objects, or a metadata field such as ``_id`` or
+            ``_score``.
+        :arg default: value of the hits which don't have the field.
+        :arg dtype: if given, return a numpy array with this data type
+            instead of a list.
+        """
+        if field.startswith("_") and field[1:] in META_FIELDS:
+            values = [hit.get(field, default) for hit in self._raw_hits]
+        else:
+            path = field.split(".")
+            values = []
+            for hit in self._raw_hits:
+                value = hit.get("_source", {})
+                if field in value:
+                    # fields can be given with dots in the source too
+                    value = value[field]
+                else:
+                    for step in path:
+                        if not isinstance(value, dict) or step not in value:
+                            value = default
+                            break
+                        value = value[step]
+                values.append(value)
+
+        if dtype is None:
+            return values
+
+        import numpy as np
+
+        return np.asarray(values, dtype=dtype)
+
+
 class AggResponse(AttrDict[Any], Generic[_R]):
     """An Elasticsearch aggregation response."""
 
@@ -15,6 +15,16 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
-from ._async.search import AsyncEmptySearch, AsyncMultiSearch, AsyncSearch  # noqa: F401
-from ._sync.search import EmptySearch, MultiSearch, Search  # noqa: F401
-from .search_base import Q  # noqa: F401
+from ._async.search import (  # noqa: F401
+    AsyncCompiledSearch,
+    AsyncEmptySearch,
+    AsyncMultiSearch,
+    AsyncSearch,
+)
+from ._sync.search import (  # noqa: F401
+    CompiledSearch,
+    EmptySearch,
+    MultiSearch,
+    Search,
+)
+from .search_base import Placeholder, Q  # noqa: F401
@@ -17,16 +17,20 @@
 
 import collections.abc
 import copy
+import re
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
     Iterator,
     List,
+    Mapping,
     Optional,
     Protocol,
+    Set,
     Tuple,
     Type,
     Union,
@@ -36,6 +40,8 @@ from typing import (
 
 from typing_extensions import Self, TypeVar
 
+from ..exceptions import ApiError
+from ..serializer import JsonSerializer
 from .aggs import A, Agg, AggBase
 from .document_base import InstrumentedField
 from .exceptions import IllegalOperation
@@ -46,6 +52,10 @@ from .utils import _R, AnyUsingType, AttrDict, DslBase, recursive_to_dict
 if TYPE_CHECKING:
     from .field import Field, Object
 
+_serializer = JsonSerializer()
+# Placeholders serialized to JSON when compiling a search, see CompiledSearchBase.
+_PLACEHOLDER_MARKER_RE = re.compile(rb'"\\u0000(\d+)\\u0000"')
+
 
 class SupportsClone(Protocol):
     def _clone(self) -> Self: ...
@@ -104,6 +114,15 @@ class QueryProxy(Generic[_S]):
     def __setstate__(self, state: Tuple[_S, Optional[Query], str]) -> None:
         self._search, self._proxied, self._attr_name = state
 
+    def _copy_for(self, search: _S) -> "QueryProxy[_S]":
+        # sets the attributes directly, ``__setattr__`` is slow for
+        # a proxy that's copied each time the search is cloned
+        proxy: QueryProxy[_S] = object.__new__(QueryProxy)
+        proxy.__dict__.update(
+            _search=search, _proxied=self._proxied, _attr_name=self._attr_name
+        )
+        return proxy
+
 
 class ProxyDescriptor(Generic[_S]):
     """
@@ -136,8 +155,29 @@ class AggsProxy(AggBase[_R], DslBase):
     def to_dict(self) -> Dict[str, Any]:
         return cast(Dict[str, Any], super().to_dict().get("aggs", {}))
 
+    def _copy_for(self, search: "SearchBase[_R]") -> "AggsProxy[_R]":
+        # copies the top-level bucket definitions, see ``QueryProxy._copy_for()``
+        aggs: AggsProxy[_R] = object.__new__(AggsProxy)
+        aggs.__dict__.update(
+            _base=aggs,
+            _search=search,
+            _params={"aggs": dict(self._params.get("aggs", {}))},
+        )
+        return aggs
+
 
 class Request(Generic[_R]):
+    #: Attributes holding containers that a request shares with its clones
+    #: until either of them modifies the container, see ``_mutable()``.
+    _copy_on_write: Tuple[str, ...] = (
+        "_doc_type",
+        "_doc_type_map",
+        "_params",
+        "_extra",
+    )
+    #: Attributes in ``_copy_on_write`` that aren't shared with another request.
+    _owned: FrozenSet[str] = frozenset()
+
     def __init__(
         self,
         using: AnyUsingType = "default",
@@ -167,6 +207,7 @@ class Request(Generic[_R]):
 
         self._params: Dict[str, Any] = {}
         self._extra: Dict[str, Any] = extra or {}
+        self._owned = frozenset(self._copy_on_write)
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -193,7 +234,7 @@ class Request(Generic[_R]):
             s = s.params(routing='user-1', preference='local')
         """
         s = self._clone()
-        s._params.update(kwargs)
+        s._mutable("_params").update(kwargs)
         return s
 
     def index(self, *index: Union[str, List[str], Tuple[str, ...]]) -> Self:
@@ -309,9 +350,9 @@ class Request(Generic[_R]):
             s._doc_type = []
             s._doc_type_map = {}
         else:
-            s._doc_type.extend(doc_type)
+            s._mutable("_doc_type").extend(doc_type)
             s._doc_type.extend(kwargs.keys())
-            s._doc_type_map.update(kwargs)
+            s._mutable("_doc_type_map").update(kwargs)
         return s
 
     def using(self, client: AnyUsingType) -> Self:
@@ -335,18 +376,31 @@ class Request(Generic[_R]):
         s = self._clone()
         if "from_" in kwargs:
             kwargs["from"] = kwargs.pop("from_")
-        s._extra.update(kwargs)
+        s._mutable("_extra").update(kwargs)
         return s
 
     def _clone(self) -> Self:
-        s = self.__class__(
-            using=self._using, index=self._index, doc_type=self._doc_type
-        )
-        s._doc_type_map = self._doc_type_map.copy()
-        s._extra = self._extra.copy()
-        s._params = self._params.copy()
+        # The clone shares all the containers with the original request, they
+        # are only copied by ``_mutable()`` once one of the requests modifies
+        # them. The cached response isn't shared.
+        s = object.__new__(self.__class__)
+        s.__dict__.update(self.__dict__)
+        s.__dict__.pop("_response", None)
+        s._owned = self._owned = frozenset()
         return s
 
+    def _mutable(self, name: str) -> Any:
+        """
+        Return the container in the ``name`` attribute to be modified in-place,
+        copying it first if it may be shared with another request.
+        """
+        value = getattr(self, name)
+        if name not in self._owned:
+            value = copy.copy(value)
+            setattr(self, name, value)
+            self._owned = self._owned | {name}
+        return value
+
     if TYPE_CHECKING:
 
         def to_dict(self) -> Dict[str, Any]: ...
@@ -356,6 +410,17 @@ class SearchBase(Request[_R]):
     query = ProxyDescriptor[Self]("query")
     post_filter = ProxyDescriptor[Self]("post_filter")
     _response: Response[_R]
+    _copy_on_write = Request._copy_on_write + (
+        "_sort",
+        "_knn",
+        "_rank",
+        "_collapse",
+        "_source",
+        "_highlight",
+        "_highlight_opts",
+        "_suggest",
+        "_script_fields",
+    )
 
     def __init__(
         self,
@@ -444,9 +509,9 @@ class SearchBase(Request[_R]):
                 new_to = old_to
 
         if new_from is not None:
-            s._extra["from"] = new_from
+            s._mutable("_extra")["from"] = new_from
         if new_to is not None:
-            s._extra["size"] = max(0, new_to - (new_from or 0))
+            s._mutable("_extra")["size"] = max(0, new_to - (new_from or 0))
         return s
 
     @classmethod
@@ -473,28 +538,15 @@ class SearchBase(Request[_R]):
 
     def _clone(self) -> Self:
         """
-        Return a clone of the current search request. Performs a shallow copy
-        of all the underlying objects. Used internally by most state modifying
-        APIs.
+        Return a clone of the current search request. The underlying objects
+        are shared with the clone and copied once either search modifies them.
+        Used internally by most state modifying APIs.
         """
         s = super()._clone()
 
-        s._response_class = self._response_class
-        s._knn = [knn.copy() for knn in self._knn]
-        s._rank = self._rank.copy()
-        s._collapse = self._collapse.copy()
-        s._sort = self._sort[:]
-        s._source = copy.copy(self._source) if self._source is not None else None
-        s._highlight = self._highlight.copy()
-        s._highlight_opts = self._highlight_opts.copy()
-        s._suggest = self._suggest.copy()
-        s._script_fields = self._script_fields.copy()
-        for x in ("query", "post_filter"):
-            getattr(s, x)._proxied = getattr(self, x)._proxied
-
-        # copy top-level bucket definitions
-        if self.aggs._params.get("aggs"):
-            s.aggs._params = {"aggs": self.aggs._params["aggs"].copy()}
+        s.aggs = self.aggs._copy_for(s)
+        s._query_proxy = self._query_proxy._copy_for(s)
+        s._post_filter_proxy = self._post_filter_proxy._copy_for(s)
         return s
 
     def response_class(self, cls: Type[Response[_R]]) -> Self:
@@ -545,7 +597,7 @@ class SearchBase(Request[_R]):
                     s.setdefault("text", text)
         if "script_fields" in d:
             self._script_fields = d.pop("script_fields")
-        self._extra.update(d)
+        self._mutable("_extra").update(d)
         return self
 
     def script_fields(self, **kwargs: Any) -> Self:
@@ -573,7 +625,7 @@ class SearchBase(Request[_R]):
         for name in kwargs:
             if isinstance(kwargs[name], str):
                 kwargs[name] = {"script": kwargs[name]}
-        s._script_fields.update(kwargs)
+        s._mutable("_script_fields").update(kwargs)
         return s
 
     def knn(
@@ -608,13 +660,11 @@ class SearchBase(Request[_R]):
                       filter=Q('term', category='blog')))
         """
         s = self._clone()
-        s._knn.append(
-            {
-                "field": str(field),  # str() is for InstrumentedField instances
-                "k": k,
-                "num_candidates": num_candidates,
-            }
-        )
+        knn: Dict[str, Any] = {
+            "field": str(field),  # str() is for InstrumentedField instances
+            "k": k,
+            "num_candidates": num_candidates,
+        }
         if query_vector is None and query_vector_builder is None:
             raise ValueError("one of query_vector and query_vector_builder is required")
         if query_vector is not None and query_vector_builder is not None:
@@ -622,20 +672,21 @@ class SearchBase(Request[_R]):
                 "only one of query_vector and query_vector_builder must be given"
             )
         if query_vector is not None:
-            s._knn[-1]["query_vector"] = cast(Any, query_vector)
+            knn["query_vector"] = query_vector
         if query_vector_builder is not None:
-            s._knn[-1]["query_vector_builder"] = query_vector_builder
+            knn["query_vector_builder"] = query_vector_builder
         if boost is not None:
-            s._knn[-1]["boost"] = boost
+            knn["boost"] = boost
         if filter is not None:
             if isinstance(filter, Query):
-                s._knn[-1]["filter"] = filter.to_dict()
+                knn["filter"] = filter.to_dict()
             else:
-                s._knn[-1]["filter"] = filter
+                knn["filter"] = filter
         if similarity is not None:
-            s._knn[-1]["similarity"] = similarity
+            knn["similarity"] = similarity
         if inner_hits is not None:
-            s._knn[-1]["inner_hits"] = inner_hits
+            knn["inner_hits"] = inner_hits
+        s._mutable("_knn").append(knn)
         return s
 
     def rank(self, rrf: Optional[Union[bool, Dict[str, Any]]] = None) -> Self:
@@ -750,14 +801,15 @@ class SearchBase(Request[_R]):
             s._source = {}
 
         if isinstance(s._source, dict):
+            source = s._mutable("_source")
             for key, value in kwargs.items():
                 if value is None:
                     try:
-                        del s._source[key]
+                        del source[key]
                     except KeyError:
                         pass
                 else:
-                    s._source[key] = ensure_strings(value)
+                    source[key] = ensure_strings(value)
 
         return s
 
@@ -836,7 +888,7 @@ class SearchBase(Request[_R]):
             s = s.highlight_options(order='score')
         """
         s = self._clone()
-        s._highlight_opts.update(kwargs)
+        s._mutable("_highlight_opts").update(kwargs)
         return s
 
     def highlight(
@@ -877,8 +929,9 @@ class SearchBase(Request[_R]):
 
         """
         s = self._clone()
+        highlight = s._mutable("_highlight")
         for f in fields:
-            s._highlight[str(f)] = kwargs
+            highlight[str(f)] = kwargs
         return s
 
     def suggest(
@@ -913,14 +966,15 @@ class SearchBase(Request[_R]):
             )
 
         s = self._clone()
+        suggest = s._mutable("_suggest")
         if regex:
-            s._suggest[name] = {"regex": regex}
+            suggest[name] = {"regex": regex}
         elif text:
             if "completion" in kwargs:
-                s._suggest[name] = {"prefix": text}
+                suggest[name] = {"prefix": text}
             else:
-                s._suggest[name] = {"text": text}
-        s._suggest[name].update(kwargs)
+                suggest[name] = {"text": text}
+        suggest[name].update(kwargs)
         return s
 
     def search_after(self) -> Self:
@@ -1010,12 +1064,173 @@ class SearchBase(Request[_R]):
         return d
 
 
+class Placeholder:
+    """
+    Named placeholder for a value in the body of a search compiled with
+    ``compile()``. The value is given when the compiled search is executed::
+
+        s = Search().filter("term", user_id=Placeholder("user_id"))
+        compiled = s.compile()
+        response = compiled.execute(user_id=42)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Placeholder) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash((Placeholder, self.name))
+
+    def __repr__(self) -> str:
+        return f"Placeholder({self.name!r})"
+
+
+_Builder = Callable[[Mapping[str, Any]], Any]
+
+
+def _compile_value(value: Any, names: Set[str]) -> Optional[_Builder]:
+    # Returns a function building the value with the placeholders replaced by
+    # the given values, or None if the value doesn't contain placeholders.
+    # Only the dicts and lists containing placeholders are copied by the
+    # function, the parts without placeholders are shared.
+    if isinstance(value, Placeholder):
+        name = value.name
+        names.add(name)
+        return lambda params: params[name]
+
+    if isinstance(value, collections.abc.Mapping):
+        builders = {}
+        for key, item in value.items():
+            builder = _compile_value(item, names)
+            if builder is not None:
+                builders[key] = builder
+        if not builders:
+            return None
+
+        def build_dict(params: Mapping[str, Any]) -> Dict[str, Any]:
+            d = dict(value)
+            for key, build in builders.items():
+                d[key] = build(params)
+            return d
+
+        return build_dict
+
+    if isinstance(value, (list, tuple)):
+        item_builders = []
+        for i, item in enumerate(value):
+            builder = _compile_value(item, names)
+            if builder is not None:
+                item_builders.append((i, builder))
+        if not item_builders:
+            return None
+
+        def build_list(params: Mapping[str, Any]) -> List[Any]:
+            items = list(value)
+            for i, build in item_builders:
+                items[i] = build(params)
+            return items
+
+        return build_list
+
+    return None
+
+
+class CompiledSearchBase(Generic[_R]):
+    """
+    Search compiled by ``compile()`` into a template of its body with
+    :class:`Placeholder` values. The body is serialized once when compiling,
+    executing the compiled search only fills in the values of the
+    placeholders instead of serializing all the queries again.
+    """
+
+    _search: SearchBase[_R]
+
+    def __init__(self, search: SearchBase[_R]):
+        self._search = search
+        names: Set[str] = set()
+        # the body is copied so that it can't be changed through the search
+        self._body = copy.deepcopy(search.to_dict())
+        self._build = _compile_value(self._body, names)
+        #: Names of the placeholders in the body.
+        self.params: FrozenSet[str] = frozenset(names)
+
+        # The JSON of the body is split around the placeholders, which are
+        # replaced by markers with their index in the list of names.
+        self._names = sorted(names)
+        body = self._fill({name: f"\0{i}\0" for i, name in enumerate(self._names)})
+        parts = _PLACEHOLDER_MARKER_RE.split(_serializer.json_dumps(body))
+        self._json_parts: List[bytes] = parts[::2]
+        self._json_names = [self._names[int(i)] for i in parts[1::2]]
+
+    def _fill(self, params: Mapping[str, Any]) -> Dict[str, Any]:
+        if self._build is None:
+            return self._body
+        return cast(Dict[str, Any], self._build(params))
+
+    def _check_params(self, params: Mapping[str, Any]) -> None:
+        if params.keys() != self.params:
+            missing = sorted(self.params - params.keys())
+            unknown = sorted(params.keys() - self.params)
+            raise ValueError(
+                f"Values of the placeholders don't match the compiled search, "
+                f"missing: {missing}, unknown: {unknown}"
+            )
+
+    def to_dict(self, **params: Any) -> Dict[str, Any]:
+        """
+        Return the body of the search with the placeholders replaced by the
+        values given as keyword arguments. The parts of the body without
+        placeholders are shared with the template and must not be modified.
+        """
+        self._check_params(params)
+        return self._fill(params)
+
+    def to_json(self, **params: Any) -> bytes:
+        """
+        Return the body of the search serialized to JSON with the placeholders
+        replaced by the values given as keyword arguments. Only the values are
+        serialized, the rest of the JSON was serialized when compiling.
+        """
+        self._check_params(params)
+        parts = [self._json_parts[0]]
+        for name, part in zip(self._json_names, self._json_parts[1:]):
+            parts.append(_serializer.json_dumps(params[name]))
+            parts.append(part)
+        return b"".join(parts)
+
+    def to_mustache(self) -> str:
+        """
+        Return the body as the source of a mustache search template, the
+        placeholders are converted to JSON with the ``toJson`` function::
+
+            client.put_script(
+                id="my-search",
+                script={"lang": "mustache", "source": compiled.to_mustache()},
+            )
+            client.search_template(id="my-search", params={"user_id": 42})
+        """
+        parts = [self._json_parts[0].decode()]
+        for name, part in zip(self._json_names, self._json_parts[1:]):
+            parts.append(f"{{{{#toJson}}}}{name}{{{{/toJson}}}}")
+            parts.append(part.decode())
+        return "".join(parts)
+
+
+# Index of the first search of a batch of a multi search,
+# its searches and the lines of the body sent for them.
+_MultiSearchBatch = Tuple[int, List[SearchBase[_R]], List[Any]]
+
+
 class MultiSearchBase(Request[_R]):
     """
     Combine multiple :class:`~elasticsearch.dsl.Search` objects into a single
     request.
     """
 
+    _copy_on_write = Request._copy_on_write + ("_searches",)
+
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
         self._searches: List[SearchBase[_R]] = []
@@ -1026,11 +1241,6 @@ class MultiSearchBase(Request[_R]):
     def __iter__(self) -> Iterator[SearchBase[_R]]:
         return iter(self._searches)
 
-    def _clone(self) -> Self:
-        ms = super()._clone()
-        ms._searches = self._searches[:]
-        return ms
-
     def add(self, search: SearchBase[_R]) -> Self:
         """
         Adds a new :class:`~elasticsearch.dsl.Search` object to the request::
@@ -1040,18 +1250,82 @@ class MultiSearchBase(Request[_R]):
             ms = ms.add(Search(doc_type=Blog))
         """
         ms = self._clone()
-        ms._searches.append(search)
+        ms._mutable("_searches").append(search)
         return ms
 
     def to_dict(self) -> List[Dict[str, Any]]:  # type: ignore[override]
         out: List[Dict[str, Any]] = []
         for s in self._searches:
-            meta: Dict[str, Any] = {}
-            if s._index:
-                meta["index"] = cast(Any, s._index)
-            meta.update(s._params)
+            out.extend(self._search_lines(s))
 
-            out.append(meta)
-            out.append(s.to_dict())
+        return out
 
+    @staticmethod
+    def _search_lines(s: SearchBase[_R]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        meta: Dict[str, Any] = {}
+        if s._index:
+            meta["index"] = cast(Any, s._index)
+        meta.update(s._params)
+        return meta, s.to_dict()
+
+    def _batches(
+        self, batch_size: Optional[int], max_batch_bytes: Optional[int]
+    ) -> List[_MultiSearchBatch[_R]]:
+        """
+        Split the searches into batches of at most ``batch_size`` searches and
+        ``max_batch_bytes`` bytes of serialized body. A search larger than
+        ``max_batch_bytes`` is sent in a batch of its own.
+        """
+        if batch_size is None and max_batch_bytes is None:
+            return [(0, self._searches, self.to_dict())]
+        if (batch_size is not None and batch_size < 1) or (
+            max_batch_bytes is not None and max_batch_bytes < 1
+        ):
+            raise ValueError("batch_size and max_batch_bytes must be positive")
+
+        batches: List[_MultiSearchBatch[_R]] = []
+        start = 0
+        searches: List[SearchBase[_R]] = []
+        lines: List[Any] = []
+        size = 0
+        for i, s in enumerate(self._searches):
+            meta, body = self._search_lines(s)
+            search_lines: List[Any] = [meta, body]
+            search_size = 0
+            if max_batch_bytes is not None:
+                # the lines are serialized once to measure them and
+                # sent as they are, +1 for each newline of the body
+                search_lines = [
+                    _serializer.json_dumps(meta),
+                    _serializer.json_dumps(body),
+                ]
+                search_size = sum(len(line) + 1 for line in search_lines)
+            if searches and (
+                (batch_size is not None and len(searches) >= batch_size)
+                or (
+                    max_batch_bytes is not None and size + search_size > max_batch_bytes
+                )
+            ):
+                batches.append((start, searches, lines))
+                start, searches, lines, size = i, [], [], 0
+            searches.append(s)
+            lines.extend(search_lines)
+            size += search_size
+        if searches:
+            batches.append((start, searches, lines))
+        return batches
+
+    @staticmethod
+    def _batch_responses(
+        batch: _MultiSearchBatch[_R], responses: Any, raise_on_error: bool
+    ) -> List[Tuple[int, Optional[Response[_R]]]]:
+        start, searches, _ = batch
+        out: List[Tuple[int, Optional[Response[_R]]]] = []
+        for i, (s, r) in enumerate(zip(searches, responses["responses"])):
+            if r.get("error", False):
+                if raise_on_error:
+                    raise ApiError("N/A", meta=responses.meta, body=r)
+                out.append((start + i, None))
+            else:
+                out.append((start + i, Response(s, r)))
         return out
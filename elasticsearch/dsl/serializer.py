@@ -24,7 +24,7 @@ from .utils import AttrList
 class AttrJSONSerializer(JSONSerializer):
     def default(self, data: Any) -> Any:
         if isinstance(data, AttrList):
-            return data._l_
+            return data.to_list()
         if hasattr(data, "to_dict"):
             return data.to_dict()
         return super().default(data)
@@ -27,6 +27,7 @@ from .utils import _R, recursive_to_dict
 
 class UpdateByQueryBase(Request[_R]):
     query = ProxyDescriptor[Self]("query")
+    _copy_on_write = Request._copy_on_write + ("_script",)
 
     def __init__(self, **kwargs: Any):
         """
@@ -75,15 +76,13 @@ class UpdateByQueryBase(Request[_R]):
 
     def _clone(self) -> Self:
         """
-        Return a clone of the current search request. Performs a shallow copy
-        of all the underlying objects. Used internally by most state modifying
-        APIs.
+        Return a clone of the current search request. The underlying objects
+        are shared with the clone and copied once either request modifies them.
+        Used internally by most state modifying APIs.
         """
         ubq = super()._clone()
 
-        ubq._response_class = self._response_class
-        ubq._script = self._script.copy()
-        ubq.query._proxied = self.query._proxied
+        ubq._query_proxy = self._query_proxy._copy_for(ubq)
         return ubq
 
     def response_class(self, cls: Type[UpdateByQueryResponse[_R]]) -> Self:
@@ -104,7 +103,7 @@ class UpdateByQueryBase(Request[_R]):
             self.query._proxied = Q(d.pop("query"))
         if "script" in d:
             self._script = d.pop("script")
-        self._extra.update(d)
+        self._mutable("_extra").update(d)
         return self
 
     def script(self, **kwargs: Any) -> Self:
@@ -127,7 +126,7 @@ class UpdateByQueryBase(Request[_R]):
         ubq = self._clone()
         if ubq._script:
             ubq._script = {}
-        ubq._script.update(kwargs)
+        ubq._mutable("_script").update(kwargs)
         return ubq
 
     def to_dict(self, **kwargs: Any) -> Dict[str, Any]:
@@ -48,6 +48,7 @@ if TYPE_CHECKING:
     from .document_base import DocumentOptions
     from .field import Field
     from .index_base import IndexBase
+    from .mapping_base import MappingBase
     from .response import Hit  # noqa: F401
     from .types import Hit as HitBaseType
 
@@ -82,17 +83,35 @@ META_FIELDS = frozenset(
 
 
 def _wrap(val: Any, obj_wrapper: Optional[Callable[[Any], Any]] = None) -> Any:
-    if isinstance(val, dict):
-        return AttrDict(val) if obj_wrapper is None else obj_wrapper(val)
+    # Any mapping is wrapped, ie the lazily decoded objects of a response.
+    if isinstance(val, collections.abc.Mapping):
+        if obj_wrapper is None:
+            return AttrDict(cast(Dict[str, Any], val))
+        return obj_wrapper(val)
     if isinstance(val, list):
         return AttrList(val)
     return val
 
 
+def _wrap_cached(
+    cache: Dict[Any, Tuple[Any, Any]],
+    key: Any,
+    val: Any,
+    obj_wrapper: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    # wrappers are reused for as long as the wrapped value isn't replaced
+    cached = cache.get(key)
+    if cached is not None and cached[0] is val:
+        return cached[1]
+    wrapped = _wrap(val, obj_wrapper)
+    cache[key] = (val, wrapped)
+    return wrapped
+
+
 def _recursive_to_dict(value: Any) -> Any:
     if hasattr(value, "to_dict"):
         return value.to_dict()
-    elif isinstance(value, dict) or isinstance(value, AttrDict):
+    elif isinstance(value, (collections.abc.Mapping, AttrDict)):
         return {k: _recursive_to_dict(v) for k, v in value.items()}
     elif isinstance(value, list) or isinstance(value, AttrList):
         return [recursive_to_dict(elem) for elem in value]
@@ -101,6 +120,10 @@ def _recursive_to_dict(value: Any) -> Any:
 
 
 class AttrList(Generic[_ValT]):
+    __slots__ = ("_l_", "_obj_wrapper", "_w_")
+
+    _w_: Optional[Dict[int, Tuple[Any, Any]]]
+
     def __init__(
         self, l: List[_ValT], obj_wrapper: Optional[Callable[[_ValT], Any]] = None
     ):
@@ -109,6 +132,8 @@ class AttrList(Generic[_ValT]):
             l = list(l)
         self._l_ = l
         self._obj_wrapper = obj_wrapper
+        # wrappers of the dict and list items by index
+        self._w_ = None
 
     def __repr__(self) -> str:
         return repr(self._l_)
@@ -126,13 +151,22 @@ class AttrList(Generic[_ValT]):
         l = self._l_[k]
         if isinstance(k, slice):
             return AttrList[_ValT](l, obj_wrapper=self._obj_wrapper)  # type: ignore[arg-type]
-        return _wrap(l, self._obj_wrapper)
+        if not isinstance(l, (collections.abc.Mapping, list)):
+            return l
+        if self._w_ is None:
+            self._w_ = {}
+        return _wrap_cached(self._w_, k % len(self._l_), l, self._obj_wrapper)
 
     def __setitem__(self, k: int, value: _ValT) -> None:
         self._l_[k] = value
 
     def __iter__(self) -> Iterator[Any]:
-        return map(lambda i: _wrap(i, self._obj_wrapper), self._l_)
+        for i, value in enumerate(self._l_):
+            if isinstance(value, (collections.abc.Mapping, list)):
+                if self._w_ is None:
+                    self._w_ = {}
+                value = _wrap_cached(self._w_, i, value, self._obj_wrapper)
+            yield value
 
     def __len__(self) -> int:
         return len(self._l_)
@@ -152,10 +186,14 @@ class AttrList(Generic[_ValT]):
         self, state: Tuple[List[_ValT], Optional[Callable[[_ValT], Any]]]
     ) -> None:
         self._l_, self._obj_wrapper = state
+        self._w_ = None
 
     def to_list(self) -> List[_ValT]:
         return self._l_
 
+    def _wrapped(self) -> List[_ValT]:
+        return self._l_
+
 
 class AttrDict(Generic[_ValT]):
     """
@@ -164,12 +202,17 @@ class AttrDict(Generic[_ValT]):
     nested dsl dicts.
     """
 
+    __slots__ = ("_d_", "_w_")
+
     _d_: Dict[str, _ValT]
+    _w_: Optional[Dict[str, Any]]
     RESERVED: Dict[str, str] = {"from_": "from"}
 
     def __init__(self, d: Dict[str, _ValT]):
         # assign the inner dict manually to prevent __setattr__ from firing
         super().__setattr__("_d_", d)
+        # wrappers of the dict and list values by key
+        super().__setattr__("_w_", None)
 
     def __contains__(self, key: object) -> bool:
         return key in self._d_
@@ -203,6 +246,7 @@ class AttrDict(Generic[_ValT]):
 
     def __setstate__(self, state: Tuple[Dict[str, _ValT]]) -> None:
         super().__setattr__("_d_", state[0])
+        super().__setattr__("_w_", None)
 
     def __getattr__(self, attr_name: str) -> Any:
         try:
@@ -221,7 +265,24 @@ class AttrDict(Generic[_ValT]):
             )
 
     def __getitem__(self, key: str) -> Any:
-        return _wrap(self._d_[self.RESERVED.get(key, key)])
+        key = self.RESERVED.get(key, key)
+        value = self._d_[key]
+        if isinstance(value, collections.abc.Mapping):
+            wrapper_class: Any = AttrDict
+        elif isinstance(value, list):
+            wrapper_class = AttrList
+        else:
+            return value
+
+        # wrappers are reused for as long as the wrapped value isn't replaced
+        cache = self._w_
+        if cache is None:
+            cache = {}
+            super().__setattr__("_w_", cache)
+        wrapped = cache.get(key)
+        if wrapped is None or wrapped._wrapped() is not value:
+            wrapped = cache[key] = wrapper_class(value)
+        return wrapped
 
     def __setitem__(self, key: str, value: _ValT) -> None:
         self._d_[self.RESERVED.get(key, key)] = value
@@ -254,6 +315,9 @@ class AttrDict(Generic[_ValT]):
     def __iter__(self) -> Iterator[str]:
         return iter(self._d_)
 
+    def _wrapped(self) -> Dict[str, _ValT]:
+        return self._d_
+
     def to_dict(self, recursive: bool = False) -> Dict[str, _ValT]:
         return cast(
             Dict[str, _ValT], _recursive_to_dict(self._d_) if recursive else self._d_
@@ -487,7 +551,14 @@ else:
     HitMetaBase = AttrDict[Any]
 
 
+# Keys of hits without the leading underscore, so that all
+# the HitMeta instances share the same key strings.
+_hit_meta_keys: Dict[str, str] = {}
+
+
 class HitMeta(HitMetaBase):
+    __slots__ = ()
+
     inner_hits: Mapping[str, Any]
 
     def __init__(
@@ -495,17 +566,95 @@ class HitMeta(HitMetaBase):
         document: Dict[str, Any],
         exclude: Tuple[str, ...] = ("_source", "_fields"),
     ):
-        d = {
-            k[1:] if k.startswith("_") else k: v
-            for (k, v) in document.items()
-            if k not in exclude
-        }
+        d = {}
+        for k, v in document.items():
+            if k not in exclude:
+                key = _hit_meta_keys.get(k)
+                if key is None:
+                    key = k[1:] if k.startswith("_") else k
+                    if len(_hit_meta_keys) < 1000:
+                        _hit_meta_keys[k] = key
+                d[key] = v
         if "type" in d:
             # make sure we are consistent everywhere in python
             d["doc_type"] = d.pop("type")
         super().__init__(d)
 
 
+class _MappingVersion:
+    """
+    Counts the changes to the fields of a mapping, the serialization plans
+    compiled from the mapping are rebuilt when it changes. Clones of a
+    mapping share its fields and so share its version.
+    """
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
+def _mapping_versions(
+    doc_mapping: "MappingBase", index_mapping: Optional["MappingBase"]
+) -> Tuple[int, int]:
+    return (
+        doc_mapping.properties._version.value,
+        index_mapping.properties._version.value if index_mapping else -1,
+    )
+
+
+class _SerializationPlan:
+    """
+    The fields of an ``ObjectBase`` subclass compiled into lookup tables so
+    documents are (de)serialized without searching the mappings for each key.
+    """
+
+    def __init__(
+        self,
+        cls: Type["ObjectBase"],
+        list_fields: List[Tuple[str, "Field", bool]],
+        index_mapping: Optional["MappingBase"],
+    ):
+        doc_mapping = cls._doc_type.mapping
+        self.versions = _mapping_versions(doc_mapping, index_mapping)
+        self.index_mapping = index_mapping
+        self.list_fields = list_fields
+
+        # fields by attribute name, fields of the index come second
+        self.fields: Dict[str, "Field"] = {
+            name: doc_mapping[name] for name in doc_mapping
+        }
+        if index_mapping:
+            for name in index_mapping:
+                self.fields.setdefault(name, index_mapping[name])
+
+        # the attribute and field of each key in the source of a document,
+        # fields found by attribute name take precedence over renamed fields
+        attributes: Dict[str, Tuple[str, "Field"]] = {}
+        for name, field, _ in list_fields:
+            es_name = getattr(field, "_es_name", None)
+            if es_name:
+                attributes.setdefault(es_name, (name, field))
+        attributes.update((name, (name, field)) for name, field in self.fields.items())
+
+        # values of fields in the document's mapping can be stored directly
+        # unless a subclass customized how attributes are set
+        direct_setattr = cls.__setattr__ is ObjectBase.__setattr__
+        self.from_es: Dict[str, Tuple[str, Optional[Callable[[Any], Any]], bool]] = {
+            key: (
+                name,
+                field.deserialize if field._coerce else None,
+                direct_setattr and name in doc_mapping,
+            )
+            for key, (name, field) in attributes.items()
+        }
+        self.to_es: Dict[str, Tuple[str, Optional[Callable[..., Any]]]] = {
+            name: (
+                getattr(field, "_es_name", None) or name,
+                field.serialize if field._coerce else None,
+            )
+            for name, field in self.fields.items()
+        }
+
+
 class ObjectBase(AttrDict[Any]):
     _doc_type: "DocumentOptions"
     _index: "IndexBase"
@@ -552,24 +701,21 @@ class ObjectBase(AttrDict[Any]):
                 yield name, field, True
 
     @classmethod
-    def __get_field(cls, name: str) -> Optional["Field"]:
-        try:
-            return cls._doc_type.mapping[name]
-        except KeyError:
-            # fallback to fields on the Index
-            if hasattr(cls, "_index") and cls._index._mapping:
-                try:
-                    return cls._index._mapping[name]
-                except KeyError:
-                    pass
-            return None
-
-    @classmethod
-    def __get_renamed_field(cls, name: str) -> Optional[Tuple[str, "Field"]]:
-        for k, v, _ in cls.__list_fields():
-            if hasattr(v, "_es_name") and v._es_name == name:
-                return k, v
-        return None
+    def __get_plan(cls) -> "_SerializationPlan":
+        """
+        Get the compiled serialization plan of the class, it is rebuilt when
+        the mapping of the document or the index changes.
+        """
+        index_mapping = cls._index._mapping if hasattr(cls, "_index") else None
+        plan = cls._doc_type._serialization_plan
+        if (
+            plan is None
+            or plan.index_mapping is not index_mapping
+            or plan.versions != _mapping_versions(cls._doc_type.mapping, index_mapping)
+        ):
+            plan = _SerializationPlan(cls, list(cls.__list_fields()), index_mapping)
+            cls._doc_type._serialization_plan = plan
+        return plan
 
     @classmethod
     def from_es(cls, hit: Union[Dict[str, Any], "ObjectApiResponse[Any]"]) -> Self:
@@ -580,24 +726,27 @@ class ObjectBase(AttrDict[Any]):
         return doc
 
     def _from_dict(self, data: Dict[str, Any]) -> None:
+        from_es = self.__get_plan().from_es
+        d = self._d_
         for k, v in data.items():
-            f = self.__get_field(k)
-            if f is None:
-                r = self.__get_renamed_field(k)
-                if r:
-                    k, f = r
-            if f and f._coerce:
-                v = f.deserialize(v)
-                if hasattr(f, "_es_name") and f._es_name == k:
-                    f = f
-            setattr(self, k, v)
+            step = from_es.get(k)
+            if step is None:
+                setattr(self, k, v)
+                continue
+            name, deserialize, direct = step
+            if deserialize is not None:
+                v = deserialize(v)
+            if direct:
+                d[name] = v
+            else:
+                setattr(self, name, v)
 
     def __getstate__(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:  # type: ignore[override]
         return self.to_dict(), self.meta._d_
 
     def __setstate__(self, state: Tuple[Dict[str, Any], Dict[str, Any]]) -> None:  # type: ignore[override]
         data, meta = state
-        super(AttrDict, self).__setattr__("_d_", {})
+        super().__setstate__(({},))
         super(AttrDict, self).__setattr__("meta", HitMeta(meta))
         self._from_dict(data)
 
@@ -605,7 +754,7 @@ class ObjectBase(AttrDict[Any]):
         try:
             return super().__getattr__(name)
         except AttributeError:
-            f = self.__get_field(name)
+            f = self.__get_plan().fields.get(name)
             if f is not None and hasattr(f, "empty"):
                 value = f.empty()
                 if value not in SKIP_VALUES:
@@ -621,19 +770,20 @@ class ObjectBase(AttrDict[Any]):
             super().__setattr__(name, value)
 
     def to_dict(self, skip_empty: bool = True) -> Dict[str, Any]:
+        to_es = self.__get_plan().to_es
         out = {}
         for k, v in self._d_.items():
-            # if this is a mapped field,
-            f = self.__get_field(k)
+            # if this is a mapped field, rename and serialize it
+            step = to_es.get(k)
             name = k
-            if f is not None and hasattr(f, "_es_name") and f._es_name:
-                name = f._es_name
-            if f and f._coerce:
-                v = f.serialize(v, skip_empty=skip_empty)
+            if step is not None:
+                name, serialize = step
+                if serialize is not None:
+                    v = serialize(v, skip_empty=skip_empty)
 
             # if someone assigned AttrList, unwrap it
             if isinstance(v, AttrList):
-                v = v._l_
+                v = v.to_list()
 
             if skip_empty:
                 # don't serialize empty values
@@ -655,7 +805,7 @@ class ObjectBase(AttrDict[Any]):
 
     def clean_fields(self, validate: bool = True) -> None:
         errors: Dict[str, List[ValidationException]] = {}
-        for name, field, optional in self.__list_fields():
+        for name, field, optional in self.__get_plan().list_fields:
             data = self._d_.get(name, None)
             if data is None and optional:
                 continue
@@ -675,6 +825,11 @@ class ObjectBase(AttrDict[Any]):
         pass
 
     def full_clean(self) -> None:
+        if type(self).clean is ObjectBase.clean:
+            # without a custom clean() a second pass over the fields would
+            # clean the same values again
+            self.clean_fields(validate=True)
+            return
         self.clean_fields(validate=False)
         self.clean()
         self.clean_fields(validate=True)
@@ -712,11 +867,11 @@ def recursive_to_dict(data: Any) -> Any:
     tuple, and Mapping types.
     """
     if isinstance(data, AttrList):
-        data = list(data._l_)
+        data = list(data.to_list())
     elif hasattr(data, "to_dict"):
         data = data.to_dict()
     if isinstance(data, (list, tuple)):
         return type(data)(recursive_to_dict(inner) for inner in data)
-    elif isinstance(data, dict):
+    elif isinstance(data, collections.abc.Mapping):
         return {key: recursive_to_dict(val) for key, val in data.items()}
     return data
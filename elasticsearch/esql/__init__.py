@@ -16,4 +16,5 @@
 #  under the License.
 
 from ..dsl import E  # noqa: F401
+from .arrow import to_pandas, to_polars  # noqa: F401
 from .esql import ESQL, ESQLBase, and_, not_, or_  # noqa: F401
@@ -0,0 +1,80 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import importlib
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+__all__ = ["to_pandas", "to_polars"]
+
+
+def _import(package: str) -> Any:
+    try:
+        return importlib.import_module(package)
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            f"Failed to import '{package}', it is required for Arrow results of "
+            f"ES|QL queries. You can install it with `pip install {package}`"
+        ) from e
+
+
+def _record_batch_reader(table: Any) -> "pa.RecordBatchReader":
+    """Returns a reader of the record batches of an Arrow table
+    received from Elasticsearch. The batches aren't copied.
+    """
+    pa = _import("pyarrow")
+    return pa.RecordBatchReader.from_batches(table.schema, table.to_batches())
+
+
+def _to_table(data: Union["pa.RecordBatchReader", "pa.Table"]) -> "pa.Table":
+    read_all = getattr(data, "read_all", None)
+    return read_all() if read_all is not None else data
+
+
+def to_pandas(
+    data: Union["pa.RecordBatchReader", "pa.Table"], *, arrow_dtypes: bool = True
+) -> "pd.DataFrame":
+    """Converts the Arrow results of an ES|QL query to a pandas DataFrame.
+
+    .. code-block:: python
+
+        reader = client.esql.query_arrow(query="FROM logs | LIMIT 1000000")
+        df = to_pandas(reader)
+
+    :arg data: Result of ``client.esql.query_arrow()`` or an Arrow table.
+    :arg arrow_dtypes: Use pandas' Arrow-backed dtypes so that the columns
+        aren't copied or converted. Otherwise columns use the numpy dtypes.
+    """
+    pd = _import("pandas")
+    table = _to_table(data)
+    if arrow_dtypes:
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
+
+
+def to_polars(data: Union["pa.RecordBatchReader", "pa.Table"]) -> "pl.DataFrame":
+    """Converts the Arrow results of an ES|QL query to a polars DataFrame.
+    Columns are converted without copying where polars supports it.
+
+    :arg data: Result of ``client.esql.query_arrow()`` or an Arrow table.
+    """
+    pl = _import("polars")
+    return pl.from_arrow(_to_table(data))
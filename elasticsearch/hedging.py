@@ -0,0 +1,118 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+from collections import deque
+from typing import Collection, Deque, Dict, Optional
+
+__all__ = ["DEFAULT_HEDGED_ENDPOINTS", "HedgingPolicy"]
+
+# Idempotent read endpoints which are hedged by default.
+DEFAULT_HEDGED_ENDPOINTS = frozenset(("count", "get", "mget", "msearch", "search"))
+
+
+class _LatencyWindow:
+    def __init__(self, size: int) -> None:
+        self.durations: Deque[float] = deque(maxlen=size)
+        # Sorting the window is only done every few observations.
+        self.delay: Optional[float] = None
+        self.observations_since_delay = 0
+
+
+class HedgingPolicy:
+    """Sends a second ('hedged') request for slow requests to read endpoints.
+
+    Pass an instance to the ``hedging`` parameter of
+    :class:`~elasticsearch.Elasticsearch` or
+    :meth:`~elasticsearch.Elasticsearch.options`. If no response has been
+    received after the given ``percentile`` of recent latencies of the
+    endpoint a duplicate request is sent and the first successful response
+    wins. The asynchronous client cancels the slower request, the
+    synchronous client sends both requests from a thread pool and
+    discards the response of the slower request.
+
+    The hedged request avoids the node of the first request if another
+    node is available. This needs a
+    :class:`~elasticsearch.node_selector.RoutingSelector`, which is the
+    default node selector of clients created with ``hedging``.
+
+    :arg percentile: Percentile of recent latencies of the endpoint after
+        which a hedged request is sent. Defaults to the 95th percentile.
+    :arg delay: Fixed number of seconds after which a hedged
+        request is sent, instead of using a percentile.
+    :arg initial_delay: Number of seconds after which a hedged request is sent
+        until ``min_samples`` latencies have been recorded for an endpoint.
+    :arg min_samples: Number of latencies needed before using the percentile.
+    :arg window_size: Number of recent latencies kept per endpoint.
+    :arg endpoints: Endpoint IDs (ie ``search`` or ``mget``) whose requests are
+        hedged. Only add endpoints that are safe to send twice. Defaults to
+        ``search``, ``get``, ``mget``, ``msearch`` and ``count``.
+    """
+
+    _recompute_every = 16
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        delay: Optional[float] = None,
+        initial_delay: float = 0.1,
+        min_samples: int = 20,
+        window_size: int = 1000,
+        endpoints: Collection[str] = DEFAULT_HEDGED_ENDPOINTS,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("'percentile' must be between 0 and 100")
+        self.percentile = percentile
+        self.fixed_delay = delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self.endpoints = frozenset(endpoints)
+        self._lock = threading.Lock()
+        self._windows: Dict[str, _LatencyWindow] = {}
+
+    def is_hedged_endpoint(self, endpoint_id: Optional[str]) -> bool:
+        return endpoint_id in self.endpoints
+
+    def delay(self, endpoint_id: str) -> float:
+        """Number of seconds to wait for a response before hedging"""
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        with self._lock:
+            window = self._windows.get(endpoint_id)
+            if window is None or len(window.durations) < self.min_samples:
+                return self.initial_delay
+            if (
+                window.delay is None
+                or window.observations_since_delay >= self._recompute_every
+            ):
+                durations = sorted(window.durations)
+                index = int(len(durations) * self.percentile / 100)
+                window.delay = durations[min(index, len(durations) - 1)]
+                window.observations_since_delay = 0
+            return window.delay
+
+    def observe(self, endpoint_id: str, duration: float) -> None:
+        """Records the latency of a successful request"""
+        if self.fixed_delay is not None:
+            return
+        with self._lock:
+            window = self._windows.get(endpoint_id)
+            if window is None:
+                window = self._windows[endpoint_id] = _LatencyWindow(self.window_size)
+            window.durations.append(duration)
+            window.observations_since_delay += 1
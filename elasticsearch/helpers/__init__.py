@@ -15,7 +15,13 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
-from .._async.helpers import async_bulk, async_reindex, async_scan, async_streaming_bulk
+from .._async.helpers import (
+    async_bulk,
+    async_parallel_bulk,
+    async_reindex,
+    async_scan,
+    async_streaming_bulk,
+)
 from .._utils import fixup_module_metadata
 from .actions import _chunk_actions  # noqa: F401
 from .actions import _process_bulk_chunk  # noqa: F401
@@ -24,6 +30,7 @@ from .actions import (
     bulk,
     expand_action,
     pack_dense_vector,
+    pack_dense_vectors,
     parallel_bulk,
     reindex,
     scan,
@@ -39,6 +46,7 @@ __all__ = [
     "streaming_bulk",
     "bulk",
     "pack_dense_vector",
+    "pack_dense_vectors",
     "parallel_bulk",
     "scan",
     "reindex",
@@ -46,6 +54,7 @@ __all__ = [
     "async_bulk",
     "async_reindex",
     "async_streaming_bulk",
+    "async_parallel_bulk",
 ]
 
 fixup_module_metadata(__name__, globals())
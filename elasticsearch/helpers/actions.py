@@ -16,6 +16,7 @@
 #  under the License.
 
 import base64
+import binascii
 import logging
 import queue
 import time
@@ -144,11 +145,16 @@ def expand_action(data: _TYPE_BULK_ACTION) -> _TYPE_BULK_ACTION_HEADER_AND_BODY:
 
 class _ActionChunker:
     def __init__(
-        self, chunk_size: int, max_chunk_bytes: int, serializer: Serializer
+        self,
+        chunk_size: int,
+        max_chunk_bytes: int,
+        serializer: Serializer,
+        pack_vectors: bool = False,
     ) -> None:
         self.chunk_size = chunk_size
         self.max_chunk_bytes = max_chunk_bytes
         self.serializer = serializer
+        self.pack_vectors = pack_vectors
 
         self.size = 0
         self.action_count = 0
@@ -185,6 +191,8 @@ class _ActionChunker:
             cur_size = len(action_bytes) + 1
 
             if data is not None:
+                if self.pack_vectors and isinstance(data, dict):
+                    data = _pack_vectors(data)
                 data_bytes = to_bytes(self.serializer.dumps(data), "utf-8")
                 cur_size += len(data_bytes) + 1
             else:
@@ -241,6 +249,7 @@ def _chunk_actions(
     max_chunk_bytes: int,
     flush_after_seconds: Optional[float],
     serializer: Serializer,
+    pack_vectors: bool = False,
 ) -> Iterable[
     Tuple[
         List[
@@ -257,7 +266,10 @@ def _chunk_actions(
     the process.
     """
     chunker = _ActionChunker(
-        chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes, serializer=serializer
+        chunk_size=chunk_size,
+        max_chunk_bytes=max_chunk_bytes,
+        serializer=serializer,
+        pack_vectors=pack_vectors,
     )
 
     if not flush_after_seconds:
@@ -437,6 +449,7 @@ def streaming_bulk(
     retry_on_status: Union[int, Collection[int]] = (429,),
     span_name: str = "helpers.streaming_bulk",
     *args: Any,
+    pack_vectors: bool = False,
     **kwargs: Any,
 ) -> Iterable[Tuple[bool, Dict[str, Any]]]:
     """
@@ -478,6 +491,9 @@ def streaming_bulk(
     :arg max_backoff: maximum number of seconds a retry will wait
     :arg yield_ok: if set to False will skip successful documents in the output
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg pack_vectors: pack the float32 numpy arrays of documents with
+        :func:`~elasticsearch.helpers.pack_dense_vector`. Only use it when
+        these arrays are indexed into ``dense_vector`` fields of type ``float``.
     """
     with client._otel.helpers_span(span_name) as otel_span:
         client = client.options()
@@ -486,7 +502,7 @@ def streaming_bulk(
         if isinstance(retry_on_status, int):
             retry_on_status = (retry_on_status,)
 
-        serializer = client.transport.serializers.get_serializer("application/json")
+        serializer = client._json_serializer("bulk")
 
         def expand_action_with_meta(
             data: _TYPE_BULK_ACTION_WITH_META,
@@ -508,6 +524,7 @@ def streaming_bulk(
             max_chunk_bytes,
             flush_after_seconds,
             serializer,
+            pack_vectors,
         ):
             for attempt in range(max_retries + 1):
                 to_retry: List[bytes] = []
@@ -635,6 +652,7 @@ def parallel_bulk(
     ] = expand_action,
     ignore_status: Union[int, Collection[int]] = (),
     *args: Any,
+    pack_vectors: bool = False,
     **kwargs: Any,
 ) -> Iterable[Tuple[bool, Any]]:
     """
@@ -658,13 +676,16 @@ def parallel_bulk(
     :arg queue_size: size of the task queue between the main thread (producing
         chunks to send) and the processing threads.
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg pack_vectors: pack the float32 numpy arrays of documents with
+        :func:`~elasticsearch.helpers.pack_dense_vector`. Only use it when
+        these arrays are indexed into ``dense_vector`` fields of type ``float``.
     """
     # Avoid importing multiprocessing unless parallel_bulk is used
     # to avoid exceptions on restricted environments like App Engine
     from multiprocessing.pool import ThreadPool
 
     expanded_actions = map(expand_action_callback, actions)
-    serializer = client.transport.serializers.get_serializer("application/json")
+    serializer = client._json_serializer("bulk")
 
     class BlockingPool(ThreadPool):
         def _setup_queues(self) -> None:
@@ -705,6 +726,7 @@ def parallel_bulk(
                     max_chunk_bytes,
                     flush_after_seconds,
                     serializer,
+                    pack_vectors,
                 ),
             ):
                 yield from result
@@ -723,12 +745,77 @@ def pack_dense_vector(vector: Union["np.ndarray", Sequence[float]]) -> str:
 
     if type(vector) is not np.ndarray:
         vector = np.array(vector, dtype=np.float32)
-    elif vector.dtype != np.float32:
+    elif vector.dtype.name != "float32":
         raise ValueError("Only arrays of type float32 can be packed")
-    byte_array = vector.byteswap().tobytes()
+    byte_array = vector.astype(">f4").tobytes()
     return base64.b64encode(byte_array).decode()
 
 
+def pack_dense_vectors(
+    vectors: Union["np.ndarray", Sequence[Sequence[float]]],
+) -> List[str]:
+    """Helper function that packs many dense vectors for efficient uploading.
+
+    The rows of the 2-D array are converted and encoded together instead of
+    one at a time, which is faster than calling
+    :func:`~elasticsearch.helpers.pack_dense_vector` for each of them.
+
+    :arg vectors: the 2-D numpy array or list of vectors to pack, one per row.
+    """
+    import numpy as np
+
+    if type(vectors) is not np.ndarray:
+        vectors = np.array(vectors, dtype=np.float32)
+    elif vectors.dtype.name != "float32":
+        raise ValueError("Only arrays of type float32 can be packed")
+    if vectors.ndim != 2:
+        raise ValueError("Only 2-D arrays of vectors can be packed")
+
+    # One conversion to big-endian for all rows, then each row
+    # is encoded from a view of the converted buffer.
+    byte_array = memoryview(vectors.astype(">f4").tobytes())
+    row_bytes = vectors.shape[1] * 4
+    if not row_bytes:
+        return [""] * vectors.shape[0]
+    return [
+        binascii.b2a_base64(
+            byte_array[start : start + row_bytes], newline=False
+        ).decode()
+        for start in range(0, len(byte_array), row_bytes)
+    ]
+
+
+def _is_float32_vector(value: Any) -> bool:
+    # Checks the module first to avoid importing numpy.
+    return (
+        type(value).__module__ == "numpy"
+        and type(value).__name__ == "ndarray"
+        and value.ndim == 1
+        and value.dtype.name == "float32"
+    )
+
+
+def _pack_vectors(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the document with its float32 numpy vectors packed,
+    the document is copied instead of modified when there are any.
+    """
+    packed: Optional[Dict[str, Any]] = None
+    for key, value in data.items():
+        if _is_float32_vector(value):
+            value = pack_dense_vector(value)
+        elif isinstance(value, dict):
+            nested = _pack_vectors(value)
+            if nested is value:
+                continue
+            value = nested
+        else:
+            continue
+        if packed is None:
+            packed = dict(data)
+        packed[key] = value
+    return data if packed is None else packed
+
+
 def scan(
     client: Elasticsearch,
     query: Optional[Any] = None,
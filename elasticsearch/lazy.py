@@ -0,0 +1,113 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+__all__ = ["LazyResponseBody"]
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None  # type: ignore[assignment]
+
+
+class _LazyObject(Mapping[str, Any]):
+    """Object of a document parsed by simdjson, its nested objects
+    are decoded when accessed and arrays are decoded completely.
+    """
+
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        value = self._obj[key]
+        if isinstance(value, simdjson.Object):
+            value = _LazyObject(value)
+        elif isinstance(value, simdjson.Array):
+            value = value.as_list()
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._obj.keys())
+
+    def __len__(self) -> int:
+        return len(self._obj)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return dict, (self.to_dict(),)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._obj.as_dict()  # type: ignore[no-any-return]
+
+
+class LazyResponseBody(Mapping[str, Any]):
+    """Body of a JSON response which is decoded when it's accessed.
+
+    If `pysimdjson <https://pypi.org/project/pysimdjson>`_ is installed the
+    body is parsed on-demand: only the accessed parts are decoded, nested
+    objects are decoded when they are accessed and arrays are decoded
+    completely. Otherwise the complete body is decoded on first access.
+
+    Returned by the JSON serializers for responses to requests
+    sent with ``.options(lazy_response=True)``.
+    """
+
+    def __init__(self, data: bytes, loads: Callable[[bytes], Any]) -> None:
+        self._data: Optional[bytes] = data
+        self._loads = loads
+        self._decoded: Optional[Mapping[str, Any]] = None
+
+    def _get_decoded(self) -> Mapping[str, Any]:
+        if self._decoded is None:
+            assert self._data is not None
+            if simdjson is not None:
+                self._decoded = _LazyObject(simdjson.Parser().parse(self._data))
+            else:
+                self._decoded = self._loads(self._data)
+            self._data = None
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        return self._get_decoded()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_decoded())
+
+    def __len__(self) -> int:
+        return len(self._get_decoded())
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return dict, (self.to_dict(),)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decodes the complete body"""
+        decoded = self._get_decoded()
+        if isinstance(decoded, _LazyObject):
+            return decoded.to_dict()
+        return dict(decoded)
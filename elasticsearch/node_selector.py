@@ -0,0 +1,300 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from elastic_transport import BaseNode, NodeConfig, NodeSelector
+
+__all__ = [
+    "COORDINATING_ONLY",
+    "LatencyAwareSelector",
+    "NodeRouting",
+    "RoutingSelector",
+]
+
+# Keys of 'NodeConfig._extras' holding the metadata of sniffed nodes.
+_ROLES_EXTRA = "_elasticsearch.roles"
+_ATTRIBUTES_EXTRA = "_elasticsearch.attributes"
+
+#: Pseudo-role matching nodes without any roles (coordinating-only nodes).
+COORDINATING_ONLY = "coordinating_only"
+
+
+def _node_roles(node_config: NodeConfig) -> Optional[Tuple[str, ...]]:
+    return node_config._extras.get(_ROLES_EXTRA)
+
+
+def _node_attributes(node_config: NodeConfig) -> Optional[Mapping[str, str]]:
+    return node_config._extras.get(_ATTRIBUTES_EXTRA)
+
+
+def _is_master_eligible(node: BaseNode) -> bool:
+    # Nodes with unknown roles are treated as master-eligible.
+    roles = _node_roles(node.config)
+    return roles is None or "master" in roles
+
+
+class NodeRouting:
+    """Routes requests to nodes with the given roles or attributes.
+
+    Pass an instance to the ``node_routing`` parameter of
+    :class:`~elasticsearch.Elasticsearch` or
+    :meth:`~elasticsearch.Elasticsearch.options`. Roles and attributes
+    are only known for nodes discovered by sniffing. Routing is a
+    preference: if no live node matches, any other live node is used.
+
+    .. code-block:: python
+
+        NodeRouting(
+            endpoint_roles={
+                "bulk": ["ingest"],
+                "search": [COORDINATING_ONLY],
+            },
+            prefer_attributes={"zone": "us-east-1a"},
+        )
+
+    :arg endpoint_roles: Mapping of endpoint IDs (ie ``bulk`` or ``search``)
+        to node roles. Requests to the endpoint prefer nodes with any of the
+        roles, use ``COORDINATING_ONLY`` for nodes without any roles.
+    :arg prefer_attributes: Node attributes (``node.attr.*`` settings)
+        of nodes to prefer for all requests, ie the availability zone.
+    """
+
+    def __init__(
+        self,
+        endpoint_roles: Optional[Mapping[str, Collection[str]]] = None,
+        prefer_attributes: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.endpoint_roles = {
+            endpoint_id: frozenset(roles)
+            for endpoint_id, roles in (endpoint_roles or {}).items()
+        }
+        self.prefer_attributes = dict(prefer_attributes or {})
+
+    def filter(
+        self, nodes: Sequence[BaseNode], endpoint_id: Optional[str]
+    ) -> Sequence[BaseNode]:
+        """Returns the nodes to choose from for a request to the endpoint"""
+        roles = self.endpoint_roles.get(endpoint_id) if endpoint_id else None
+        if roles:
+            nodes = [node for node in nodes if self._has_role(node, roles)] or nodes
+        if self.prefer_attributes:
+            nodes = [node for node in nodes if self._has_attributes(node)] or nodes
+        return nodes
+
+    @staticmethod
+    def _has_role(node: BaseNode, roles: Collection[str]) -> bool:
+        node_roles = _node_roles(node.config)
+        if node_roles is None:
+            return False
+        if not node_roles:
+            return COORDINATING_ONLY in roles
+        return any(role in roles for role in node_roles)
+
+    def _has_attributes(self, node: BaseNode) -> bool:
+        attributes = _node_attributes(node.config)
+        if attributes is None:
+            return False
+        return all(
+            attributes.get(name) == value
+            for name, value in self.prefer_attributes.items()
+        )
+
+
+class _RequestContext:
+    """State of the request of the current thread or task"""
+
+    def __init__(
+        self,
+        routing: Optional[NodeRouting],
+        endpoint_id: Optional[str],
+        avoid: Optional["_RequestContext"] = None,
+    ):
+        self.routing = routing
+        self.endpoint_id = endpoint_id
+        # Another request whose nodes aren't selected for
+        # this request if possible, ie for hedged requests.
+        self.avoid = avoid
+        # Nodes selected for the request along with the time they were selected.
+        self.selected: List[Tuple[NodeConfig, float]] = []
+
+
+_request_context: ContextVar[Optional[_RequestContext]] = ContextVar(
+    "_request_context", default=None
+)
+
+
+class RoutingSelector(NodeSelector):
+    """Selects nodes using round-robin out of the nodes
+    matching the :class:`~elasticsearch.node_selector.NodeRouting`
+    of the client sending the request.
+
+    Subclass and implement ``_select()`` to change how a node
+    is chosen out of the matching nodes.
+    """
+
+    def __init__(self, node_configs: List[NodeConfig]):
+        super().__init__(node_configs)
+        self._thread_local = threading.local()
+
+    def select(self, nodes: Sequence[BaseNode]) -> BaseNode:
+        context = _request_context.get()
+        if context is not None and context.routing is not None:
+            nodes = context.routing.filter(nodes, context.endpoint_id)
+        if context is not None and context.avoid is not None:
+            avoided = [node_config for node_config, _ in context.avoid.selected]
+            nodes = [node for node in nodes if node.config not in avoided] or nodes
+        node = self._select(nodes)
+        if context is not None:
+            self._on_selected(node.config, context)
+            context.selected.append((node.config, time.monotonic()))
+        return node
+
+    def _select(self, nodes: Sequence[BaseNode]) -> BaseNode:
+        index: int = (getattr(self._thread_local, "rr", -1) + 1) % len(nodes)
+        self._thread_local.rr = index
+        return nodes[index]
+
+    @contextmanager
+    def _track_request(
+        self,
+        routing: Optional[NodeRouting],
+        endpoint_id: Optional[str],
+        avoid: Optional[_RequestContext] = None,
+    ) -> Iterator[_RequestContext]:
+        """Routes and tracks requests sent within the context"""
+        context = _RequestContext(routing, endpoint_id, avoid)
+        token = _request_context.set(context)
+        try:
+            yield context
+        finally:
+            _request_context.reset(token)
+            if context.selected:
+                self._on_finished(context)
+
+    def _on_selected(self, node_config: NodeConfig, context: _RequestContext) -> None:
+        pass
+
+    def _on_finished(self, context: _RequestContext) -> None:
+        pass
+
+
+class _NodeStats:
+    def __init__(self) -> None:
+        self.ewma = 0.0
+        self.updated_at: Optional[float] = None
+        self.in_flight = 0
+
+
+class LatencyAwareSelector(RoutingSelector):
+    """Selects the node with the lower cost out of two randomly chosen
+    nodes ('power of two choices'). The cost of a node is the exponentially
+    weighted moving average (EWMA) of its recent latencies multiplied by
+    the number of requests in-flight to the node plus one.
+
+    Latencies are recorded for requests sent through the client. The
+    moving average decays while a node isn't used so a node that was
+    slow for a short time (ie during a garbage collection) is tried again.
+
+    Pass the class to the ``node_selector_class`` parameter
+    of :class:`~elasticsearch.Elasticsearch`. Subclass to
+    change ``alpha``, ``decay_time`` or ``master_eligible_weight``.
+    """
+
+    #: Weight of the most recent latency in the moving average.
+    alpha: float = 0.3
+    #: Number of seconds for the moving average of an unused node
+    #: to decay by a factor of e (~63%).
+    decay_time: float = 10.0
+    #: Factor of the cost of master-eligible nodes, ie ``2.0`` to only
+    #: choose them over another node when they are twice as fast. The
+    #: roles of nodes are known with sniffing, nodes with unknown roles
+    #: are treated as master-eligible.
+    master_eligible_weight: float = 1.0
+
+    def __init__(self, node_configs: List[NodeConfig]):
+        super().__init__(node_configs)
+        self._lock = threading.Lock()
+        self._stats: Dict[NodeConfig, _NodeStats] = {}
+
+    def _select(self, nodes: Sequence[BaseNode]) -> BaseNode:
+        if len(nodes) == 1:
+            return nodes[0]
+        now = time.monotonic()
+        first, second = random.sample(nodes, 2)
+        with self._lock:
+            if self._weighted_cost(first, now) <= self._weighted_cost(second, now):
+                return first
+            return second
+
+    def _on_selected(self, node_config: NodeConfig, context: _RequestContext) -> None:
+        with self._lock:
+            self._stats_for(node_config).in_flight += 1
+
+    def _on_finished(self, context: _RequestContext) -> None:
+        now = time.monotonic()
+        with self._lock:
+            # A retried attempt ended when the next node was selected.
+            ends = [started for _, started in context.selected[1:]] + [now]
+            for (node_config, started), ended in zip(context.selected, ends):
+                stats = self._stats_for(node_config)
+                stats.in_flight -= 1
+                if stats.updated_at is None:
+                    stats.ewma = ended - started
+                else:
+                    stats.ewma = self.alpha * (ended - started) + (
+                        1 - self.alpha
+                    ) * self._decayed_ewma(stats, now)
+                stats.updated_at = now
+
+    def _weighted_cost(self, node: BaseNode, now: float) -> float:
+        cost = self._cost(node.config, now)
+        if self.master_eligible_weight != 1.0 and _is_master_eligible(node):
+            cost *= self.master_eligible_weight
+        return cost
+
+    def _cost(self, node_config: NodeConfig, now: float) -> float:
+        stats = self._stats.get(node_config)
+        if stats is None:
+            return 0.0
+        return self._decayed_ewma(stats, now) * (stats.in_flight + 1)
+
+    def _decayed_ewma(self, stats: _NodeStats, now: float) -> float:
+        if stats.updated_at is None:
+            return 0.0
+        return stats.ewma * math.exp(-(now - stats.updated_at) / self.decay_time)
+
+    def _stats_for(self, node_config: NodeConfig) -> _NodeStats:
+        stats = self._stats.get(node_config)
+        if stats is None:
+            stats = self._stats[node_config] = _NodeStats()
+        return stats
@@ -15,17 +15,33 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import ipaddress
 import uuid
-from datetime import date, datetime
+from contextvars import ContextVar
+from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Any, ClassVar, Dict, Tuple
+from fractions import Fraction
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from elastic_transport import JsonSerializer as _JsonSerializer
 from elastic_transport import NdjsonSerializer as _NdjsonSerializer
 from elastic_transport import Serializer as Serializer
+from elastic_transport import SerializerCollection
 from elastic_transport import TextSerializer as TextSerializer
 
 from .exceptions import SerializationError
+from .lazy import LazyResponseBody
 
 INTEGER_TYPES = ()
 FLOAT_TYPES = (Decimal,)
@@ -49,6 +65,13 @@ except ImportError:
     _OrjsonSerializer = None  # type: ignore[assignment,misc]
 
 
+try:
+    import cbor2
+
+    __all__.extend(["CborSerializer", "CompatibilityModeCborSerializer"])
+except ImportError:
+    cbor2 = None  # type: ignore[assignment]
+
 try:
     import pyarrow as pa
 
@@ -57,40 +80,41 @@ except ImportError:
     pa = None  # type: ignore[assignment]
 
 
-class JsonSerializer(_JsonSerializer):
-    mimetype: ClassVar[str] = "application/json"
+# Set by the client while sending requests whose JSON response body is
+# returned as-is to be decoded incrementally ("raw") or is decoded when
+# it's accessed ("lazy") instead of being decoded by the serializer.
+_json_response_mode: ContextVar[Optional[str]] = ContextVar(
+    "_json_response_mode", default=None
+)
 
-    def default(self, data: Any) -> Any:
-        if isinstance(data, TIME_TYPES):
-            # Little hack to avoid importing pandas but to not
-            # return 'NaT' string for pd.NaT as that's not a valid
-            # Elasticsearch date.
-            formatted_data = data.isoformat()
-            if formatted_data != "NaT":
-                return formatted_data
-
-        if isinstance(data, uuid.UUID):
-            return str(data)
-        elif isinstance(data, FLOAT_TYPES):
-            return float(data)
 
-        # This is kept for backwards compatibility even
-        # if 'INTEGER_TYPES' isn't used by default anymore.
-        elif INTEGER_TYPES and isinstance(data, INTEGER_TYPES):
-            return int(data)
+class JsonSerializer(_JsonSerializer):
+    mimetype: ClassVar[str] = "application/json"
+    # Whether the JSON library encodes numpy arrays itself.
+    _native_numpy_arrays: ClassVar[bool] = False
 
-        # Special cases for numpy and pandas types
-        # These are expensive to import so we try them last.
-        serialized, value = _attempt_serialize_numpy_or_pandas(data)
-        if serialized:
-            return value
+    def loads(self, data: bytes) -> Any:
+        mode = _json_response_mode.get()
+        if mode == "raw":
+            return data
+        elif mode == "lazy" and data.lstrip()[:1] == b"{":
+            return LazyResponseBody(data, super().loads)
+        return super().loads(data)
 
-        raise TypeError(f"Unable to serialize {data!r} (type: {type(data)})")
+    def default(self, data: Any) -> Any:
+        encoder = _encoders_by_type[self._native_numpy_arrays].get(type(data))
+        if encoder is None:
+            encoder = _resolve_encoder(type(data), self._native_numpy_arrays)
+            if encoder is None:
+                raise TypeError(f"Unable to serialize {data!r} (type: {type(data)})")
+        return encoder(data)
 
 
 if _OrjsonSerializer is not None:
 
     class OrjsonSerializer(JsonSerializer, _OrjsonSerializer):
+        _native_numpy_arrays: ClassVar[bool] = True
+
         def default(self, data: Any) -> Any:
             return JsonSerializer.default(self, data)
 
@@ -101,6 +125,40 @@ class NdjsonSerializer(JsonSerializer, _NdjsonSerializer):
     def default(self, data: Any) -> Any:
         return JsonSerializer.default(self, data)
 
+    def dumps(self, data: Any) -> bytes:
+        if isinstance(data, (bytes, str)):
+            return super().dumps(data)
+
+        # Lines are joined once into a body of the exact size, instead of
+        # growing a buffer which is then copied again into the body. Lines
+        # already encoded to bytes (ie by the bulk helpers) aren't copied
+        # before being joined.
+        parts: List[bytes] = []
+        for line in data:
+            if isinstance(line, str):
+                line = line.encode("utf-8", "surrogatepass")
+            if isinstance(line, bytes):
+                parts.append(line)
+                # Ensure that there is always a final newline
+                if not line.endswith(b"\n"):
+                    parts.append(b"\n")
+                continue
+            try:
+                parts.append(self.json_dumps(line))
+            except (ValueError, UnicodeError, TypeError) as e:
+                raise SerializationError(
+                    message=f"Unable to serialize to NDJSON: {data!r} (type: {type(data).__name__})",
+                    errors=(e,),
+                )
+            parts.append(b"\n")
+        return b"".join(parts)
+
+
+if _OrjsonSerializer is not None:
+
+    class _OrjsonNdjsonSerializer(OrjsonSerializer, NdjsonSerializer):
+        mimetype: ClassVar[str] = "application/x-ndjson"
+
 
 class CompatibilityModeJsonSerializer(JsonSerializer):
     mimetype: ClassVar[str] = "application/vnd.elasticsearch+json"
@@ -122,6 +180,80 @@ class MapboxVectorTileSerializer(Serializer):
         raise SerializationError(f"Cannot serialize {data!r} into a MapBox vector tile")
 
 
+if cbor2 is not None:
+
+    class CborSerializer(Serializer):
+        """CBOR serializer relying on the cbor2 package.
+
+        Values without a CBOR encoding in cbor2 (ie numpy and pandas values)
+        and values cbor2 encodes with semantic tags (ie UUIDs, decimals, dates
+        and sets) are encoded like they are for JSON, so that documents are
+        indexed the same with both formats. Naive datetimes are encoded as UTC
+        which is how Elasticsearch interprets dates without a timezone.
+        """
+
+        mimetype: ClassVar[str] = "application/cbor"
+        _native_numpy_arrays: ClassVar[bool] = False
+        _json_encoded_types: ClassVar[Tuple[type, ...]] = (
+            date,
+            Decimal,
+            Fraction,
+            uuid.UUID,
+            set,
+            frozenset,
+            ipaddress.IPv4Address,
+            ipaddress.IPv6Address,
+            ipaddress.IPv4Network,
+            ipaddress.IPv6Network,
+            ipaddress.IPv4Interface,
+            ipaddress.IPv6Interface,
+        )
+
+        def __init__(self) -> None:
+            # Overrides the encoders of cbor2 for these types, datetimes
+            # are still encoded by cbor2 as they have their own encoder.
+            self._encoders = dict.fromkeys(
+                self._json_encoded_types, self._encode_default
+            )
+
+        def default(self, data: Any) -> Any:
+            return JsonSerializer.default(self, data)  # type: ignore[arg-type]
+
+        def _encode_default(self, encoder: Any, data: Any) -> None:
+            encoder.encode(self.default(data))
+
+        def loads(self, data: bytes) -> Any:
+            if data == b"":
+                return None
+            try:
+                return cbor2.loads(data)
+            except (cbor2.CBORDecodeError, ValueError) as e:
+                raise SerializationError(
+                    message=f"Unable to deserialize as CBOR: {data!r}", errors=(e,)
+                )
+
+        def dumps(self, data: Any) -> bytes:
+            # The body is already encoded to bytes
+            # so we forward the request body along.
+            if isinstance(data, bytes):
+                return data
+            try:
+                return cbor2.dumps(  # type: ignore[no-any-return]
+                    data,
+                    default=self._encode_default,
+                    encoders=self._encoders,
+                    timezone=timezone.utc,
+                )
+            except (cbor2.CBOREncodeError, ValueError, TypeError) as e:
+                raise SerializationError(
+                    message=f"Unable to serialize to CBOR: {data!r} (type: {type(data).__name__})",
+                    errors=(e,),
+                )
+
+    class CompatibilityModeCborSerializer(CborSerializer):
+        mimetype: ClassVar[str] = "application/vnd.elasticsearch+cbor"
+
+
 if pa is not None:
 
     class PyArrowSerializer(Serializer):
@@ -153,6 +285,11 @@ DEFAULT_SERIALIZERS: Dict[str, Serializer] = {
     CompatibilityModeNdjsonSerializer.mimetype: CompatibilityModeNdjsonSerializer(),
 }
 
+if cbor2 is not None:
+    DEFAULT_SERIALIZERS[CborSerializer.mimetype] = CborSerializer()
+    DEFAULT_SERIALIZERS[CompatibilityModeCborSerializer.mimetype] = (
+        CompatibilityModeCborSerializer()
+    )
 if pa is not None:
     DEFAULT_SERIALIZERS[PyArrowSerializer.mimetype] = PyArrowSerializer()
 
@@ -160,91 +297,201 @@ if pa is not None:
 JSONSerializer = JsonSerializer
 
 
-def _attempt_serialize_numpy_or_pandas(data: Any) -> Tuple[bool, Any]:
-    """Attempts to serialize a value from the numpy or pandas libraries.
-    This function is separate from JSONSerializer because the inner functions
-    are rewritten to be no-ops if either library isn't available to avoid
-    attempting to import and raising an ImportError over and over again.
-
-    Returns a tuple of (bool, Any) where the bool corresponds to whether
-    the second value contains a properly serialized value and thus
-    should be returned by JSONSerializer.default().
-    """
-    serialized, value = _attempt_serialize_numpy(data)
-    if serialized:
-        return serialized, value
-
-    serialized, value = _attempt_serialize_pandas(data)
-    if serialized:
-        return serialized, value
-
-    return False, None
-
-
-def _attempt_serialize_numpy(data: Any) -> Tuple[bool, Any]:
-    global _attempt_serialize_numpy
-    try:
-        import numpy as np
-
-        if isinstance(
-            data,
-            (
-                np.int_,
-                np.intc,
-                np.int8,
-                np.int16,
-                np.int32,
-                np.int64,
-                np.uint8,
-                np.uint16,
-                np.uint32,
-                np.uint64,
-            ),
-        ):
-            return True, int(data)
-        elif isinstance(
-            data,
-            (
-                np.float16,
-                np.float32,
-                np.float64,
-            ),
-        ):
-            return True, float(data)
-        elif isinstance(data, np.bool_):
-            return True, bool(data)
-        elif isinstance(data, np.datetime64):
-            return True, data.item().isoformat()
-        elif isinstance(data, np.ndarray):
-            return True, data.tolist()
-
-    except ImportError:
-        # Since we failed to import 'numpy' we don't want to try again.
-        _attempt_serialize_numpy = _attempt_serialize_noop
-
-    return False, None
+class _BodyFormat:
+    """Format of the bodies of requests to an endpoint and their responses"""
+
+    def __init__(
+        self,
+        name: str,
+        content_type: Optional[str] = None,
+        accept: Optional[str] = None,
+        serializers: Optional[Mapping[str, Serializer]] = None,
+    ) -> None:
+        self.name = name
+        # Mimetypes replacing 'application/json' in the Content-Type and Accept headers.
+        self.content_type = content_type
+        self.accept = accept
+        # Serializers used instead of the transport's for these mimetypes.
+        self.serializers = serializers or {}
+
+    def is_available(self, serializers: SerializerCollection) -> bool:
+        for mimetype in (self.content_type, self.accept):
+            if mimetype is not None:
+                try:
+                    serializers.get_serializer(mimetype)
+                except SerializationError:
+                    return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"<BodyFormat {self.name}>"
+
+
+_BODY_FORMATS: Dict[str, Optional[_BodyFormat]] = {
+    "json": _BodyFormat("json"),
+    # Only available if orjson is installed.
+    "orjson": None,
+    # Available if the transport has a serializer for the mimetype.
+    "cbor": _BodyFormat(
+        "cbor", content_type="application/cbor", accept="application/cbor"
+    ),
+    "arrow": _BodyFormat("arrow", accept="application/vnd.apache.arrow.stream"),
+}
+if _OrjsonSerializer is not None:
+    _BODY_FORMATS["orjson"] = _BodyFormat(
+        "orjson",
+        serializers={
+            mimetype: serializer
+            for serializer in (OrjsonSerializer(), _OrjsonNdjsonSerializer())
+            for mimetype in (
+                serializer.mimetype,
+                serializer.mimetype.replace("/", "/vnd.elasticsearch+"),
+            )
+        },
+    )
 
 
-def _attempt_serialize_pandas(data: Any) -> Tuple[bool, Any]:
-    global _attempt_serialize_pandas
-    try:
-        import pandas as pd
+def _resolve_body_formats(
+    endpoint_formats: Mapping[str, Union[str, Sequence[str]]],
+    serializers: SerializerCollection,
+) -> Dict[str, _BodyFormat]:
+    """Returns the format used for each endpoint, the first available one
+    out of the formats in order of preference. Endpoints without an
+    available format use the default format of the client.
+    """
+    resolved = {}
+    for endpoint_id, names in endpoint_formats.items():
+        if isinstance(names, str):
+            names = (names,)
+        for name in names:
+            if name not in _BODY_FORMATS:
+                raise ValueError(
+                    f"Unknown body format {name!r} for endpoint {endpoint_id!r}, "
+                    f"must be one of {', '.join(map(repr, _BODY_FORMATS))}"
+                )
+            if name == "arrow" and not endpoint_id.startswith("esql."):
+                raise ValueError(
+                    f"The 'arrow' body format is only supported by ES|QL "
+                    f"endpoints, not {endpoint_id!r}"
+                )
+        for name in names:
+            body_format = _BODY_FORMATS[name]
+            if body_format is not None and body_format.is_available(serializers):
+                resolved[endpoint_id] = body_format
+                break
+    return resolved
+
+
+# Encoders of numpy and pandas values by their type. Only the types of
+# these libraries are looked up so they are never imported by the client.
+_LibraryEncoders = Dict[type, Callable[[Any], Any]]
+_library_encoders: Dict[Tuple[str, bool], _LibraryEncoders] = {}
+# Encoders resolved for concrete types (including subclasses) by
+# whether arrays can be passed to the JSON library as-is.
+_encoders_by_type: Dict[bool, Dict[type, Callable[[Any], Any]]] = {
+    False: {},
+    True: {},
+}
 
-        if isinstance(data, (pd.Series, pd.Categorical)):
-            return True, data.tolist()
-        elif isinstance(data, pd.Timestamp) and data is not getattr(pd, "NaT", None):
-            return True, data.isoformat()
-        elif data is getattr(pd, "NA", None):
-            return True, None
 
-    except ImportError:
-        # Since we failed to import 'pandas' we don't want to try again.
-        _attempt_serialize_pandas = _attempt_serialize_noop
+def _resolve_encoder(
+    data_type: type, native_arrays: bool
+) -> Optional[Callable[[Any], Any]]:
+    """Returns the function encoding values of the type to JSON compatible
+    values or ``None`` if they can't be encoded. Encoders are cached by type
+    so later values of the type are encoded after a single lookup.
+    """
+    encoder = _numpy_or_pandas_encoder(data_type, native_arrays)
+    if encoder is None:
+        if issubclass(data_type, TIME_TYPES):
+            # The type's own method, ie for subclasses of datetime.
+            encoder = data_type.isoformat
+        elif issubclass(data_type, uuid.UUID):
+            encoder = str
+        elif issubclass(data_type, Mapping):
+            # ie bodies of responses decoded lazily
+            encoder = dict
+        elif issubclass(data_type, FLOAT_TYPES):
+            encoder = float
+        # This is kept for backwards compatibility even
+        # if 'INTEGER_TYPES' isn't used by default anymore.
+        elif INTEGER_TYPES and issubclass(data_type, INTEGER_TYPES):
+            encoder = int
+    # Types without an encoder aren't cached, 'INTEGER_TYPES'
+    # and the others may still be changed to include them.
+    if encoder is not None:
+        _encoders_by_type[native_arrays][data_type] = encoder
+    return encoder
+
+
+def _numpy_or_pandas_encoder(
+    data_type: type, native_arrays: bool
+) -> Optional[Callable[[Any], Any]]:
+    """Returns the function encoding values of the numpy or pandas type
+    to JSON compatible values or ``None`` for other types. Arrays are
+    converted to lists unless ``native_arrays`` is set, then arrays are
+    returned as C-contiguous arrays for JSON libraries encoding them
+    directly (ie orjson with ``OPT_SERIALIZE_NUMPY``).
+    """
+    for base in data_type.__mro__:
+        library = base.__module__.partition(".")[0]
+        if library not in ("numpy", "pandas"):
+            continue
+        encoders = _library_encoders.get((library, native_arrays))
+        if encoders is None:
+            if library == "numpy":
+                encoders = _numpy_encoders(native_arrays)
+            else:
+                encoders = _pandas_encoders(native_arrays)
+            _library_encoders[(library, native_arrays)] = encoders
+        encoder = encoders.get(base)
+        if encoder is not None:
+            return encoder
+    return None
+
+
+def _numpy_encoders(native_arrays: bool) -> _LibraryEncoders:
+    import numpy as np
+
+    def encode_array(data: Any) -> Any:
+        # Non-contiguous arrays and arrays of unsupported types
+        # (which are contiguous already) can't be encoded directly.
+        if native_arrays and not data.flags.c_contiguous:
+            return np.ascontiguousarray(data)
+        return data.tolist()
+
+    return {
+        np.integer: int,
+        np.floating: float,
+        np.bool_: bool,
+        np.datetime64: lambda data: data.item().isoformat(),
+        np.ndarray: encode_array,
+    }
+
+
+def _pandas_encoders(native_arrays: bool) -> _LibraryEncoders:
+    import numpy as np
+    import pandas as pd
+
+    def encode_series(data: Any) -> Any:
+        # Extension types (ie nullable integers) are converted to lists.
+        if (
+            native_arrays
+            and isinstance(data.dtype, np.dtype)
+            and data.dtype.kind in "biuf"
+        ):
+            return data.to_numpy()
+        return data.tolist()
 
-    return False, None
+    return {
+        pd.Series: encode_series,
+        pd.Categorical: lambda data: data.tolist(),
+        pd.Timestamp: lambda data: data.isoformat(),
+        type(pd.NA): lambda data: None,
+        # 'NaT' isn't a valid Elasticsearch date.
+        type(pd.NaT): _not_serializable,
+    }
 
 
-def _attempt_serialize_noop(data: Any) -> Tuple[bool, Any]:  # noqa
-    # Short-circuit if the above functions can't import
-    # the corresponding library on the first attempt.
-    return False, None
+def _not_serializable(data: Any) -> Any:
+    raise TypeError(f"Unable to serialize {data!r} (type: {type(data)})")
@@ -0,0 +1,188 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import json
+import re
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .exceptions import SerializationError
+
+__all__ = ["STREAMED_ITEMS_PATHS", "StreamingResponseBody"]
+
+# Path to the array of items which are streamed for each endpoint.
+STREAMED_ITEMS_PATHS: Mapping[str, Tuple[str, ...]] = {
+    "esql.query": ("values",),
+    "msearch": ("responses",),
+    "scroll": ("hits", "hits"),
+    "search": ("hits", "hits"),
+}
+
+_scan_once = json.JSONDecoder().scan_once  # type: ignore[attr-defined]
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# Generator yielding streamed items and returning
+# the decoded value without them and its end index.
+_Walker = Generator[Any, None, Tuple[Any, int]]
+
+
+def _skip_whitespace(text: str, idx: int) -> int:
+    return _WHITESPACE_RE.match(text, idx).end()  # type: ignore[union-attr]
+
+
+def _decode_value(text: str, idx: int) -> Tuple[Any, int]:
+    try:
+        return _scan_once(text, idx)  # type: ignore[no-any-return]
+    except StopIteration as e:
+        raise ValueError(f"Expecting value at position {e.value}") from None
+
+
+def _expect(text: str, idx: int, chars: str) -> Tuple[str, int]:
+    idx = _skip_whitespace(text, idx)
+    if idx >= len(text) or text[idx] not in chars:
+        raise ValueError(f"Expecting one of {chars!r} at position {idx}")
+    return text[idx], _skip_whitespace(text, idx + 1)
+
+
+def _walk(text: str, idx: int, path: Tuple[str, ...]) -> _Walker:
+    idx = _skip_whitespace(text, idx)
+    if not path:
+        if not text.startswith("[", idx):
+            return _decode_value(text, idx)
+        idx = _skip_whitespace(text, idx + 1)
+        if text.startswith("]", idx):
+            return [], idx + 1
+        while True:
+            item, idx = _decode_value(text, idx)
+            yield item
+            char, idx = _expect(text, idx, ",]")
+            if char == "]":
+                return [], idx
+
+    if not text.startswith("{", idx):
+        return _decode_value(text, idx)
+    obj: Dict[str, Any] = {}
+    idx = _skip_whitespace(text, idx + 1)
+    if text.startswith("}", idx):
+        return obj, idx + 1
+    while True:
+        key, idx = _decode_value(text, idx)
+        _, idx = _expect(text, idx, ":")
+        if key == path[0]:
+            obj[key], idx = yield from _walk(text, idx, path[1:])
+        else:
+            obj[key], idx = _decode_value(text, idx)
+        char, idx = _expect(text, idx, ",}")
+        if char == "}":
+            return obj, idx
+
+
+class StreamingResponseBody(Mapping[str, Any]):
+    """Body of a response whose items (ie ``hits.hits`` of a search) are
+    decoded one at a time by :meth:`iter_items` instead of all at once.
+
+    The body is kept as text and only one item is decoded at a time so
+    large responses don't need the memory of the complete decoded body.
+    Accessing the body as a mapping decodes everything except the items,
+    the array of items is always empty in the mapping.
+
+    Returned by the client for ``search``, ``scroll``, ``msearch`` and
+    ``esql.query`` when using ``.options(stream_response=True)``.
+
+    .. code-block:: python
+
+        resp = client.options(stream_response=True).search(index="logs", size=10000)
+        for hit in resp.body.iter_items():
+            ...
+        print(resp["hits"]["total"])
+    """
+
+    def __init__(
+        self, data: Union[bytes, str, Mapping[str, Any]], items_path: Tuple[str, ...]
+    ) -> None:
+        self.items_path = items_path
+        self._text: Optional[str] = None
+        self._decoded: Optional[Mapping[str, Any]] = None
+        self._body: Optional[Dict[str, Any]] = None
+        if isinstance(data, bytes):
+            self._text = data.decode("utf-8", "surrogatepass")
+        elif isinstance(data, str):
+            self._text = data
+        else:
+            # Already decoded by a serializer without streaming support.
+            self._decoded = data
+
+    def iter_items(self) -> Iterator[Any]:
+        """Decodes and yields the items of the response one at a time"""
+        if self._decoded is not None:
+            items: Any = self._decoded
+            for key in self.items_path:
+                items = items.get(key, ()) if isinstance(items, Mapping) else ()
+            yield from items
+            return
+
+        assert self._text is not None
+        try:
+            body, _ = yield from _walk(self._text, 0, self.items_path)
+        except (ValueError, IndexError, TypeError) as e:
+            raise SerializationError(
+                message=f"Unable to deserialize as JSON: {self._text[:1000]!r}",
+                errors=(e,),
+            )
+        if self._body is None:
+            self._body = body
+
+    def _get_body(self) -> Mapping[str, Any]:
+        if self._body is None:
+            if self._decoded is not None:
+                self._body = _without_items(self._decoded, self.items_path)
+            else:
+                # Decodes and discards the items to find the rest of the body.
+                for _ in self.iter_items():
+                    pass
+        assert self._body is not None
+        return self._body
+
+    def __getitem__(self, key: str) -> Any:
+        return self._get_body()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_body())
+
+    def __len__(self) -> int:
+        return len(self._get_body())
+
+    def __repr__(self) -> str:
+        return f"StreamingResponseBody({self._get_body()!r})"
+
+
+def _without_items(body: Mapping[str, Any], path: Tuple[str, ...]) -> Dict[str, Any]:
+    copy = dict(body)
+    if len(path) == 1:
+        if path[0] in copy:
+            copy[path[0]] = []
+    elif isinstance(copy.get(path[0]), Mapping):
+        copy[path[0]] = _without_items(copy[path[0]], path[1:])
+    return copy
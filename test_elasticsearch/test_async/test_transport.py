@@ -16,6 +16,7 @@
 #  under the License.
 
 
+import json
 import re
 import time
 import warnings
@@ -436,6 +437,37 @@ class TestSniffing:
         assert len(node_configs) == 2
         assert NodeConfig("http", node_host, 123) in node_configs
 
+    async def test_sniff_response_is_decoded_while_streaming(self):
+        # The node answers the sniff request and the search with the same body.
+        data = json.loads(CLUSTER_NODES)
+        data["hits"] = {"total": {"value": 1, "relation": "eq"}, "hits": [{}]}
+        client = AsyncElasticsearch(
+            [
+                NodeConfig(
+                    "http",
+                    "localhost",
+                    9200,
+                    _extras={
+                        "data": json.dumps(data).encode(),
+                        "headers": {
+                            "X-elastic-product": "Elasticsearch",
+                            "Content-Type": "application/json",
+                        },
+                    },
+                )
+            ],
+            node_class=DummyNode,
+            sniff_before_requests=True,
+        )
+
+        resp = await client.options(stream_response=True).search(index="test")
+        assert len(list(resp.body.iter_items())) == 1
+
+        # Async sniffing happens in the background.
+        assert client.transport._sniffing_task is not None
+        await client.transport._sniffing_task
+        assert len(client.transport.node_pool) == 2
+
     async def test_sniff_on_start_ignores_sniff_timeout(self):
         client = AsyncElasticsearch(
             [NodeConfig("http", "localhost", 9200, _extras={"data": CLUSTER_NODES})],
@@ -0,0 +1,304 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+
+import anyio
+import pytest
+
+from elasticsearch import (
+    ApiError,
+    AsyncElasticsearch,
+    BadRequestError,
+    ConflictError,
+    Elasticsearch,
+    NotFoundError,
+)
+from test_elasticsearch.test_cases import DummyAsyncTransport, DummyTransport
+
+
+def batch_response(target, body):
+    if target.startswith("/_mget"):
+        docs = []
+        for doc in body["docs"]:
+            if doc["_index"] == "missing":
+                docs.append(
+                    {
+                        "_index": "missing",
+                        "_id": doc["_id"],
+                        "error": {"type": "index_not_found_exception"},
+                    }
+                )
+            elif doc["_id"] in ("no-routing", "unknown"):
+                error_type = (
+                    "routing_missing_exception"
+                    if doc["_id"] == "no-routing"
+                    else "unknown_exception"
+                )
+                docs.append(
+                    {
+                        "_index": doc["_index"],
+                        "_id": doc["_id"],
+                        "error": {"type": error_type},
+                    }
+                )
+            elif doc["_id"] == "missing":
+                docs.append({"_index": doc["_index"], "_id": "missing", "found": False})
+            else:
+                docs.append(
+                    {
+                        "_index": doc["_index"],
+                        "_id": doc["_id"],
+                        "found": True,
+                        "_source": {"id": doc["_id"]},
+                    }
+                )
+        return {"docs": docs}
+
+    items = []
+    for action, _ in zip(body[::2], body[1::2]):
+        ((op_type, meta),) = action.items()
+        if meta.get("_id") == "conflict":
+            result = {
+                "_index": meta["_index"],
+                "_id": "conflict",
+                "status": 409,
+                "error": {"type": "version_conflict_engine_exception"},
+            }
+        else:
+            result = {
+                "_index": meta["_index"],
+                "_id": meta.get("_id", "generated"),
+                "result": "created",
+                "status": 201,
+            }
+        items.append({op_type: result})
+    return {"errors": False, "items": items}
+
+
+class BatchTransport(DummyTransport):
+    def perform_request(self, method, target, **kwargs):
+        self.responses = [(200, batch_response(target, kwargs["body"]))] * (
+            self.call_count + 1
+        )
+        return super().perform_request(method, target, **kwargs)
+
+
+class BatchAsyncTransport(DummyAsyncTransport):
+    async def perform_request(self, method, target, **kwargs):
+        self.responses = [(200, batch_response(target, kwargs["body"]))] * (
+            self.call_count + 1
+        )
+        return await super().perform_request(method, target, **kwargs)
+
+
+def run_concurrently(*funcs):
+    results = [None] * len(funcs)
+
+    def run(i, func):
+        try:
+            results[i] = func()
+        except Exception as e:
+            results[i] = e
+
+    threads = [
+        threading.Thread(target=run, args=(i, func)) for i, func in enumerate(funcs)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestBatchedClient:
+    def test_concurrent_gets_are_batched(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=BatchTransport)
+        batched = client.batched(max_delay=0.1)
+        results = run_concurrently(
+            *[
+                lambda i=i: batched.get(index="test", id=str(i), routing="r")
+                for i in range(5)
+            ]
+        )
+
+        assert client.transport.call_count == 1
+        (call,) = client.transport.calls[("POST", "/_mget")]
+        assert sorted(doc["_id"] for doc in call["body"]["docs"]) == [
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+        ]
+        assert all(doc["routing"] == "r" for doc in call["body"]["docs"])
+        assert [resp.body["_source"] for resp in results] == [
+            {"id": str(i)} for i in range(5)
+        ]
+        assert all(resp.meta.status == 200 for resp in results)
+
+    def test_max_batch(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=BatchTransport)
+        batched = client.batched(max_delay=10, max_batch=2)
+        results = run_concurrently(
+            *[lambda i=i: batched.get(index="test", id=str(i)) for i in range(4)]
+        )
+
+        assert client.transport.call_count == 2
+        assert [resp["_id"] for resp in results] == ["0", "1", "2", "3"]
+
+    def test_different_request_params_are_separate_batches(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=BatchTransport)
+        batched = client.batched(max_delay=0.1)
+        run_concurrently(
+            lambda: batched.get(index="test", id="1"),
+            lambda: batched.get(index="test", id="2"),
+            lambda: batched.get(index="test", id="3", realtime=False),
+        )
+
+        assert client.transport.call_count == 2
+        (call,) = client.transport.calls[("POST", "/_mget")]
+        assert len(call["body"]["docs"]) == 2
+        (call,) = client.transport.calls[("POST", "/_mget?realtime=false")]
+        assert call["body"]["docs"] == [{"_index": "test", "_id": "3"}]
+
+    def test_get_errors(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=BatchTransport)
+        batched = client.batched(max_delay=0.1)
+        found, not_found, index_not_found = run_concurrently(
+            lambda: batched.get(index="test", id="1"),
+            lambda: batched.get(index="test", id="missing"),
+            lambda: batched.get(index="missing", id="1"),
+        )
+
+        assert client.transport.call_count == 1
+        assert found.body["found"] is True
+        assert isinstance(not_found, NotFoundError)
+        assert not_found.meta.status == 404
+        assert not_found.body == {"_index": "test", "_id": "missing", "found": False}
+        assert isinstance(index_not_found, NotFoundError)
+        assert index_not_found.message == "index_not_found_exception"
+
+        resp = (
+            batched.options(ignore_status=404).batched().get(index="test", id="missing")
+        )
+        assert resp.meta.status == 404
+        assert resp.body["found"] is False
+
+    def test_get_item_errors_without_known_status(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=BatchTransport)
+        batched = client.batched(max_delay=0.1)
+        no_routing, unknown = run_concurrently(
+            lambda: batched.get(index="test", id="no-routing"),
+            lambda: batched.get(index="test", id="unknown"),
+        )
+
+        assert isinstance(no_routing, BadRequestError)
+        assert no_routing.meta.status == 400
+        assert no_routing.message == "routing_missing_exception"
+        assert type(unknown) is ApiError
+        assert unknown.meta.status == 200
+        assert unknown.message == "unknown_exception"
+        assert unknown.body == {"error": {"type": "unknown_exception"}}
+
+    def test_concurrent_index_calls_are_bulked(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=BatchTransport)
+        batched = client.batched(max_delay=0.1)
+        created, conflict, auto_id = run_concurrently(
+            lambda: batched.index(index="test", id="1", document={"a": 1}),
+            lambda: batched.index(
+                index="test", id="conflict", document={"a": 2}, op_type="create"
+            ),
+            lambda: batched.index(index="test", document={"a": 3}, pipeline="p"),
+        )
+
+        (call,) = client.transport.calls[("PUT", "/_bulk")]
+        assert sorted(call["body"][::2], key=str) == sorted(
+            [
+                {"index": {"_index": "test", "_id": "1"}},
+                {"create": {"_index": "test", "_id": "conflict"}},
+                {"index": {"_index": "test", "pipeline": "p"}},
+            ],
+            key=str,
+        )
+        assert created.meta.status == 201
+        assert created.body == {"_index": "test", "_id": "1", "result": "created"}
+        assert auto_id["_id"] == "generated"
+        assert isinstance(conflict, ConflictError)
+        assert conflict.body == {
+            "error": {"type": "version_conflict_engine_exception"},
+            "status": 409,
+        }
+
+    def test_request_errors_are_raised_for_every_caller(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=DummyTransport)
+        client.transport.responses = [(500, {"error": {"type": "boom"}})]
+        batched = client.batched(max_delay=0.1)
+        results = run_concurrently(
+            *[lambda i=i: batched.get(index="test", id=str(i)) for i in range(3)]
+        )
+
+        assert client.transport.call_count == 1
+        assert all(err.message == "boom" for err in results)
+        # Every caller raises its own instance, chained to the leader's error
+        assert len({id(err) for err in results}) == 3
+        (leader_error,) = [err for err in results if err.__cause__ is None]
+        assert all(
+            err is leader_error or err.__cause__ is leader_error for err in results
+        )
+
+    def test_other_apis_are_sent_directly(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=DummyTransport)
+        batched = client.batched()
+        batched.search(index="test")
+        batched.indices.refresh(index="test")
+
+        assert ("POST", "/test/_search") in client.transport.calls
+        assert ("POST", "/test/_refresh") in client.transport.calls
+
+    def test_invalid_options(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=DummyTransport)
+        with pytest.raises(ValueError, match="'max_batch' must be one or greater"):
+            client.batched(max_batch=0)
+        with pytest.raises(ValueError, match="'max_delay' must be zero or greater"):
+            client.batched(max_delay=-1)
+
+    @pytest.mark.anyio
+    async def test_async_concurrent_calls_are_batched(self):
+        client = AsyncElasticsearch(
+            "http://localhost:9200", transport_class=BatchAsyncTransport
+        )
+        batched = client.batched(max_delay=0.1)
+        results = {}
+
+        async def get(id):
+            results[id] = await batched.get(index="test", id=id)
+
+        async def index(id):
+            results[id] = await batched.index(index="test", id=id, document={})
+
+        async with anyio.create_task_group() as tg:
+            for id in ("1", "2", "3"):
+                tg.start_soon(get, id)
+            for id in ("4", "5"):
+                tg.start_soon(index, id)
+
+        assert client.transport.call_count == 2
+        assert len(client.transport.calls[("POST", "/_mget")]) == 1
+        assert len(client.transport.calls[("PUT", "/_bulk")]) == 1
+        assert [results[id].meta.status for id in "12345"] == [200] * 3 + [201] * 2
+        assert [results[id]["_id"] for id in "12345"] == list("12345")
@@ -0,0 +1,250 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import ssl
+import threading
+import time
+
+import pytest
+from elastic_transport import (
+    ApiResponseMeta,
+    HttpHeaders,
+    NodeConfig,
+    ObjectApiResponse,
+    SerializerCollection,
+)
+
+from elasticsearch import AsyncElasticsearch, Elasticsearch, NotFoundError
+from elasticsearch.cache import (
+    CacheEntry,
+    FileCacheStore,
+    InMemoryCacheStore,
+    ResponseCache,
+)
+from elasticsearch.serializer import DEFAULT_SERIALIZERS
+from test_elasticsearch.test_cases import DummyAsyncTransport, DummyTransport
+
+
+class SerializingTransport(DummyTransport):
+    def __init__(self, hosts, **kwargs):
+        super().__init__(hosts, **kwargs)
+        self.serializers = SerializerCollection(DEFAULT_SERIALIZERS)
+
+
+class SerializingAsyncTransport(DummyAsyncTransport):
+    def __init__(self, hosts, **kwargs):
+        super().__init__(hosts, **kwargs)
+        self.serializers = SerializerCollection(DEFAULT_SERIALIZERS)
+
+
+def make_response(body, status=200):
+    return ObjectApiResponse(
+        body=body,
+        meta=ApiResponseMeta(
+            status=status,
+            http_version="1.1",
+            headers=HttpHeaders({"x-elastic-product": "Elasticsearch"}),
+            duration=0.0,
+            node=None,
+        ),
+    )
+
+
+@pytest.fixture(params=["memory", "file"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryCacheStore(max_size=2)
+    return FileCacheStore(str(tmp_path), max_size=2)
+
+
+def test_store_evicts_least_recently_used(store):
+    for key in ("a", "b"):
+        store.put(key, CacheEntry(time.time() + 60, (), make_response({"k": key})))
+        time.sleep(0.01)
+    # Using 'a' makes 'b' the least recently used entry.
+    assert store.get("a").response.body == {"k": "a"}
+    time.sleep(0.01)
+    store.put("c", CacheEntry(time.time() + 60, (), make_response({"k": "c"})))
+
+    assert store.get("b") is None
+    assert store.get("a").response.body == {"k": "a"}
+    assert store.get("c").response.body == {"k": "c"}
+
+    store.clear()
+    assert store.get("a") is None
+
+
+def test_file_store_strips_unpicklable_node_options(tmp_path):
+    store = FileCacheStore(str(tmp_path))
+    response = make_response({})
+    response.meta.node = NodeConfig(
+        "https", "localhost", 9200, ssl_context=ssl.create_default_context()
+    )
+    store.put("key", CacheEntry(time.time() + 60, (), response))
+
+    cached = store.get("key").response
+    assert cached.meta.node.ssl_context is None
+    assert cached.meta.node.host == "localhost"
+    assert response.meta.node.ssl_context is not None
+
+
+def test_file_store_is_shared(tmp_path):
+    cache = ResponseCache(store=FileCacheStore(str(tmp_path)))
+    cache.put(("key",), make_response({"hits": {}}), {"index": "test"})
+
+    other_cache = ResponseCache(store=FileCacheStore(str(tmp_path)))
+    assert other_cache.get(("key",)).body == {"hits": {}}
+
+
+def test_only_successful_responses_are_cached():
+    cache = ResponseCache()
+    cache.put(("found",), make_response({"found": True}))
+    cache.put(("missing",), make_response({"found": False}, status=404))
+    assert cache.get(("found",)) is not None
+    assert cache.get(("missing",)) is None
+
+
+def test_ttl():
+    cache = ResponseCache(ttl=0.05)
+    cache.put(("key",), make_response({}))
+    assert cache.get(("key",)) is not None
+    time.sleep(0.06)
+    assert cache.get(("key",)) is None
+
+
+@pytest.mark.parametrize(
+    ["path_parts", "invalidate", "invalidated"],
+    [
+        ({"index": "test"}, "test", True),
+        ({"index": "test"}, "other", False),
+        ({"index": "test,other"}, ["other"], True),
+        ({"index": "logs-%2A"}, "logs-2024", True),
+        ({"index": "logs-%2A"}, "metrics", False),
+        ({"index": "logs-%2A"}, "LOGS-2024", False),
+        ({"index": "Test"}, "test", False),
+        ({"index": "_all"}, "test", True),
+        ({}, "test", True),
+    ],
+)
+def test_invalidate(path_parts, invalidate, invalidated):
+    cache = ResponseCache()
+    cache.put(("key",), make_response({}), path_parts)
+    cache.invalidate(invalidate)
+    assert (cache.get(("key",)) is None) is invalidated
+
+
+class TestClientResponseCache:
+    def test_cached_endpoints(self):
+        cache = ResponseCache()
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SerializingTransport,
+            response_cache=cache,
+        )
+
+        resp1 = client.search(index="test", query={"match_all": {}})
+        resp2 = client.search(index="test", query={"match_all": {}})
+        assert resp1 is resp2
+        client.search(index="test", query={"term": {"a": "b"}})
+        client.options(api_key="key").search(index="test", query={"match_all": {}})
+        assert client.transport.call_count == 3
+
+        client.indices.get_mapping(index="test")
+        client.indices.get_mapping(index="test")
+        assert client.transport.call_count == 4
+
+        # Endpoints which aren't cached
+        client.indices.get_settings(index="test")
+        client.indices.get_settings(index="test")
+        assert client.transport.call_count == 6
+
+        cache.invalidate("test")
+        client.search(index="test", query={"match_all": {}})
+        assert client.transport.call_count == 7
+
+    def test_errors_are_not_cached(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SerializingTransport,
+            response_cache=ResponseCache(),
+        )
+        client.transport.responses = [
+            (404, {}),
+            (200, {"found": True}),
+            (404, {"found": False}),
+            (404, {"found": False}),
+        ]
+        with pytest.raises(NotFoundError):
+            client.get(index="test", id="1")
+        assert client.get(index="test", id="1").body == {"found": True}
+
+        resp = client.options(ignore_status=404).get(index="test", id="2")
+        assert resp.meta.status == 404
+        client.options(ignore_status=404).get(index="test", id="2")
+        assert client.transport.call_count == 4
+
+    def test_custom_endpoints_and_options(self):
+        cache = ResponseCache(endpoints=["count"])
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SerializingTransport,
+            response_cache=cache,
+        )
+        client.count(index="test")
+        client.count(index="test")
+        client.search(index="test")
+        client.search(index="test")
+        assert client.transport.call_count == 3
+
+        assert client.options()._response_cache is cache
+        client.options(response_cache=None).count(index="test")
+        assert client.transport.call_count == 4
+
+    @pytest.mark.anyio
+    async def test_async_client(self):
+        client = AsyncElasticsearch(
+            "http://localhost:9200",
+            transport_class=SerializingAsyncTransport,
+            response_cache=ResponseCache(),
+        )
+        await client.get(index="test", id="1")
+        await client.get(index="test", id="1")
+        await client.get(index="test", id="2")
+        assert client.transport.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_async_client_file_store_uses_worker_thread(self, tmp_path):
+        threads = set()
+
+        class RecordingFileCacheStore(FileCacheStore):
+            def get(self, key):
+                threads.add(threading.get_ident())
+                return super().get(key)
+
+            def put(self, key, entry):
+                threads.add(threading.get_ident())
+                super().put(key, entry)
+
+        client = AsyncElasticsearch(
+            "http://localhost:9200",
+            transport_class=SerializingAsyncTransport,
+            response_cache=ResponseCache(store=RecordingFileCacheStore(str(tmp_path))),
+        )
+        await client.get(index="test", id="1")
+        await client.get(index="test", id="1")
+        assert client.transport.call_count == 1
+        assert threads and threading.get_ident() not in threads
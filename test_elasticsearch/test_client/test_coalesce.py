@@ -0,0 +1,192 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+import time
+
+import anyio
+import pytest
+from elastic_transport import SerializerCollection
+
+from elasticsearch import AsyncElasticsearch, Elasticsearch, NotFoundError
+from elasticsearch.serializer import DEFAULT_SERIALIZERS
+from test_elasticsearch.test_cases import DummyAsyncTransport, DummyTransport
+
+
+class SlowTransport(DummyTransport):
+    def __init__(self, hosts, **kwargs):
+        super().__init__(hosts, **kwargs)
+        self.serializers = SerializerCollection(DEFAULT_SERIALIZERS)
+
+    def perform_request(self, method, target, **kwargs):
+        time.sleep(0.1)
+        return super().perform_request(method, target, **kwargs)
+
+
+class SlowAsyncTransport(DummyAsyncTransport):
+    def __init__(self, hosts, **kwargs):
+        super().__init__(hosts, **kwargs)
+        self.serializers = SerializerCollection(DEFAULT_SERIALIZERS)
+
+    async def perform_request(self, method, target, **kwargs):
+        await anyio.sleep(0.1)
+        return await super().perform_request(method, target, **kwargs)
+
+
+def run_concurrently(*funcs):
+    results = [None] * len(funcs)
+
+    def run(i, func):
+        try:
+            results[i] = func()
+        except Exception as e:
+            results[i] = e
+
+    threads = [
+        threading.Thread(target=run, args=(i, func)) for i, func in enumerate(funcs)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestRequestCoalescing:
+    def test_disabled_by_default(self):
+        client = Elasticsearch("http://localhost:9200", transport_class=SlowTransport)
+        run_concurrently(*[lambda: client.get(index="test", id="1")] * 3)
+        assert client.transport.call_count == 3
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowTransport,
+            coalesce_requests=True,
+        )
+        client.transport.responses = [(200, {"_id": "1"}), (200, {"_id": "1"})]
+        results = run_concurrently(*[lambda: client.get(index="test", id="1")] * 5)
+
+        assert client.transport.call_count == 1
+        assert all(resp is results[0] for resp in results)
+        assert results[0].body == {"_id": "1"}
+
+        # Once the request is finished another one is sent.
+        client.get(index="test", id="1")
+        assert client.transport.call_count == 2
+
+    def test_search_bodies_are_part_of_the_key(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowTransport,
+            coalesce_requests=True,
+        )
+        run_concurrently(
+            lambda: client.search(index="test", query={"match_all": {}}),
+            lambda: client.search(index="test", query={"match_all": {}}),
+            lambda: client.search(index="test", query={"term": {"a": "b"}}),
+        )
+        calls = client.transport.calls[("POST", "/test/_search")]
+        assert len(calls) == 2
+        # The body is only serialized once.
+        assert sorted(call["body"] for call in calls) == [
+            b'{"query":{"match_all":{}}}',
+            b'{"query":{"term":{"a":"b"}}}',
+        ]
+
+    def test_requests_with_different_headers_are_not_coalesced(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowTransport,
+            coalesce_requests=True,
+        )
+        run_concurrently(
+            lambda: client.options(api_key="a").get(index="test", id="1"),
+            lambda: client.options(api_key="b").get(index="test", id="1"),
+            lambda: client.options(api_key="b").get(index="test", id="1"),
+        )
+        assert client.transport.call_count == 2
+
+    def test_writes_are_not_coalesced(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowTransport,
+            coalesce_requests=True,
+        )
+        run_concurrently(
+            *[lambda: client.index(index="test", id="1", document={})] * 2,
+            *[lambda: client.update(index="test", id="1", doc={})] * 2,
+        )
+        assert client.transport.call_count == 4
+
+    def test_errors_are_shared(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowTransport,
+            coalesce_requests=True,
+        )
+        client.transport.responses = [(404, {"found": False})]
+        results = run_concurrently(*[lambda: client.get(index="test", id="1")] * 3)
+
+        assert client.transport.call_count == 1
+        assert all(isinstance(err, NotFoundError) for err in results)
+        # Every caller raises its own instance, chained to the leader's error
+        assert len({id(err) for err in results}) == 3
+        (leader_error,) = [err for err in results if err.__cause__ is None]
+        for err in results:
+            assert err.meta.status == 404
+            assert err.body == {"found": False}
+            assert err is leader_error or err.__cause__ is leader_error
+
+    def test_options(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowTransport,
+            coalesce_requests=True,
+        )
+        assert client.options()._request_coalescer is client._request_coalescer
+        assert client.options(coalesce_requests=False)._request_coalescer is None
+
+        client = Elasticsearch("http://localhost:9200", transport_class=SlowTransport)
+        assert client._request_coalescer is None
+        coalescing_client = client.options(coalesce_requests=True)
+        assert coalescing_client._request_coalescer is not None
+        assert (
+            coalescing_client.options(coalesce_requests=True)._request_coalescer
+            is coalescing_client._request_coalescer
+        )
+
+    @pytest.mark.anyio
+    async def test_async_concurrent_identical_requests_are_coalesced(self):
+        client = AsyncElasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowAsyncTransport,
+            coalesce_requests=True,
+        )
+        results = []
+
+        async def search(**kwargs):
+            results.append(await client.search(index="test", **kwargs))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(search)
+            tg.start_soon(lambda: search(query={"match_all": {}}))
+
+        assert client.transport.call_count == 2
+        assert len(results) == 4
+        assert len({id(resp) for resp in results}) == 2
@@ -0,0 +1,94 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import pytest
+from elastic_transport import NodeConfig
+
+from elasticsearch import Elasticsearch
+from elasticsearch.esql import to_pandas, to_polars
+from elasticsearch.esql.arrow import _import
+from test_elasticsearch.test_transport import DummyNode
+
+pa = pytest.importorskip("pyarrow")
+
+
+def arrow_stream(*batches):
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batches[0].schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+BATCHES = [
+    pa.record_batch([pa.array([1, 2]), pa.array(["a", None])], names=["id", "name"]),
+    pa.record_batch([pa.array([3]), pa.array(["c"])], names=["id", "name"]),
+]
+
+
+@pytest.fixture
+def client():
+    return Elasticsearch(
+        [
+            NodeConfig(
+                "http",
+                "localhost",
+                9200,
+                _extras={
+                    "data": arrow_stream(*BATCHES),
+                    "headers": {
+                        "X-elastic-product": "Elasticsearch",
+                        "Content-Type": "application/vnd.apache.arrow.stream",
+                    },
+                },
+            )
+        ],
+        node_class=DummyNode,
+    )
+
+
+def test_query_arrow(client):
+    reader = client.esql.query_arrow(query="FROM test", locale="en")
+    assert isinstance(reader, pa.RecordBatchReader)
+    assert reader.schema.names == ["id", "name"]
+    assert [batch.num_rows for batch in reader] == [2, 1]
+
+    args, kwargs = client.transport.node_pool.get().calls[-1]
+    assert args == ("POST", "/_query?format=arrow")
+    assert b'"locale":"en"' in kwargs["body"]
+
+
+def test_to_pandas(client):
+    pytest.importorskip("pandas")
+    df = to_pandas(client.esql.query_arrow(query="FROM test"))
+    assert df["id"].tolist() == [1, 2, 3]
+    assert str(df["id"].dtype) == "int64[pyarrow]"
+
+    df = to_pandas(pa.Table.from_batches(BATCHES), arrow_dtypes=False)
+    assert str(df["id"].dtype) == "int64"
+    assert df["name"].tolist()[::2] == ["a", "c"]
+
+
+def test_to_polars(client):
+    pytest.importorskip("polars")
+    df = to_polars(client.esql.query_arrow(query="FROM test"))
+    assert df["id"].to_list() == [1, 2, 3]
+
+
+def test_missing_dependency():
+    with pytest.raises(ModuleNotFoundError, match="pip install not_installed"):
+        _import("not_installed")
@@ -0,0 +1,223 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+import time
+
+import anyio
+import pytest
+from elastic_transport import NodeConfig
+
+from elasticsearch import AsyncElasticsearch, ConnectionError, Elasticsearch
+from elasticsearch.hedging import HedgingPolicy
+from elasticsearch.node_selector import RoutingSelector
+from test_elasticsearch.test_cases import DummyAsyncTransport, DummyTransport
+from test_elasticsearch.test_transport import DummyNode
+
+
+class SlowNodeTransport(DummyTransport):
+    """The first request is slow (or fails) and later requests are fast"""
+
+    first_request_delay = 0.5
+    first_request_error = None
+
+    def perform_request(self, method, target, **kwargs):
+        n = self.call_count
+        self.responses = [(200, {"request": i}) for i in range(n + 1)]
+        self.threads = getattr(self, "threads", []) + [threading.current_thread()]
+        meta, body = super().perform_request(method, target, **kwargs)
+        if n == 0:
+            time.sleep(self.first_request_delay)
+            if self.first_request_error is not None:
+                raise self.first_request_error
+        return meta, body
+
+    def close(self):
+        pass
+
+
+class SlowNodeAsyncTransport(DummyAsyncTransport):
+    first_request_delay = 0.5
+    completed = 0
+
+    async def perform_request(self, method, target, **kwargs):
+        n = self.call_count
+        self.responses = [(200, {"request": i}) for i in range(n + 1)]
+        meta, body = await super().perform_request(method, target, **kwargs)
+        if n == 0:
+            await anyio.sleep(self.first_request_delay)
+        self.completed += 1
+        return meta, body
+
+
+def test_policy_delay_uses_percentile_of_recent_latencies():
+    policy = HedgingPolicy(
+        percentile=90, initial_delay=1.0, min_samples=10, window_size=100
+    )
+    assert policy.delay("search") == 1.0
+    for i in range(1, 101):
+        policy.observe("search", i / 1000)
+    assert policy.delay("search") == pytest.approx(0.091)
+    # Other endpoints are tracked separately.
+    assert policy.delay("get") == 1.0
+
+    # Only the most recent latencies are kept.
+    for _ in range(100):
+        policy.observe("search", 0.5)
+    assert policy.delay("search") == 0.5
+
+    assert HedgingPolicy(delay=0.2).delay("search") == 0.2
+
+
+def test_policy_invalid_percentile():
+    with pytest.raises(ValueError, match="'percentile' must be between 0 and 100"):
+        HedgingPolicy(percentile=100)
+
+
+class TestHedging:
+    def test_slow_request_is_hedged(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowNodeTransport,
+            hedging=HedgingPolicy(delay=0.05),
+        )
+        client.transport.first_request_delay = 0.5
+        start = time.monotonic()
+        resp = client.search(index="test")
+
+        # The hedged request wins without waiting for the first request.
+        assert resp.body == {"request": 1}
+        assert time.monotonic() - start < 0.4
+        assert client.transport.call_count == 2
+        assert threading.current_thread() not in client.transport.threads
+
+    def test_hedged_request_avoids_node_of_first_request(self):
+        class SlowNode(DummyNode):
+            def perform_request(self, *args, **kwargs):
+                if self.config.port == 9200:
+                    time.sleep(0.3)
+                return super().perform_request(*args, **kwargs)
+
+        class FirstNodeSelector(RoutingSelector):
+            def _select(self, nodes):
+                return nodes[0]
+
+        client = Elasticsearch(
+            [
+                NodeConfig("http", "localhost", 9200),
+                NodeConfig("http", "localhost", 9201),
+            ],
+            node_class=SlowNode,
+            node_selector_class=FirstNodeSelector,
+            randomize_nodes_in_pool=False,
+            hedging=HedgingPolicy(delay=0.05),
+        )
+        for _ in range(2):
+            assert client.search(index="test").meta.node.port == 9201
+
+        client = Elasticsearch(
+            "http://localhost:9200", node_class=DummyNode, hedging=HedgingPolicy()
+        )
+        assert isinstance(client.transport.node_pool.node_selector, RoutingSelector)
+
+    def test_close_shuts_down_hedging_threads(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowNodeTransport,
+            hedging=HedgingPolicy(delay=0.01),
+        )
+        client.transport.first_request_delay = 0.05
+        client.search(index="test")
+        executor = client._request_hedger._executor
+        assert executor is not None
+
+        client.close()
+        assert client._request_hedger._executor is None
+        assert executor._shutdown
+
+        # A closed hedger starts again when it's used
+        client.transport.call_count = 0
+        client.search(index="test")
+        assert client.transport.call_count == 2
+
+    def test_fast_request_is_not_hedged(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowNodeTransport,
+            hedging=HedgingPolicy(delay=1.0),
+        )
+        client.transport.first_request_delay = 0
+        assert client.search(index="test").body == {"request": 0}
+        assert client.transport.call_count == 1
+
+    def test_only_read_endpoints_are_hedged(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowNodeTransport,
+            hedging=HedgingPolicy(delay=0.05),
+        )
+        client.transport.first_request_delay = 0.2
+        client.index(index="test", document={})
+        assert client.transport.call_count == 1
+
+    def test_transport_error_waits_for_hedged_request(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowNodeTransport,
+            hedging=HedgingPolicy(delay=0.05),
+        )
+        client.transport.first_request_delay = 0.1
+        client.transport.first_request_error = ConnectionError("error")
+        assert client.get(index="test", id="1").body == {"request": 1}
+
+    def test_transport_error_before_delay_is_raised(self):
+        client = Elasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowNodeTransport,
+            hedging=HedgingPolicy(delay=0.5),
+        )
+        client.transport.first_request_delay = 0
+        client.transport.first_request_error = ConnectionError("error")
+        with pytest.raises(ConnectionError):
+            client.get(index="test", id="1")
+        assert client.transport.call_count == 1
+
+    def test_options(self):
+        hedging = HedgingPolicy()
+        client = Elasticsearch(
+            "http://localhost:9200", transport_class=DummyTransport, hedging=hedging
+        )
+        assert client.options()._hedging is hedging
+        assert client.options(hedging=None)._hedging is None
+        assert client.options()._request_hedger is client._request_hedger
+
+        client = Elasticsearch("http://localhost:9200", transport_class=DummyTransport)
+        assert client._hedging is None
+        assert client.options(hedging=hedging)._hedging is hedging
+
+    @pytest.mark.anyio
+    async def test_async_slower_request_is_cancelled(self):
+        client = AsyncElasticsearch(
+            "http://localhost:9200",
+            transport_class=SlowNodeAsyncTransport,
+            hedging=HedgingPolicy(delay=0.05),
+        )
+        resp = await client.count(index="test")
+
+        assert resp.body == {"request": 1}
+        assert client.transport.call_count == 2
+        assert client.transport.completed == 1
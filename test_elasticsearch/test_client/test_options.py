@@ -15,8 +15,10 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import json
+
 import pytest
-from elastic_transport import OpenTelemetrySpan
+from elastic_transport import NodeConfig, OpenTelemetrySpan
 from elastic_transport.client_utils import DEFAULT
 
 from elasticsearch import AsyncElasticsearch, Elasticsearch, JsonSerializer
@@ -26,6 +28,7 @@ from test_elasticsearch.test_cases import (
     DummyTransport,
     DummyTransportTestCase,
 )
+from test_elasticsearch.test_transport import CLUSTER_NODES, DummyNode
 
 EXPECTED_SERIALIZERS = {
     "application/vnd.mapbox-vector-tile",
@@ -43,6 +46,15 @@ try:
 except ImportError:
     pa = None
 
+try:
+    import cbor2
+
+    EXPECTED_SERIALIZERS.update(
+        ("application/cbor", "application/vnd.elasticsearch+cbor")
+    )
+except ImportError:
+    cbor2 = None
+
 
 class TestOptions(DummyTransportTestCase):
     def assert_called_with_headers(self, client, method, target, headers):
@@ -557,5 +569,181 @@ class TestOptions(DummyTransportTestCase):
             client.transport.serializers.get_serializer("application/json"),
             CustomSerializer,
         )
-        expected = EXPECTED_SERIALIZERS | {"application/cbor"}
+        # The compatibility mode mimetype uses the same serializer.
+        expected = EXPECTED_SERIALIZERS | {
+            "application/cbor",
+            "application/vnd.elasticsearch+cbor",
+        }
         assert set(client.transport.serializers.serializers.keys()) == expected
+        assert isinstance(
+            client.transport.serializers.get_serializer(
+                "application/vnd.elasticsearch+cbor"
+            ),
+            CustomSerializer,
+        )
+
+    def test_body_mimetype(self):
+        class BinarySerializer(JsonSerializer):
+            mimetype = "application/cbor"
+
+        client = Elasticsearch(
+            "http://localhost:9200",
+            node_class=DummyNode,
+            serializers={"application/cbor": BinarySerializer()},
+            body_mimetype="application/cbor",
+        )
+        calls = client.transport.node_pool.get().calls
+
+        client.search(index="test", query={"match_all": {}})
+        headers = calls[-1][1]["headers"]
+        assert headers["accept"] == (
+            "application/vnd.elasticsearch+cbor; compatible-with=9"
+        )
+        assert headers["content-type"] == (
+            "application/vnd.elasticsearch+cbor; compatible-with=9"
+        )
+
+        # Only JSON bodies use the mimetype.
+        client.bulk(operations=[{"index": {}}, {}])
+        headers = calls[-1][1]["headers"]
+        assert headers["accept"] == (
+            "application/vnd.elasticsearch+cbor; compatible-with=9"
+        )
+        assert headers["content-type"] == (
+            "application/vnd.elasticsearch+x-ndjson; compatible-with=9"
+        )
+
+        client.options(body_mimetype=None).search(index="test")
+        headers = calls[-1][1]["headers"]
+        assert headers["accept"] == (
+            "application/vnd.elasticsearch+json; compatible-with=9"
+        )
+        assert client.options()._body_mimetype == "application/cbor"
+
+        with pytest.raises(
+            ValueError,
+            match="No serializer is configured for 'body_mimetype' 'application/smile'",
+        ):
+            client.options(body_mimetype="application/smile")
+
+    def test_endpoint_formats(self):
+        pytest.importorskip("orjson")
+
+        class BinarySerializer(JsonSerializer):
+            mimetype = "application/cbor"
+
+        client = Elasticsearch(
+            "http://localhost:9200",
+            node_class=DummyNode,
+            serializers={"application/cbor": BinarySerializer()},
+            endpoint_formats={
+                "bulk": "orjson",
+                "search": ["cbor", "json"],
+                "esql.query": ["arrow", "json"],
+            },
+        )
+        calls = client.transport.node_pool.get().calls
+
+        # The body is serialized by the format before it's sent.
+        client.bulk(operations=[{"index": {}}, {"vector": [1.0, 2.5]}])
+        assert calls[-1][1]["body"] == b'{"index":{}}\n{"vector":[1.0,2.5]}\n'
+        assert client._json_serializer("bulk").__class__.__name__ == (
+            "OrjsonSerializer"
+        )
+        assert client._json_serializer("search") is (
+            client.transport.serializers.get_serializer("application/json")
+        )
+
+        client.search(index="test")
+        headers = calls[-1][1]["headers"]
+        assert headers["accept"] == (
+            "application/vnd.elasticsearch+cbor; compatible-with=9"
+        )
+
+        # Falls back to the next format without a CBOR serializer.
+        other = Elasticsearch(
+            "http://localhost:9200", endpoint_formats={"count": ["cbor", "orjson"]}
+        )
+        expected = "orjson" if cbor2 is None else "cbor"
+        assert other._endpoint_formats["count"].name == expected
+
+        client.esql.query(query="FROM test")
+        headers = calls[-1][1]["headers"]
+        if pa is not None:
+            assert headers["accept"] == "application/vnd.apache.arrow.stream"
+        else:
+            assert headers["accept"] == (
+                "application/vnd.elasticsearch+json; compatible-with=9"
+            )
+
+        # Other endpoints use JSON.
+        client.info()
+        headers = calls[-1][1]["headers"]
+        assert headers["accept"] == (
+            "application/vnd.elasticsearch+json; compatible-with=9"
+        )
+
+        assert client.options()._endpoint_formats is client._endpoint_formats
+        assert client.options(endpoint_formats=None)._endpoint_formats == {}
+
+        with pytest.raises(ValueError, match="Unknown body format 'xml'"):
+            client.options(endpoint_formats={"search": ["json", "xml"]})
+        with pytest.raises(ValueError, match="only supported by ES\\|QL endpoints"):
+            client.options(endpoint_formats={"search": "arrow"})
+
+    def test_endpoint_format_decodes_responses(self):
+        pytest.importorskip("orjson")
+
+        client = Elasticsearch(
+            [
+                NodeConfig(
+                    "http",
+                    "localhost",
+                    9200,
+                    _extras={
+                        "data": b'{"took":1,"errors":false,"items":[]}',
+                        "headers": {
+                            "X-elastic-product": "Elasticsearch",
+                            "Content-Type": "application/json",
+                        },
+                    },
+                )
+            ],
+            node_class=DummyNode,
+            endpoint_formats={"bulk": "orjson"},
+        )
+        resp = client.bulk(operations=[{"index": {}}, {}])
+        assert resp.body == {"took": 1, "errors": False, "items": []}
+        # The body mimetype still applies to endpoints without a format.
+        client = client.options(body_mimetype="application/json")
+        assert client.bulk(operations=[{"index": {}}, {}]).body["took"] == 1
+
+    def test_endpoint_format_with_sniffing(self):
+        pytest.importorskip("orjson")
+
+        # The node answers the sniff request and the search with the same body.
+        data = json.loads(CLUSTER_NODES)
+        data["hits"] = {"total": {"value": 0, "relation": "eq"}, "hits": []}
+        client = Elasticsearch(
+            [
+                NodeConfig(
+                    "http",
+                    "localhost",
+                    9200,
+                    _extras={
+                        "data": json.dumps(data).encode(),
+                        "headers": {
+                            "X-elastic-product": "Elasticsearch",
+                            "Content-Type": "application/json",
+                        },
+                    },
+                )
+            ],
+            node_class=DummyNode,
+            sniff_before_requests=True,
+            endpoint_formats={"search": "orjson"},
+        )
+        resp = client.search(index="test")
+        assert resp["hits"]["total"]["value"] == 0
+        calls = [call[0] for call in client.transport.node_pool.all()[0].calls]
+        assert calls[0] == ("GET", "/_nodes/_all/http")
@@ -37,6 +37,14 @@ try:
 except ImportError:
     pa = None
 
+try:
+    import cbor2
+
+    EXPECTED_SERIALIZERS.add("application/cbor")
+    EXPECTED_SERIALIZERS.add("application/vnd.elasticsearch+cbor")
+except ImportError:
+    cbor2 = None
+
 
 class TestSerializers(DummyTransportTestCase):
     def test_compat_mode_on_by_default(self):
@@ -15,16 +15,22 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import json
+from contextlib import aclosing
 from copy import deepcopy
-from typing import Any
+from typing import Any, List, Tuple
 
 import pytest
+from elastic_transport import ObjectApiResponse
 from pytest import raises
 
+from elasticsearch import ApiError
 from elasticsearch.dsl import (
     AsyncEmptySearch,
+    AsyncMultiSearch,
     AsyncSearch,
     Document,
+    Placeholder,
     Q,
     query,
     types,
@@ -32,6 +38,8 @@ from elasticsearch.dsl import (
 )
 from elasticsearch.dsl.exceptions import IllegalOperation
 
+from ..async_sleep import sleep
+
 
 def test_expand__to_dot_is_respected() -> None:
     s = AsyncSearch().query("match", a__b=42, _expand__to_dot=False)
@@ -161,6 +169,40 @@ def test_copy_clones() -> None:
     assert s1 is not s2
 
 
+def test_clones_share_containers_until_modified() -> None:
+    s1 = (
+        AsyncSearch()
+        .sort("title")
+        .highlight("title")
+        .extra(size=5)
+        .params(routing="a")
+        .suggest("s", "text", term={"field": "title"})
+    )
+    s2 = s1.filter("term", tag="python")
+    assert s2._sort is s1._sort
+    assert s2._highlight is s1._highlight
+    assert s2._extra is s1._extra
+
+    s3 = s2.extra(from_=10).params(preference="local").highlight("body")
+    s3 = s3.suggest("s2", "other", term={"field": "body"})[:2]
+    assert s3._sort is s1._sort
+    assert s3._extra is not s1._extra
+    assert s1._extra == s2._extra == {"size": 5}
+    assert s3._extra == {"from": 10, "size": 2}
+    assert s1._params == s2._params == {"routing": "a"}
+    assert s3._params == {"routing": "a", "preference": "local"}
+    assert list(s2._highlight) == ["title"]
+    assert list(s3._highlight) == ["title", "body"]
+    assert list(s2._suggest) == ["s"]
+
+    # modifying the original in-place doesn't change its clones
+    s1.update_from_dict({"track_total_hits": True})
+    assert s1._extra == {"size": 5, "track_total_hits": True}
+    assert s2._extra == {"size": 5}
+    assert s1.query._proxied is None
+    assert s2.query._proxied == Q("bool", filter=[Q("term", tag="python")])
+
+
 def test_aggs_allow_two_metric() -> None:
     s = AsyncSearch()
 
@@ -621,6 +663,168 @@ async def test_params_being_passed_to_search(async_mock_client: Any) -> None:
     async_mock_client.search.assert_awaited_once_with(index=None, body={}, routing="42")
 
 
+def test_compile_fills_in_placeholders() -> None:
+    def search(user: Any, start: Any, size: Any) -> AsyncSearch:
+        return (
+            AsyncSearch(index="logs")
+            .filter("term", user_id=user)
+            .filter("range", date={"gte": start, "lt": "now"})
+            .query("match", title="python")
+            .sort("-date")
+            .extra(size=size)
+        )
+
+    compiled = search(
+        Placeholder("user"), Placeholder("start"), Placeholder("size")
+    ).compile()
+    assert compiled.params == {"user", "start", "size"}
+
+    for user, start, size in (("kimchy", "now-1d", 10), (["a", "b"], None, 0)):
+        expected = search(user, start, size).to_dict()
+        assert expected == compiled.to_dict(user=user, start=start, size=size)
+        assert expected == json.loads(
+            compiled.to_json(user=user, start=start, size=size)
+        )
+
+    assert '{"term":{"user_id":{{#toJson}}user{{/toJson}}}}' in compiled.to_mustache()
+
+    with raises(ValueError, match=r"missing: \['size'\], unknown: \['other'\]"):
+        compiled.to_dict(user="kimchy", start="now-1d", other=1)
+
+
+def test_compile_without_placeholders() -> None:
+    s = AsyncSearch().query("match", title="python")
+    compiled = s.compile()
+
+    assert compiled.params == frozenset()
+    assert s.to_dict() == compiled.to_dict()
+    assert s.to_dict() == json.loads(compiled.to_json())
+
+
+@pytest.mark.anyio
+async def test_compiled_search_is_executed(async_mock_client: Any) -> None:
+    s = AsyncSearch(using="mock", index="i").params(routing="42")
+    compiled = s.filter("term", user_id=Placeholder("user")).compile()
+    await compiled.execute(user="kimchy")
+
+    async_mock_client.search.assert_awaited_once_with(
+        index=["i"],
+        body={"query": {"bool": {"filter": [{"term": {"user_id": "kimchy"}}]}}},
+        routing="42",
+    )
+
+
+def fake_msearch(calls: List[Tuple[List[Any], Any]]) -> Any:
+    # Returns a hit count equal to the value of the "n" term of each search,
+    # searches with a negative value fail.
+    async def msearch(index: Any, body: Any, **kwargs: Any) -> Any:
+        lines = [json.loads(line) if isinstance(line, bytes) else line for line in body]
+        calls.append((lines, kwargs))
+        responses: List[Any] = []
+        for search_body in lines[1::2]:
+            n = search_body["query"]["term"]["n"]
+            if n < 0:
+                responses.append({"error": {"type": "search_phase_execution"}})
+            else:
+                responses.append(
+                    {"hits": {"total": {"value": n, "relation": "eq"}, "hits": []}}
+                )
+        return ObjectApiResponse(meta=None, body={"responses": responses})  # type: ignore[arg-type]
+
+    return msearch
+
+
+@pytest.mark.anyio
+async def test_multi_search_is_split_into_batches(async_mock_client: Any) -> None:
+    calls: List[Tuple[List[Any], Any]] = []
+    async_mock_client.msearch = fake_msearch(calls)
+    searches = [AsyncSearch(index=f"i{n}").query("term", n=n) for n in range(5)]
+    ms = AsyncMultiSearch(using="mock").params(max_concurrent_searches=3)
+    for s in searches:
+        ms = ms.add(s)
+
+    responses = await ms.execute(batch_size=2, max_concurrent_batches=2)
+
+    assert [r.hits.total.value for r in responses] == [0, 1, 2, 3, 4]  # type: ignore[attr-defined]
+    assert [r._search for r in responses] == searches
+    assert sorted(len(lines) // 2 for lines, _ in calls) == [1, 2, 2]
+    assert all(kwargs == {"max_concurrent_searches": 3} for _, kwargs in calls)
+    assert sorted(lines[0]["index"] for lines, _ in calls) == [["i0"], ["i2"], ["i4"]]
+
+
+@pytest.mark.anyio
+async def test_multi_search_is_split_by_size(async_mock_client: Any) -> None:
+    calls: List[Tuple[List[Any], Any]] = []
+    async_mock_client.msearch = fake_msearch(calls)
+    ms = AsyncMultiSearch(using="mock")
+    for n in range(3):
+        ms = ms.add(AsyncSearch().query("term", n=n))
+    search_size = len(json.dumps({}, separators=(",", ":"))) + len(
+        json.dumps(ms[0].to_dict(), separators=(",", ":"))
+    )
+
+    responses = await ms.execute(max_batch_bytes=2 * search_size + 4)
+
+    assert [r.hits.total.value for r in responses] == [0, 1, 2]  # type: ignore[attr-defined]
+    assert [len(lines) // 2 for lines, _ in calls] == [2, 1]
+
+    with raises(ValueError):
+        await ms.execute(ignore_cache=True, batch_size=0)
+
+
+@pytest.mark.anyio
+async def test_multi_search_streams_responses(async_mock_client: Any) -> None:
+    calls: List[Tuple[List[Any], Any]] = []
+    async_mock_client.msearch = fake_msearch(calls)
+    ms = AsyncMultiSearch(using="mock")
+    for n in (0, 1, -1, 3, 4):
+        ms = ms.add(AsyncSearch().query("term", n=n))
+
+    streamed = [
+        (i, r.hits.total.value if r is not None else None)  # type: ignore[attr-defined]
+        async for i, r in ms.stream(
+            batch_size=1, max_concurrent_batches=3, raise_on_error=False
+        )
+    ]
+    assert streamed == [(0, 0), (1, 1), (2, None), (3, 3), (4, 4)]
+
+    unordered = [
+        i
+        async for i, _ in ms.stream(
+            batch_size=2, max_concurrent_batches=3, ordered=False, raise_on_error=False
+        )
+    ]
+    assert sorted(unordered) == [0, 1, 2, 3, 4]
+
+    with raises(ApiError):
+        await ms.execute(batch_size=1, max_concurrent_batches=2)
+
+
+@pytest.mark.anyio
+async def test_multi_search_stream_can_be_left_early(async_mock_client: Any) -> None:
+    calls: List[Tuple[List[Any], Any]] = []
+    async_mock_client.msearch = fake_msearch(calls)
+    ms = AsyncMultiSearch(using="mock")
+    for n in range(20):
+        ms = ms.add(AsyncSearch().query("term", n=n))
+
+    async with aclosing(ms.stream(batch_size=1, max_concurrent_batches=2)) as stream:
+        async for i, r in stream:
+            break
+    # batches are only sent ahead of the consumer
+    await sleep(0.01)
+    assert i == 0
+    assert len(calls) <= 3
+
+    calls.clear()
+    async with aclosing(ms.stream(batch_size=1, max_concurrent_batches=2)) as stream:
+        async for i, r in stream:
+            if i == 5:
+                break
+    await sleep(0.01)
+    assert len(calls) <= 8
+
+
 def test_source() -> None:
     assert {} == AsyncSearch().source().to_dict()
 
@@ -839,3 +1043,122 @@ def test_suggest_regex_must_be_wtih_completion() -> None:
     s = AsyncSearch()
     with raises(ValueError):
         s.suggest("my_suggestion", regex="py[thon|py]")
+
+
+def fake_point_in_time(client: Any, calls: List[Any], docs: int = 5) -> None:
+    # Each slice of the point in time holds ``docs`` documents, ordered by
+    # their number.
+    async def open_point_in_time(index: Any, keep_alive: str) -> Any:
+        calls.append(("open", index, keep_alive))
+        return {"id": "pit-id"}
+
+    async def close_point_in_time(id: str) -> Any:
+        calls.append(("close", id))
+
+    async def search(index: Any, body: Any) -> Any:
+        calls.append(("search", body))
+        slice_id = body.get("slice", {}).get("id", 0)
+        if slice_id < 0:
+            raise ApiError("N/A", meta=None, body={})  # type: ignore[arg-type]
+        start = body["search_after"][0] + 1 if "search_after" in body else 0
+        hits = [
+            {"_id": f"{slice_id}-{n}", "_source": {}, "sort": [n]}
+            for n in range(start, min(start + body.get("size", 10), docs))
+        ]
+        return ObjectApiResponse(meta=None, body={"hits": {"hits": hits}})  # type: ignore[arg-type]
+
+    client.open_point_in_time = open_point_in_time
+    client.close_point_in_time = close_point_in_time
+    client.search = search
+
+
+@pytest.mark.anyio
+async def test_iterate_pages_through_point_in_time(async_mock_client: Any) -> None:
+    calls: List[Any] = []
+    fake_point_in_time(async_mock_client, calls)
+    s = AsyncSearch(using="mock", index="i").query("match", title="python")
+
+    hits = [hit.meta.id async for hit in s.iterate(size=2, prefetch=True)]
+
+    assert hits == ["0-0", "0-1", "0-2", "0-3", "0-4"]
+    assert calls[0] == ("open", ["i"], "1m")
+    assert calls[-1] == ("close", "pit-id")
+    searches = [body for call, body in calls[1:-1]]
+    assert searches[0] == {
+        "query": {"match": {"title": "python"}},
+        "sort": ["_shard_doc"],
+        "pit": {"id": "pit-id", "keep_alive": "1m"},
+        "size": 2,
+    }
+    assert [body.get("search_after") for body in searches] == [None, [1], [3], [4]]
+
+
+@pytest.mark.anyio
+async def test_iterate_searches_slices_concurrently(async_mock_client: Any) -> None:
+    calls: List[Any] = []
+    fake_point_in_time(async_mock_client, calls)
+    s = AsyncSearch(using="mock", index="i")
+
+    hits = [hit.meta.id async for hit in s.iterate(size=2, slices=3)]
+
+    assert sorted(hits) == sorted(f"{i}-{n}" for i in range(3) for n in range(5))
+    for i in range(3):
+        assert [h for h in hits if h.startswith(f"{i}-")] == [
+            f"{i}-{n}" for n in range(5)
+        ]
+    assert [c for c in calls if c[0] != "search"] == [
+        ("open", ["i"], "1m"),
+        ("close", "pit-id"),
+    ]
+    assert sorted(c[1]["slice"]["id"] for c in calls if c[0] == "search") == [
+        0,
+        0,
+        0,
+        0,
+        1,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+    ]
+    assert all(c[1]["slice"]["max"] == 3 for c in calls if c[0] == "search")
+
+
+@pytest.mark.anyio
+async def test_iterate_closes_point_in_time(async_mock_client: Any) -> None:
+    calls: List[Any] = []
+    fake_point_in_time(async_mock_client, calls)
+    s = AsyncSearch(using="mock", index="i")
+
+    async with aclosing(s.iterate(size=2, slices=2, prefetch=True)) as hits:
+        async for hit in hits:
+            break
+    assert calls[-1] == ("close", "pit-id")
+
+    calls.clear()
+    with raises(ApiError):
+        async for hit in s.extra(slice={"id": -1, "max": 2}).iterate():
+            pass
+    assert calls[-1] == ("close", "pit-id")
+
+    with raises(ValueError):
+        async for hit in s.iterate(slices=0):
+            pass
+
+
+@pytest.mark.anyio
+async def test_iterate_can_be_left_early(async_mock_client: Any) -> None:
+    calls: List[Any] = []
+    fake_point_in_time(async_mock_client, calls, docs=20)
+    s = AsyncSearch(using="mock", index="i")
+
+    async with aclosing(s.iterate(size=2, slices=2, prefetch=True)) as hits:
+        async for hit in hits:
+            break
+    # only the pages ahead of the consumer are requested
+    await sleep(0.01)
+    assert calls[-1] == ("close", "pit-id")
+    assert len([c for c in calls if c[0] == "search"]) <= 4
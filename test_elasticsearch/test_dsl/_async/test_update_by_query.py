@@ -169,6 +169,16 @@ def test_overwrite_script() -> None:
     assert {"script": {"source": "ctx._source.likes++"}} == ubq.to_dict()
 
 
+def test_script_isnt_shared_with_clones() -> None:
+    ubq1 = AsyncUpdateByQuery().filter("term", tag="python")
+    ubq2 = ubq1.script(source="ctx._source.likes++")
+
+    assert "script" not in ubq1.to_dict()
+    assert {"source": "ctx._source.likes++"} == ubq2.to_dict()["script"]
+    assert ubq1.query._proxied == ubq2.query._proxied
+    assert ubq2.query._search is ubq2
+
+
 def test_update_by_query_response_success() -> None:
     ubqr = UpdateByQueryResponse(SearchBase(), {"timed_out": False, "failures": []})
     assert ubqr.success()
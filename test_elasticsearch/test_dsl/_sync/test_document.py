@@ -23,16 +23,22 @@
 
 import codecs
 import ipaddress
+import itertools
+import json
 import pickle
 import sys
+from contextlib import closing
 from datetime import datetime
 from hashlib import md5
-from typing import Annotated, Any, ClassVar, Dict, List, Optional
+from typing import Annotated, Any, ClassVar, Dict, Iterator, List, Optional
 
 import pydantic
 import pytest
+from elastic_transport import ObjectApiResponse
 from pytest import raises
 
+from elasticsearch import NotFoundError, RequestError
+from elasticsearch._otel import OpenTelemetry
 from elasticsearch.dsl import (
     Document,
     Index,
@@ -50,6 +56,10 @@ from elasticsearch.dsl import (
 from elasticsearch.dsl.document_base import InstrumentedField
 from elasticsearch.dsl.exceptions import IllegalOperation, ValidationException
 from elasticsearch.dsl.pydantic import BaseESModel
+from elasticsearch.helpers import BulkIndexError
+from elasticsearch.serializer import JsonSerializer
+
+from ..sleep import sleep
 
 
 class MyInner(InnerDoc):
@@ -1126,3 +1136,275 @@ def test_renamed_fields() -> None:
     assert doc.timestamp.isoformat() == "2026-01-01T00:00:00"
     assert doc.this == 42
     assert doc.to_dict() == serialized
+
+
+def test_serialization_plan_is_rebuilt_when_mappings_change() -> None:
+    class Doc(Document):
+        name: str
+
+        class Index:
+            name = "test-serialization-plan"
+
+    doc = Doc.from_es({"_source": {"name": "foo", "count": "42", "price": "1.5"}})
+    assert doc.count == "42"
+    plan = Doc._doc_type._serialization_plan
+    assert plan is not None
+    Doc.from_es({"_source": {"name": "bar"}})
+    assert Doc._doc_type._serialization_plan is plan
+
+    # changes to other mappings keep the plan
+    Mapping().field("count", "integer")._clone().field("price", "float")
+    MyDoc._doc_type.mapping._clone()
+    Doc.from_es({"_source": {"name": "bar"}})
+    assert Doc._doc_type._serialization_plan is plan
+
+    Doc._doc_type.mapping.field("count", "integer")
+    doc = Doc.from_es({"_source": {"name": "foo", "count": "42", "price": "1.5"}})
+    assert doc.count == 42
+    assert doc.price == "1.5"
+    assert Doc._doc_type._serialization_plan is not plan
+
+    Doc._index.get_or_create_mapping().field("price", "float")
+    doc = Doc.from_es({"_source": {"name": "foo", "count": "42", "price": "1.5"}})
+    assert doc.price == 1.5
+    assert doc.to_dict() == {"name": "foo", "count": 42, "price": 1.5}
+
+
+def fake_mget(calls: List[Any]) -> Any:
+    # Documents with an even id are found, "error" fails.
+    def mget(index: str, body: Dict[str, Any], **kwargs: Any) -> Any:
+        calls.append((index, [doc["_id"] for doc in body["docs"]], kwargs))
+        docs: List[Dict[str, Any]] = []
+        for doc in body["docs"]:
+            if doc["_id"] == "error":
+                docs.append({"_id": "error", "error": {"type": "routing_missing"}})
+            elif int(doc["_id"]) % 2 == 0:
+                docs.append(
+                    {"_id": doc["_id"], "found": True, "_source": {"title": "t"}}
+                )
+            else:
+                docs.append({"_id": doc["_id"], "found": False})
+        return {"docs": docs}
+
+    return mget
+
+
+@pytest.mark.sync
+def test_get_many_is_split_into_chunks(mock_client: Any) -> None:
+    calls: List[Any] = []
+    mock_client.mget = fake_mget(calls)
+
+    docs = [
+        doc
+        for doc in MyDoc.get_many(
+            (str(i) for i in range(5)),
+            using="mock",
+            index="i",
+            chunk_size=2,
+            max_concurrent_chunks=2,
+            realtime=False,
+        )
+    ]
+
+    assert [doc.meta.id if doc else None for doc in docs] == [
+        "0",
+        None,
+        "2",
+        None,
+        "4",
+    ]
+    assert docs[0].title == "t"
+    assert sorted(ids for _, ids, _ in calls) == [["0", "1"], ["2", "3"], ["4"]]
+    assert all(c[0] == "i" and c[2] == {"realtime": False} for c in calls)
+
+    skipped = [
+        doc.meta.id
+        for doc in MyDoc.get_many(
+            [str(i) for i in range(5)], using="mock", index="i", missing="skip"
+        )
+    ]
+    assert skipped == ["0", "2", "4"]
+
+
+@pytest.mark.sync
+def test_get_many_requests_chunks_ahead_of_the_consumer(
+    mock_client: Any,
+) -> None:
+    calls: List[Any] = []
+    mock_client.mget = fake_mget(calls)
+
+    docs = []
+    with closing(
+        MyDoc.get_many(
+            (str(i) for i in itertools.count()),
+            using="mock",
+            index="i",
+            chunk_size=2,
+            max_concurrent_chunks=3,
+        )
+    ) as objs:
+        for doc in objs:
+            docs.append(doc)
+            if len(docs) == 5:
+                break
+    sleep(0.01)
+
+    assert [doc.meta.id if doc else None for doc in docs] == [
+        "0",
+        None,
+        "2",
+        None,
+        "4",
+    ]
+    # at most three chunks are requested ahead of the three consumed ones
+    assert 3 <= len(calls) <= 6
+
+
+@pytest.mark.sync
+def test_get_many_raises_for_errors(mock_client: Any) -> None:
+    mock_client.mget = fake_mget([])
+
+    with raises(NotFoundError):
+        for doc in MyDoc.get_many(["0", "1"], using="mock", index="i", missing="raise"):
+            pass
+    with raises(RequestError):
+        for doc in MyDoc.get_many(
+            ["0", "error"], using="mock", index="i", missing="skip"
+        ):
+            pass
+    assert MyDoc.mget(
+        ["0", "error"], using="mock", index="i", missing="skip", raise_on_error=False
+    ) == [MyDoc(meta={"id": "0"}, title="t")]
+    with raises(ValueError):
+        for doc in MyDoc.get_many(["0"], using="mock", chunk_size=0):
+            pass
+
+
+class RequiredDoc(Document):
+    extra = field.Long(required=True)
+
+
+def test_bulk_expander_shares_headers_and_samples_validation() -> None:
+    class Doc(Document):
+        title = field.Keyword(required=True)
+
+        class Index:
+            name = "bulk-docs"
+
+    expand = Doc._bulk_expander(validate=True, skip_empty=True)
+    header, body = expand(Doc(title="a", tags=[]))
+    assert (header, body) == ({"index": {"_index": "bulk-docs"}}, {"title": "a"})
+    assert expand(Doc(title="b"))[0] is header
+    assert expand(Doc(title="c", meta={"index": "other"}))[0] == {
+        "index": {"_index": "other"}
+    }
+    assert expand(Doc(_id="1", _routing="r", title="d")) == (
+        {"index": {"_index": "bulk-docs", "_id": "1", "routing": "r"}},
+        {"title": "d"},
+    )
+    assert expand({"_op_type": "create", "_id": "2", "_source": Doc(title="e")}) == (
+        {"create": {"_id": "2"}},
+        {"title": "e"},
+    )
+    assert expand({"_op_type": "delete", "_id": "3"}) == (
+        {"delete": {"_id": "3"}},
+        None,
+    )
+    with raises(ValidationException):
+        expand(Doc())
+
+    assert expand_each(Doc._bulk_expander(validate=False, skip_empty=False), 3) == 3
+    assert expand_each(Doc._bulk_expander(validate=2, skip_empty=True), 4) == 2
+
+
+def expand_each(expand: Any, count: int) -> int:
+    # Returns the number of invalid documents which were expanded without
+    # raising.
+    expanded = 0
+    for _ in range(count):
+        try:
+            expand(RequiredDoc())
+            expanded += 1
+        except ValidationException:
+            pass
+    return expanded
+
+
+def fake_bulk(client: Any, calls: List[Any]) -> None:
+    def bulk(operations: List[bytes], **kwargs: Any) -> Any:
+        calls.append((operations, kwargs))
+        items = []
+        for header in operations[::2]:
+            _id = json.loads(header)["index"].get("_id")
+            items.append(
+                {"index": {"_id": _id, "status": 400 if _id == "err" else 201}}
+            )
+        return ObjectApiResponse(meta=None, body={"items": items})  # type: ignore[arg-type]
+
+    client.options = lambda **kwargs: client
+    client._json_serializer = lambda name: JsonSerializer()
+    client._otel = OpenTelemetry(enabled=False)
+    client.bulk = bulk
+
+
+@pytest.mark.sync
+def test_streaming_and_parallel_bulk(mock_client: Any) -> None:
+    calls: List[Any] = []
+    fake_bulk(mock_client, calls)
+
+    def docs() -> Iterator[MySubDoc]:
+        for i in range(5):
+            yield MySubDoc(_id=str(i), title=f"t{i}")
+
+    results = [
+        r
+        for r in MySubDoc.streaming_bulk(
+            docs(), using="mock", chunk_size=2, refresh=True
+        )
+    ]
+    assert results == [
+        (True, {"index": {"_id": str(i), "status": 201}}) for i in range(5)
+    ]
+    assert [len(ops) for ops, _ in calls] == [4, 4, 2]
+    assert all(
+        kwargs == {"index": "default-index", "refresh": True} for _, kwargs in calls
+    )
+    assert json.loads(calls[0][0][1]) == {"title": "t0"}
+
+    calls.clear()
+    results = [
+        r
+        for r in MySubDoc.parallel_bulk(
+            docs(), using="mock", chunk_size=1, thread_count=3
+        )
+    ]
+    assert sorted(item["index"]["_id"] for _, item in results) == [
+        str(i) for i in range(5)
+    ]
+    assert len(calls) == 5
+
+    with raises(BulkIndexError):
+        for r in MySubDoc.parallel_bulk(
+            [MySubDoc(_id="0"), MySubDoc(_id="err")], using="mock", chunk_size=1
+        ):
+            pass
+
+
+@pytest.mark.sync
+def test_parallel_bulk_can_be_left_early(mock_client: Any) -> None:
+    calls: List[Any] = []
+    fake_bulk(mock_client, calls)
+
+    def docs() -> Iterator[MySubDoc]:
+        for i in range(20):
+            yield MySubDoc(_id=str(i), title=f"t{i}")
+
+    for ok, item in MySubDoc.parallel_bulk(
+        docs(), using="mock", chunk_size=1, thread_count=2, queue_size=2
+    ):
+        break
+    # the results are closed when they're garbage collected, without
+    # affecting the caller
+    sleep(0.01)
+    assert ok
+    assert item["index"]["status"] == 201
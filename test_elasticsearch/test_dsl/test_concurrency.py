@@ -0,0 +1,84 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from contextlib import aclosing
+from typing import Any, AsyncIterator, List
+
+import anyio
+import pytest
+
+from elasticsearch.dsl._concurrency import (
+    _async_concurrent_map,
+    _async_merge_iterators,
+)
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: Any) -> str:
+    return request.param  # type: ignore[no-any-return]
+
+
+@pytest.mark.anyio
+async def test_concurrent_map_raises_errors_in_the_caller() -> None:
+    async def func(i: int) -> int:
+        if i == 3:
+            raise ValueError(i)
+        await anyio.sleep(0.01)
+        return i
+
+    results: List[int] = []
+    with pytest.raises(ValueError):
+        async for i in _async_concurrent_map(func, range(10), 3, True):
+            results.append(i)
+    assert results == [0, 1, 2]
+
+
+@pytest.mark.anyio
+async def test_concurrent_map_cancels_tasks_when_closed() -> None:
+    cancelled: List[int] = []
+
+    async def func(i: int) -> int:
+        try:
+            await anyio.sleep(0 if i == 0 else 10)
+        except anyio.get_cancelled_exc_class():
+            cancelled.append(i)
+            raise
+        return i
+
+    with anyio.fail_after(1):
+        async with aclosing(_async_concurrent_map(func, range(10), 3, True)) as it:
+            async for i in it:
+                break
+    assert i == 0
+    assert sorted(cancelled) == [1, 2, 3]
+
+
+@pytest.mark.anyio
+async def test_merge_iterators_raises_errors_in_the_caller() -> None:
+    async def pages(fail: bool) -> AsyncIterator[int]:
+        yield 1
+        if fail:
+            raise ValueError()
+        await anyio.sleep(10)
+        yield 2
+
+    with anyio.fail_after(1), pytest.raises(ValueError):
+        async with aclosing(
+            _async_merge_iterators([pages(False), pages(True)], True)
+        ) as it:
+            async for _ in it:
+                pass
@@ -17,7 +17,7 @@
 
 import base64
 import ipaddress
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta, timezone
 from typing import cast
 
 import pytest
@@ -74,6 +74,37 @@ def test_date_deserialization() -> None:
     assert dt.date() == f._deserialize(dt.isoformat())
 
 
+def test_date_deserialization_formats() -> None:
+    f = field.Date()
+    assert f._deserialize("2024-01-31T12:34:56.789Z") == datetime(
+        2024, 1, 31, 12, 34, 56, 789000, tzinfo=timezone.utc
+    )
+    assert f._deserialize("2024-01-31T12:34:56.123456789+01:00") == datetime(
+        2024, 1, 31, 12, 34, 56, 123456, tzinfo=timezone(timedelta(hours=1))
+    )
+    # other formats are parsed by dateutil
+    assert f._deserialize("Jan 31 2024 12:34") == datetime(2024, 1, 31, 12, 34)
+    with pytest.raises(ValidationException):
+        f._deserialize("not a date")
+    with pytest.raises(ValidationException):
+        f._deserialize("1706704496789")
+
+    f = field.Date(format="strict_date_optional_time||epoch_millis")
+    assert f._deserialize("1706704496789") == datetime(2024, 1, 31, 12, 34, 56, 789000)
+    assert f._deserialize("2024-01-31") == datetime(2024, 1, 31)
+    f = field.Date(format="epoch_second")
+    assert f._deserialize("1706704496") == datetime(2024, 1, 31, 12, 34, 56)
+
+
+def test_date_field_converts_epoch_to_default_tz() -> None:
+    f = field.Date(format="epoch_millis", default_timezone="Europe/Paris")
+    value = cast(datetime, f.deserialize("1600000000000"))
+
+    assert value.tzinfo == tz.gettz("Europe/Paris")
+    assert value.isoformat() == "2020-09-13T14:26:40+02:00"
+    assert value == datetime(2020, 9, 13, 12, 26, 40, tzinfo=timezone.utc)
+
+
 def test_date_field_can_have_default_tz() -> None:
     f = field.Date(default_timezone="UTC")
     now = datetime.now()
@@ -269,6 +300,34 @@ def test_dynamic_nested() -> None:
     ]
 
 
+def test_dense_vector_packs_float32_arrays() -> None:
+    np = pytest.importorskip("numpy")
+    vector = np.array([1.0, 1.2, 2.3], dtype=np.float32)
+
+    # arrays are only packed when it's enabled
+    f = field.DenseVector()
+    assert f.serialize(vector) is vector
+
+    f = field.DenseVector(pack=True)
+    assert f.to_dict() == {"type": "dense_vector"}
+    packed = f.serialize(vector)
+    assert packed == "P4AAAD+ZmZpAEzMz"
+    assert f.deserialize(packed) == vector.tolist()
+    assert f.serialize([1.0, 1.2]) == [1.0, 1.2]
+    assert type(f.serialize(vector.astype(np.float64))) is np.ndarray
+
+    f = field.NumpyDenseVector(dtype=np.float32, pack=True)
+    unpacked = f.deserialize(f.serialize(vector))
+    assert unpacked.dtype == np.float32
+    assert unpacked.tolist() == vector.tolist()
+
+    # only vectors of floats are packed
+    byte_vector = np.array([1, 2, 3], dtype=np.float32)
+    f = field.DenseVector(element_type="byte", pack=True)
+    assert f.serialize(byte_vector) is byte_vector
+    assert f.deserialize("0102ff") == "0102ff"
+
+
 def test_all_fields_exported() -> None:
     """Make sure that all the generated field classes are exported at the top-level"""
     fields = [
@@ -15,16 +15,18 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import json
 import pickle
 from datetime import date
 from typing import Any, Dict
 
-from pytest import fixture, raises
+from pytest import fixture, importorskip, raises
 
 from elasticsearch.dsl import Date, Document, Object, Search, response
 from elasticsearch.dsl.aggs import Terms
 from elasticsearch.dsl.response.aggs import AggResponse, Bucket, BucketData
-from elasticsearch.dsl.utils import AttrDict
+from elasticsearch.dsl.serializer import serializer
+from elasticsearch.dsl.utils import AttrDict, recursive_to_dict
 
 
 @fixture
@@ -59,6 +61,31 @@ def test_hit_is_pickleable(dummy_response: Dict[str, Any]) -> None:
     assert hits[0].meta == res.hits[0].meta
 
 
+def test_hits_are_pickleable_before_they_are_accessed(
+    dummy_response: Dict[str, Any],
+) -> None:
+    res = response.Response(Search(), dummy_response)
+    hits = pickle.loads(pickle.dumps(res.hits))
+
+    assert hits.column("_id") == ["elasticsearch", "42", "47", "53"]
+    assert hits[1].meta.id == "42"
+    assert hits == res.hits
+
+
+def test_hits_are_serializable_before_they_are_accessed(
+    dummy_response: Dict[str, Any],
+) -> None:
+    res = response.Response(Search(), dummy_response)
+    data = json.loads(serializer.dumps({"hits": res.hits}))
+
+    assert data == {
+        "hits": [hit.get("_source", {}) for hit in dummy_response["hits"]["hits"]]
+    }
+    assert recursive_to_dict(response.Response(Search(), dummy_response).hits) == (
+        data["hits"]
+    )
+
+
 def test_response_stores_search(dummy_response: Dict[str, Any]) -> None:
     s = Search()
     r = response.Response(s, dummy_response)
@@ -72,8 +99,45 @@ def test_attribute_error_in_hits_is_not_hidden(dummy_response: Dict[str, Any]) -
 
     s = Search().doc_type(employee=f)
     r = response.Response(s, dummy_response)
+    # hits are hydrated when they are accessed
     with raises(TypeError):
-        r.hits
+        list(r.hits)
+
+
+def test_hits_are_hydrated_when_accessed(dummy_response: Dict[str, Any]) -> None:
+    hydrated = []
+
+    def employee(hit: AttrDict[Any]) -> Any:
+        hydrated.append(hit["_id"])
+        return hit["_id"]
+
+    r = response.Response(Search().doc_type(employee=employee), dummy_response)
+    assert len(r.hits) == 4
+    assert r.hits.total == 123
+    assert hydrated == []
+
+    assert r.hits[-1] == "53"
+    assert r.hits[1:3] == ["42", "47"]
+    assert hydrated == ["53", "42", "47"]
+    assert r.hits[1] == "42"
+    assert isinstance(r.hits[0], response.Hit)
+    assert hydrated == ["53", "42", "47"]
+
+
+def test_hits_column(dummy_response: Dict[str, Any]) -> None:
+    r = response.Response(Search(), dummy_response)
+    hits = r.hits
+
+    assert hits.column("name.first") == [None, "Shay", "Honza", None]
+    assert hits.column("lang", default="") == ["", "java", "python", ""]
+    assert hits.column("_id") == ["elasticsearch", "42", "47", "53"]
+    assert hits.column("_routing") == [None] + ["elasticsearch"] * 3
+    assert hits._l_ == [response._NOT_HYDRATED] * 4
+
+    np = importorskip("numpy")
+    scores = hits.column("_score", dtype="float32")
+    assert scores.dtype == np.float32
+    assert scores.tolist() == [12.0, np.float32(11.123), 1.0, 16.0]
 
 
 def test_interactive_helpers(dummy_response: Dict[str, Any]) -> None:
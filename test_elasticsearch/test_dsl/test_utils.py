@@ -20,7 +20,7 @@ from typing import Any, Dict, Tuple
 
 from pytest import raises
 
-from elasticsearch.dsl import Q, serializer, utils
+from elasticsearch.dsl import Q, response, serializer, utils
 
 
 def test_attrdict_pickle() -> None:
@@ -45,6 +45,36 @@ def test_attrlist_slice() -> None:
     assert isinstance(l[:][0], MyAttrDict)
 
 
+def test_wrappers_are_reused_until_the_value_is_replaced() -> None:
+    a = utils.AttrDict[Any]({"user": {"name": "foo"}, "tags": [{"a": 1}]})
+    user = a.user
+    assert a.user is user
+    assert a["user"] is user
+    assert a.tags is a.tags
+    assert a.tags[0] is a.tags[-1]
+    assert next(iter(a.tags)) is a.tags[0]
+
+    a.user = {"name": "bar"}
+    assert a.user is not user
+    assert a.user.name == "bar"
+    a._d_["user"] = {"name": "baz"}
+    assert a.user.name == "baz"
+
+    tags = a.tags
+    tags[0] = {"a": 2}
+    assert tags[0].a == 2
+
+
+def test_attrdict_and_attrlist_have_no_instance_dict() -> None:
+    hit = response.Hit({"_id": "42", "_source": {"user": {"name": "foo"}}})
+    for obj in (hit, hit.meta, hit.user, utils.AttrList[Any]([])):
+        assert not hasattr(obj, "__dict__")
+
+    hit = pickle.loads(pickle.dumps(hit))
+    assert hit.user.name == "foo"
+    assert hit.meta.id == "42"
+
+
 def test_attrlist_with_type_argument() -> None:
     a = utils.AttrList[str](["a", "b"])
     assert list(a) == ["a", "b"]
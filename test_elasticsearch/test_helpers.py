@@ -15,6 +15,7 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import inspect
 import pickle
 import threading
 import time
@@ -216,6 +217,48 @@ class TestChunkActions:
         assert len(chunks[2][0]) == 96
         assert len(chunks[2][1]) == 192
 
+    @pytest.mark.parametrize("flush_seconds", [None, 10])
+    def test_vectors_are_packed(self, flush_seconds: Optional[float]):
+        np = pytest.importorskip("numpy")
+        vector = np.array([1.0, 1.2, 2.3], dtype=np.float32)
+        source = {
+            "id": 1,
+            "vector": vector,
+            "other": np.array([1, 2]),
+            "nested": {"vector": vector},
+        }
+        actions = [({"index": {}}, source)]
+
+        ((chunk_data, chunk_actions),) = helpers._chunk_actions(
+            actions, 100, 99999999, flush_seconds, JSONSerializer(), True
+        )
+        assert chunk_actions[1] == (
+            b'{"id":1,"vector":"P4AAAD+ZmZpAEzMz","other":[1,2],'
+            b'"nested":{"vector":"P4AAAD+ZmZpAEzMz"}}'
+        )
+        # the original document is left unchanged
+        assert source["vector"] is vector
+        assert source["nested"]["vector"] is vector
+
+        ((chunk_data, chunk_actions),) = helpers._chunk_actions(
+            actions, 100, 99999999, flush_seconds, JSONSerializer()
+        )
+        assert b'"vector":[1.0,' in chunk_actions[1]
+
+    @pytest.mark.parametrize(
+        "bulk_helper",
+        [
+            helpers.streaming_bulk,
+            helpers.parallel_bulk,
+            helpers.async_streaming_bulk,
+            helpers.async_parallel_bulk,
+        ],
+    )
+    def test_pack_vectors_is_keyword_only(self, bulk_helper):
+        # positional arguments are forwarded in *args
+        parameter = inspect.signature(bulk_helper).parameters["pack_vectors"]
+        assert parameter.kind == inspect.Parameter.KEYWORD_ONLY
+
 
 class TestExpandActions:
     @pytest.mark.parametrize("action", ["whatever", b"whatever"])
@@ -231,6 +274,23 @@ def test_serialize_bulk_index_error():
     assert pickled.args == error.args
 
 
+def test_pack_dense_vectors():
+    np = pytest.importorskip("numpy")
+    for dims in (6, 7, 8):
+        vectors = np.random.default_rng().random((5, dims), dtype=np.float32)
+        packed = helpers.pack_dense_vectors(vectors)
+        assert packed == [helpers.pack_dense_vector(vector) for vector in vectors]
+        assert helpers.pack_dense_vectors(np.asfortranarray(vectors)) == packed
+
+    assert helpers.pack_dense_vectors([[1.0, 1.2, 2.3]]) == ["P4AAAD+ZmZpAEzMz"]
+    assert helpers.pack_dense_vectors(np.zeros((2, 0), dtype=np.float32)) == ["", ""]
+
+    with pytest.raises(ValueError, match="float32"):
+        helpers.pack_dense_vectors(np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="2-D"):
+        helpers.pack_dense_vectors(np.zeros(3, dtype=np.float32))
+
+
 def test_serialize_scan_error():
     error = helpers.ScanError("scroll_id", "shard_message")
     pickled = pickle.loads(pickle.dumps(error))
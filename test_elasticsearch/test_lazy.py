@@ -0,0 +1,141 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import json
+import pickle
+
+import pytest
+from elastic_transport import NodeConfig
+
+from elasticsearch import Elasticsearch, NotFoundError
+from elasticsearch.dsl import Search
+from elasticsearch.dsl.response import Response
+from elasticsearch.lazy import LazyResponseBody
+from elasticsearch.serializer import JsonSerializer, _json_response_mode
+from test_elasticsearch.test_transport import DummyNode
+
+RESPONSE = {
+    "took": 5,
+    "_shards": {"total": 1, "successful": 1, "failures": []},
+    "hits": {"total": {"value": 2}, "hits": [{"_id": "1"}, {"_id": "2"}]},
+    "aggregations": {"tags": {"buckets": [{"key": "a", "doc_count": 2}]}},
+}
+
+
+def lazy_loads(data):
+    token = _json_response_mode.set("lazy")
+    try:
+        return JsonSerializer().loads(data)
+    finally:
+        _json_response_mode.reset(token)
+
+
+def test_body_is_decoded_on_access():
+    body = lazy_loads(json.dumps(RESPONSE).encode())
+    assert isinstance(body, LazyResponseBody)
+    assert body["hits"]["total"]["value"] == 2
+    assert body["aggregations"]["tags"]["buckets"][0]["key"] == "a"
+    assert body["hits"]["hits"] == [{"_id": "1"}, {"_id": "2"}]
+    assert sorted(body) == sorted(RESPONSE)
+    assert body == RESPONSE
+    assert body.to_dict() == RESPONSE
+    with pytest.raises(KeyError):
+        body["missing"]
+
+
+@pytest.mark.parametrize("data", [b"[1, 2]", b'"text"', b""])
+def test_other_bodies_are_decoded(data):
+    assert lazy_loads(data) == JsonSerializer().loads(data)
+
+
+def test_serializing_and_pickling():
+    body = lazy_loads(json.dumps(RESPONSE).encode())
+    assert json.loads(JsonSerializer().dumps({"response": body})) == {
+        "response": RESPONSE
+    }
+    assert pickle.loads(pickle.dumps(body)) == RESPONSE
+
+
+@pytest.mark.parametrize("use_simdjson", [True, False])
+def test_dsl_response(use_simdjson, monkeypatch):
+    if use_simdjson:
+        pytest.importorskip("simdjson")
+    else:
+        monkeypatch.setattr("elasticsearch.lazy.simdjson", None)
+    body = lazy_loads(json.dumps(RESPONSE).encode())
+    assert repr(body["hits"]["total"]) == "{'value': 2}"
+
+    s = Search()
+    s.aggs.bucket("tags", "terms", field="tags")
+    response = Response(s, body)
+    assert response.hits.total.value == 2
+    assert [hit.meta.id for hit in response] == ["1", "2"]
+    assert response.aggregations.tags.buckets[0].key == "a"
+    assert response._shards.to_dict() == RESPONSE["_shards"]
+    assert pickle.loads(pickle.dumps(response.hits.total)) == {"value": 2}
+
+
+def client_with_response(status, data):
+    return Elasticsearch(
+        [
+            NodeConfig(
+                "http",
+                "localhost",
+                9200,
+                _extras={
+                    "status": status,
+                    "data": data,
+                    "headers": {
+                        "X-elastic-product": "Elasticsearch",
+                        "Content-Type": "application/json",
+                    },
+                },
+            )
+        ],
+        node_class=DummyNode,
+    )
+
+
+class TestLazyResponse:
+    @pytest.mark.parametrize("status", [200, 299])
+    def test_search(self, status):
+        client = client_with_response(status, json.dumps(RESPONSE).encode())
+
+        resp = client.options(lazy_response=True).search(index="test")
+        assert isinstance(resp.body, LazyResponseBody)
+        assert resp["hits"]["total"] == {"value": 2}
+        assert resp.body == RESPONSE
+
+        assert type(client.search(index="test").body) is dict
+
+    def test_error_responses_are_decoded(self):
+        client = client_with_response(
+            404, b'{"error": {"type": "index_not_found_exception"}, "status": 404}'
+        )
+        with pytest.raises(NotFoundError) as e:
+            client.options(lazy_response=True).search(index="test")
+        assert e.value.message == "index_not_found_exception"
+        assert type(e.value.body) is dict
+
+    def test_options(self):
+        client = Elasticsearch("http://localhost:9200", node_class=DummyNode)
+        assert client._lazy_response is False
+        lazy = client.options(lazy_response=True)
+        assert lazy.options()._lazy_response is True
+        assert lazy.options(lazy_response=False)._lazy_response is False
+        with pytest.raises(TypeError, match="'lazy_response' must be of type 'bool'"):
+            client.options(lazy_response="yes")
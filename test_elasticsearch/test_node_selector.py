@@ -0,0 +1,223 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import time
+
+import pytest
+from elastic_transport import NodeConfig, RoundRobinSelector
+
+from elasticsearch import Elasticsearch
+from elasticsearch.node_selector import (
+    COORDINATING_ONLY,
+    LatencyAwareSelector,
+    NodeRouting,
+    RoutingSelector,
+)
+from test_elasticsearch.test_transport import DummyNode
+
+
+class Node:
+    def __init__(self, port, roles=None, attributes=None):
+        extras = {}
+        if roles is not None:
+            extras["_elasticsearch.roles"] = roles
+        if attributes is not None:
+            extras["_elasticsearch.attributes"] = attributes
+        self.config = NodeConfig("http", "localhost", port, _extras=extras)
+
+
+def record_latency(selector, nodes, latency):
+    with selector._track_request(None, None):
+        node = selector.select(nodes)
+        time.sleep(latency)
+    return node
+
+
+def test_selects_node_with_lower_latency():
+    fast, slow = Node(9200), Node(9201)
+    selector = LatencyAwareSelector([fast.config, slow.config])
+    record_latency(selector, [fast], 0.001)
+    record_latency(selector, [slow], 0.05)
+
+    assert all(selector.select([fast, slow]) is fast for _ in range(10))
+
+
+def test_in_flight_requests_increase_cost():
+    a, b = Node(9200), Node(9201)
+    selector = LatencyAwareSelector([a.config, b.config])
+    record_latency(selector, [a], 0.01)
+    record_latency(selector, [b], 0.015)
+
+    with selector._track_request(None, None):
+        assert selector.select([a, b]) is a
+        # 'a' has one request in-flight and costs twice its latency.
+        assert selector.select([a, b]) is b
+
+    assert selector._stats[a.config].in_flight == 0
+    assert selector._stats[b.config].in_flight == 0
+
+
+def test_latency_decays_while_node_is_unused():
+    a, b = Node(9200), Node(9201)
+    selector = LatencyAwareSelector([a.config, b.config])
+    record_latency(selector, [a], 0.05)
+    record_latency(selector, [b], 0.01)
+    assert selector.select([a, b]) is b
+
+    selector._stats[a.config].updated_at -= 60
+    assert selector.select([a, b]) is a
+
+
+def test_master_eligible_nodes_are_weighted():
+    master = Node(9200, roles=("master", "data"))
+    coordinating = Node(9201, roles=())
+    selector = LatencyAwareSelector([])
+    record_latency(selector, [master], 0)
+    record_latency(selector, [coordinating], 0)
+    selector._stats[master.config].ewma = 0.01
+    selector._stats[coordinating.config].ewma = 0.015
+
+    # By default nodes are only compared by their cost.
+    assert all(selector.select([master, coordinating]) is master for _ in range(10))
+
+    selector.master_eligible_weight = 2.0
+    assert all(
+        selector.select([master, coordinating]) is coordinating for _ in range(10)
+    )
+    # Nodes with unknown roles are weighted like master-eligible nodes.
+    unknown = Node(9202)
+    record_latency(selector, [unknown], 0)
+    selector._stats[unknown.config].ewma = 0.01
+    assert all(
+        selector.select([unknown, coordinating]) is coordinating for _ in range(10)
+    )
+
+
+def test_client_records_latencies():
+    client = Elasticsearch(
+        [
+            NodeConfig("http", "localhost", 9200),
+            NodeConfig("http", "localhost", 9201),
+        ],
+        node_class=DummyNode,
+        node_selector_class=LatencyAwareSelector,
+    )
+    selector = client.transport.node_pool.node_selector
+    assert client._routing_selector is selector
+    assert client.options()._routing_selector is selector
+
+    for _ in range(10):
+        client.info()
+
+    stats = selector._stats.values()
+    assert sum(1 for s in stats if s.updated_at is not None) == 2
+    assert all(s.in_flight == 0 for s in stats)
+
+
+@pytest.mark.parametrize(
+    ["endpoint_id", "expected"],
+    [
+        ("bulk", {9201}),
+        ("search", {9202}),
+        ("info", {9200, 9201, 9202}),
+        (None, {9200, 9201, 9202}),
+    ],
+)
+def test_routing_by_endpoint_roles(endpoint_id, expected):
+    nodes = [
+        Node(9200, roles=("master", "data")),
+        Node(9201, roles=("ingest",)),
+        Node(9202, roles=()),
+    ]
+    routing = NodeRouting(
+        endpoint_roles={"bulk": ["ingest"], "search": [COORDINATING_ONLY]}
+    )
+    selector = RoutingSelector([])
+
+    selected = set()
+    with selector._track_request(routing, endpoint_id):
+        for _ in range(6):
+            selected.add(selector.select(nodes).config.port)
+    assert selected == expected
+
+
+def test_routing_falls_back_to_other_nodes():
+    nodes = [Node(9200, roles=("master", "data")), Node(9201)]
+    routing = NodeRouting(
+        endpoint_roles={"bulk": ["ingest"]}, prefer_attributes={"zone": "a"}
+    )
+    selector = RoutingSelector([])
+
+    selected = set()
+    with selector._track_request(routing, "bulk"):
+        for _ in range(4):
+            selected.add(selector.select(nodes).config.port)
+    assert selected == {9200, 9201}
+
+
+def test_routing_prefers_attributes():
+    nodes = [
+        Node(9200, roles=("ingest",), attributes={"zone": "a"}),
+        Node(9201, roles=("ingest",), attributes={"zone": "b"}),
+        Node(9202, roles=("data",), attributes={"zone": "b"}),
+        Node(9203),
+    ]
+    routing = NodeRouting(
+        endpoint_roles={"bulk": ["ingest"]}, prefer_attributes={"zone": "b"}
+    )
+    selector = LatencyAwareSelector([])
+
+    with selector._track_request(routing, "bulk"):
+        assert all(selector.select(nodes).config.port == 9201 for _ in range(5))
+    with selector._track_request(routing, "search"):
+        assert all(selector.select(nodes).config.port in (9201, 9202) for _ in range(5))
+
+
+def test_avoids_nodes_of_another_request():
+    nodes = [Node(9200), Node(9201)]
+    selector = RoutingSelector([])
+
+    with selector._track_request(None, None) as first:
+        first_node = selector.select(nodes)
+    with selector._track_request(None, None, avoid=first):
+        assert all(selector.select(nodes) is not first_node for _ in range(4))
+    # Avoided nodes are used if there's no other node.
+    with selector._track_request(None, None, avoid=first):
+        assert selector.select([first_node]) is first_node
+
+
+def test_client_node_routing():
+    routing = NodeRouting(endpoint_roles={"bulk": ["ingest"]})
+    client = Elasticsearch(
+        "http://localhost:9200", node_class=DummyNode, node_routing=routing
+    )
+    assert isinstance(client.transport.node_pool.node_selector, RoutingSelector)
+    assert client._node_routing is routing
+    assert client.options()._node_routing is routing
+    assert client.options(node_routing=None)._node_routing is None
+
+    with pytest.raises(ValueError, match="subclass of 'RoutingSelector'"):
+        Elasticsearch(
+            "http://localhost:9200",
+            node_class=DummyNode,
+            node_selector_class=RoundRobinSelector,
+            node_routing=routing,
+        )
+
+    client = Elasticsearch("http://localhost:9200", node_class=DummyNode)
+    with pytest.raises(ValueError, match="subclass of 'RoutingSelector'"):
+        client.options(node_routing=routing)
@@ -16,6 +16,8 @@
 #  under the License.
 
 import os
+import threading
+import time
 from unittest import mock
 
 import pytest
@@ -32,6 +34,7 @@ except ModuleNotFoundError:
 
 
 from elasticsearch._otel import ENABLED_ENV_VAR, OpenTelemetry
+from test_elasticsearch.test_cases import DummyTransport
 
 pytestmark = [
     pytest.mark.skipif(
@@ -120,3 +123,33 @@ def test_forward_otel_context_to_subthreads(
     # Ensures that the OTEL context has been forwarded to all chunks
     assert es_client._otel.helpers_span.call_count == 1
     assert es_client._otel.use_span.call_count == 25
+
+
+def test_coalesced_request_spans_are_linked():
+    class SlowTransport(DummyTransport):
+        def perform_request(self, method, target, **kwargs):
+            time.sleep(0.1)
+            return super().perform_request(method, target, **kwargs)
+
+    tracer, memory_exporter = setup_tracing()
+    es_client = Elasticsearch(
+        "http://localhost:9200", transport_class=SlowTransport, coalesce_requests=True
+    )
+    es_client._otel = OpenTelemetry(enabled=True, tracer=tracer)
+
+    threads = [
+        threading.Thread(target=lambda: es_client.get(index="test", id="1"))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert es_client.transport.call_count == 1
+    spans = memory_exporter.get_finished_spans()
+    assert len(spans) == 3
+    (leader,) = [span for span in spans if not span.links]
+    for span in spans:
+        if span is not leader:
+            assert [link.context for link in span.links] == [leader.context]
@@ -15,8 +15,10 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import ipaddress
+import json
 import uuid
-from datetime import datetime
+from datetime import date, datetime, timezone
 from decimal import Decimal
 
 import pytest
@@ -28,6 +30,13 @@ try:
 except ImportError:
     pa = None
 
+try:
+    import cbor2
+
+    from elasticsearch.serializer import CborSerializer
+except ImportError:
+    cbor2 = None
+
 try:
     import numpy as np
     import pandas as pd
@@ -36,9 +45,15 @@ except ImportError:
 
 import re
 
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, serializer
 from elasticsearch.exceptions import SerializationError
-from elasticsearch.serializer import JSONSerializer, OrjsonSerializer, TextSerializer
+from elasticsearch.serializer import (
+    JSONSerializer,
+    JsonSerializer,
+    NdjsonSerializer,
+    OrjsonSerializer,
+    TextSerializer,
+)
 
 requires_numpy_and_pandas = pytest.mark.skipif(
     np is None or pd is None, reason="Test requires numpy and pandas to be available"
@@ -56,6 +71,30 @@ def test_datetime_serialization(json_serializer):
     )
 
 
+def test_datetime_subclass_serialization(json_serializer):
+    class Timestamp(datetime):
+        def isoformat(self, sep="T", timespec="auto"):
+            return super().isoformat(sep, "seconds") + "Z"
+
+    # The encoder is looked up once per type and cached.
+    for _ in range(2):
+        assert b'{"d":"2010-10-01T02:30:00Z"}' == json_serializer.dumps(
+            {"d": Timestamp(2010, 10, 1, 2, 30, 0, 123)}
+        )
+    assert json_serializer.default(date(2010, 10, 1)) == "2010-10-01"
+
+
+def test_unknown_types_are_not_cached(json_serializer, monkeypatch):
+    class Number:
+        def __int__(self):
+            return 42
+
+    with pytest.raises(SerializationError):
+        json_serializer.dumps({"d": Number()})
+    monkeypatch.setattr(serializer, "INTEGER_TYPES", (Number,))
+    assert b'{"d":42}' == json_serializer.dumps({"d": Number()})
+
+
 @requires_numpy_and_pandas
 def test_decimal_serialization(json_serializer):
     assert b'{"d":3.8}' == json_serializer.dumps({"d": Decimal("3.8")})
@@ -121,6 +160,31 @@ def test_serializes_numpy_ndarray(json_serializer):
     )
 
 
+@requires_numpy_and_pandas
+def test_serializes_numpy_ndarray_views_and_subclasses(json_serializer):
+    data = np.arange(6, dtype=np.float32).reshape(2, 3)
+    assert b'{"d":[[0.0,1.0,2.0],[3.0,4.0,5.0]]}' == json_serializer.dumps({"d": data})
+    # Non-contiguous views, ie columns or strided slices
+    assert b'{"d":[0.0,3.0]}' == json_serializer.dumps({"d": data[:, 0]})
+    assert b'{"d":[0.0,2.0,4.0]}' == json_serializer.dumps({"d": data.ravel()[::2]})
+    assert b'{"d":[[0.0,1.0,2.0],[3.0,4.0,5.0]]}' == json_serializer.dumps(
+        {"d": data.view(type("Subclass", (np.ndarray,), {}))}
+    )
+    assert b'{"d":["a",1]}' == json_serializer.dumps(
+        {"d": np.array(["a", 1], dtype=object)[::1]}
+    )
+    assert b'{"d":[1,2]}' == json_serializer.dumps(
+        {"d": np.array([1, 2], dtype=np.longlong)[::1]}
+    )
+
+
+@requires_numpy_and_pandas
+def test_serializes_numpy_scalar_subtypes(json_serializer):
+    assert b'{"d":[1,2,1.5]}' == json_serializer.dumps(
+        {"d": [np.longlong(1), np.ulonglong(2), np.longdouble(1.5)]}
+    )
+
+
 @requires_numpy_and_pandas
 def test_serializes_numpy_nan_to_nan():
     assert b'{"d":NaN}' == JSONSerializer().dumps({"d": float("NaN")})
@@ -142,6 +206,16 @@ def test_serializes_pandas_series(json_serializer):
     )
 
 
+@requires_numpy_and_pandas
+def test_serializes_pandas_numeric_series(json_serializer):
+    assert b'{"d":[1.5,2.5]}' == json_serializer.dumps(
+        {"d": pd.Series([1.5, 2.5], dtype=np.float32)}
+    )
+    assert b'{"d":[1,null]}' == json_serializer.dumps(
+        {"d": pd.Series([1, None], dtype="Int64")}
+    )
+
+
 @requires_numpy_and_pandas
 @pytest.mark.skipif(not hasattr(pd, "NA"), reason="pandas.NA is required")
 def test_serializes_pandas_na(json_serializer):
@@ -164,6 +238,50 @@ def test_serializes_pandas_category(json_serializer):
     assert b'{"d":[1,2,3]}' == json_serializer.dumps({"d": cat})
 
 
+@pytest.mark.skipif(cbor2 is None, reason="Test requires cbor2 to be available")
+def test_cbor_serializer():
+    serializer = CborSerializer()
+    data = {"a": [1, 2.5, None, True], "b": {"c": "d"}}
+    assert serializer.loads(serializer.dumps(data)) == data
+    assert serializer.loads(b"") is None
+    assert serializer.dumps(b"\xa0") == b"\xa0"
+
+
+@pytest.mark.skipif(cbor2 is None, reason="Test requires cbor2 to be available")
+def test_cbor_serializer_encodes_values_like_json():
+    serializer = CborSerializer()
+    data = {
+        "uuid": uuid.UUID("00000000-0000-0000-0000-000000000001"),
+        "decimal": Decimal("1.5"),
+        "date": date(2024, 1, 2),
+        "nested": [{"uuid": uuid.UUID(int=2)}],
+    }
+    assert serializer.loads(serializer.dumps(data)) == json.loads(
+        JsonSerializer().dumps(data)
+    )
+    assert serializer.loads(serializer.dumps({"dt": datetime(2024, 1, 2, 3)})) == {
+        "dt": datetime(2024, 1, 2, 3, tzinfo=timezone.utc)
+    }
+    # Values JSON can't encode aren't encoded with CBOR tags either.
+    for value in ({1, 2}, ipaddress.ip_address("127.0.0.1")):
+        with pytest.raises(SerializationError):
+            JsonSerializer().dumps({"v": value})
+        with pytest.raises(SerializationError):
+            serializer.dumps({"v": value})
+
+
+@pytest.mark.skipif(cbor2 is None, reason="Test requires cbor2 to be available")
+@requires_numpy_and_pandas
+def test_cbor_serializer_numpy():
+    serializer = CborSerializer()
+    data = {"v": np.array([1, 2], dtype=np.int32), "f": np.float32(1.5)}
+    assert serializer.loads(serializer.dumps(data)) == {"v": [1, 2], "f": 1.5}
+    with pytest.raises(SerializationError):
+        serializer.dumps({"d": object()})
+    with pytest.raises(SerializationError):
+        serializer.loads(b"\xff\xff")
+
+
 @pytest.mark.skipif(pa is None, reason="Test requires pyarrow to be available")
 def test_pyarrow_loads():
     data = [
@@ -198,6 +316,20 @@ def test_raises_serialization_error_on_load_error(json_serializer):
         json_serializer.loads("{{")
 
 
+def test_ndjson_serializer_dumps():
+    serializer = NdjsonSerializer()
+    lines = [b'{"index":{}}', '{"a":"你"}\n', {"b": datetime(2010, 10, 1)}, b"{}\n"]
+    assert serializer.dumps(lines) == (
+        b'{"index":{}}\n{"a":"\xe4\xbd\xa0"}\n{"b":"2010-10-01T00:00:00"}\n{}\n'
+    )
+    assert serializer.dumps(({"a": 1} for _ in range(2))) == b'{"a":1}\n{"a":1}\n'
+    assert serializer.dumps(b'{"a":1}') == b'{"a":1}\n'
+    assert serializer.dumps([]) == b""
+
+    with pytest.raises(SerializationError, match="Unable to serialize to NDJSON"):
+        serializer.dumps([{"a": object()}])
+
+
 def test_strings_are_left_untouched():
     assert b"\xe4\xbd\xa0\xe5\xa5\xbd" == TextSerializer().dumps("你好")
 
@@ -0,0 +1,178 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import json
+
+import pytest
+from elastic_transport import NodeConfig
+
+from elasticsearch import Elasticsearch, NotFoundError
+from elasticsearch.exceptions import SerializationError
+from elasticsearch.streaming import StreamingResponseBody
+from test_elasticsearch.test_transport import CLUSTER_NODES, DummyNode
+
+SEARCH_RESPONSE = {
+    "took": 3,
+    "_shards": {"total": 1, "successful": 1},
+    "hits": {
+        "total": {"value": 3, "relation": "eq"},
+        "hits": [
+            {"_id": "1", "_source": {"title": "café", "tags": ["a", "b"]}},
+            {"_id": "2", "_source": {"title": 'say "hi"'}},
+            {"_id": "3", "_source": {}},
+        ],
+        "max_score": None,
+    },
+    "_scroll_id": "abc",
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_items_decodes_items(indent):
+    body = StreamingResponseBody(
+        json.dumps(SEARCH_RESPONSE, indent=indent).encode(), ("hits", "hits")
+    )
+    items = body.iter_items()
+    assert next(items) == SEARCH_RESPONSE["hits"]["hits"][0]
+    assert list(items) == SEARCH_RESPONSE["hits"]["hits"][1:]
+
+    assert body["took"] == 3
+    assert body["_scroll_id"] == "abc"
+    assert body["hits"] == {
+        "total": {"value": 3, "relation": "eq"},
+        "hits": [],
+        "max_score": None,
+    }
+    # Items can be iterated again.
+    assert len(list(body.iter_items())) == 3
+
+
+def test_mapping_access_before_iterating_items():
+    body = StreamingResponseBody(json.dumps(SEARCH_RESPONSE).encode(), ("hits", "hits"))
+    assert dict(body) == {**SEARCH_RESPONSE, "hits": {**body["hits"], "hits": []}}
+    assert [hit["_id"] for hit in body.iter_items()] == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize(
+    ["data", "items"],
+    [
+        (b'{"hits": {"hits": []}}', []),
+        (b'{"hits": {}}', []),
+        (b"{}", []),
+        (b'{"values": [[1, "a"], [2, null]]}', [[1, "a"], [2, None]]),
+    ],
+)
+def test_iter_items_edge_cases(data, items):
+    path = ("values",) if b"values" in data else ("hits", "hits")
+    assert list(StreamingResponseBody(data, path).iter_items()) == items
+
+
+def test_iter_items_of_decoded_body():
+    body = StreamingResponseBody(SEARCH_RESPONSE, ("hits", "hits"))
+    assert list(body.iter_items()) == SEARCH_RESPONSE["hits"]["hits"]
+    assert body["hits"]["hits"] == []
+    assert SEARCH_RESPONSE["hits"]["hits"] != []
+
+
+def test_invalid_json():
+    body = StreamingResponseBody(b'{"hits": {"hits": [{}, }', ("hits", "hits"))
+    with pytest.raises(SerializationError):
+        list(body.iter_items())
+
+
+def client_with_response(status, data, **kwargs):
+    return Elasticsearch(
+        [
+            NodeConfig(
+                "http",
+                "localhost",
+                9200,
+                _extras={
+                    "status": status,
+                    "data": data,
+                    "headers": {
+                        "X-elastic-product": "Elasticsearch",
+                        "Content-Type": "application/json",
+                    },
+                },
+            )
+        ],
+        node_class=DummyNode,
+        **kwargs,
+    )
+
+
+class TestStreamResponse:
+    @pytest.mark.parametrize("status", [200, 299])
+    def test_search(self, status):
+        client = client_with_response(status, json.dumps(SEARCH_RESPONSE).encode())
+
+        resp = client.options(stream_response=True).search(index="test")
+        assert isinstance(resp.body, StreamingResponseBody)
+        assert len(list(resp.body.iter_items())) == 3
+        assert resp["hits"]["total"]["value"] == 3
+
+        # Without the option the body is decoded as usual.
+        assert client.search(index="test").body == SEARCH_RESPONSE
+
+    def test_msearch(self):
+        data = {"took": 1, "responses": [SEARCH_RESPONSE, SEARCH_RESPONSE]}
+        client = client_with_response(200, json.dumps(data).encode())
+
+        resp = client.options(stream_response=True).msearch(
+            searches=[{}, {"query": {"match_all": {}}}]
+        )
+        assert list(resp.body.iter_items()) == [SEARCH_RESPONSE, SEARCH_RESPONSE]
+
+    def test_other_endpoints_are_not_streamed(self):
+        client = client_with_response(200, b'{"count": 1}')
+        resp = client.options(stream_response=True).count(index="test")
+        assert resp.body == {"count": 1}
+
+    def test_error_responses_are_decoded(self):
+        client = client_with_response(
+            404, b'{"error": {"type": "index_not_found_exception"}, "status": 404}'
+        )
+        with pytest.raises(NotFoundError) as e:
+            client.options(stream_response=True).search(index="test")
+        assert e.value.body["status"] == 404
+
+    def test_options(self):
+        client = Elasticsearch("http://localhost:9200", node_class=DummyNode)
+        assert client._stream_response is False
+        streaming = client.options(stream_response=True)
+        assert streaming.options()._stream_response is True
+        assert streaming.options(stream_response=False)._stream_response is False
+        with pytest.raises(TypeError, match="'stream_response' must be of type 'bool'"):
+            client.options(stream_response=1)
+
+    @pytest.mark.parametrize(
+        "options", [{"stream_response": True}, {"lazy_response": True}]
+    )
+    def test_sniffing_decodes_its_own_response(self, options):
+        # The node answers the sniff request and the search with the same body.
+        data = {**json.loads(CLUSTER_NODES), **SEARCH_RESPONSE}
+        client = client_with_response(
+            200, json.dumps(data).encode(), sniff_before_requests=True
+        )
+
+        resp = client.options(**options).search(index="test")
+        assert resp["hits"]["total"]["value"] == 3
+        calls = [
+            call[0] for node in client.transport.node_pool.all() for call in node.calls
+        ]
+        assert ("GET", "/_nodes/_all/http") in calls
@@ -158,6 +158,7 @@ CLUSTER_NODES_MASTER_ONLY = """{
       "version" : "5.0.0",
       "build_hash" : "253032b",
       "roles" : [ "master", "data", "ingest" ],
+      "attributes" : { "zone" : "b" },
       "http" : {
         "bound_address" : [ "[fe80::1]:9200", "[::1]:9200", "127.0.0.1:9200" ],
         "publish_address" : "somehost.tld/1.1.1.1:124",
@@ -604,6 +605,31 @@ class TestTransport:
         ports = {node.config.port for node in client.transport.node_pool.all()}
         assert ports == {9200, 124}
 
+    def test_sniffed_nodes_keep_roles_and_attributes(self):
+        client = Elasticsearch(  # noqa: F821
+            [
+                NodeConfig(
+                    "http",
+                    "localhost",
+                    9200,
+                    _extras={"data": CLUSTER_NODES_MASTER_ONLY},
+                )
+            ],
+            node_class=DummyNode,
+            sniff_on_start=True,
+        )
+
+        roles = {
+            node.config.port: node.config._extras.get("_elasticsearch.roles")
+            for node in client.transport.node_pool.all()
+        }
+        assert roles == {9200: None, 124: ("master", "data", "ingest")}
+        attributes = {
+            node.config.port: node.config._extras.get("_elasticsearch.attributes")
+            for node in client.transport.node_pool.all()
+        }
+        assert attributes == {9200: None, 124: {"zone": "b"}}
+
 
 @pytest.mark.parametrize("headers", [{}, {"X-elastic-product": "BAD HEADER"}])
 def test_unsupported_product_error(headers):
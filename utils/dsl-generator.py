@@ -916,6 +916,21 @@ def generate_field_py(schema, filename):
                     "required": False,
                 }
             ] + k["args"]
+        elif name == "dense_vector":
+            # the DSL's dense vector field can send numpy arrays packed
+            k["args"].append(
+                {
+                    "name": "pack",
+                    "type": 'Union[bool, "DefaultType"]',
+                    "doc": [
+                        ":arg pack: If `True`, float32 numpy arrays are sent as base64",
+                        "   encoded strings, which are faster to encode and decode than",
+                        "   arrays of numbers. Only use it with `float` vectors.",
+                    ],
+                    "required": False,
+                    "local": True,
+                }
+            )
         classes.append(k)
     # make sure parent classes appear first
     classes = sorted(
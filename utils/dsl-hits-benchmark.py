@@ -0,0 +1,109 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Measures the memory used to hold search hits wrapped in ``Hit`` objects
+and the throughput of reading nested fields of the hits. Doesn't need an
+Elasticsearch server, the hits are generated.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from elasticsearch.dsl import Search
+from elasticsearch.dsl.response import Response
+
+
+def make_response(hits):
+    return {
+        "took": 1,
+        "timed_out": False,
+        "hits": {
+            "total": {"value": hits, "relation": "eq"},
+            "hits": [
+                {
+                    "_index": "benchmark",
+                    "_id": str(i),
+                    "_score": 1.0,
+                    "_source": {
+                        "user": {"id": i, "name": f"user-{i}"},
+                        "message": "hello world",
+                        "tags": ["a", "b"],
+                    },
+                }
+                for i in range(hits)
+            ],
+        },
+    }
+
+
+def memory(hits):
+    body = make_response(hits)
+    json_size = len(json.dumps(body))
+    gc.collect()
+    tracemalloc.start()
+    response = Response(Search(), body)
+    wrapped = list(response.hits)
+    size, _ = tracemalloc.get_traced_memory()
+    for hit in wrapped:
+        hit.user.name
+    size_after_reads, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return json_size, size, size_after_reads
+
+
+def throughput(hits, accesses):
+    response = Response(Search(), make_response(hits))
+    wrapped = list(response.hits)
+    start = time.perf_counter()
+    for _ in range(accesses):
+        for hit in wrapped:
+            hit.user.name
+    return hits * accesses / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--hits",
+        type=int,
+        default=100_000,
+        help="Number of hits in the response (default: 100000)",
+    )
+    parser.add_argument(
+        "--accesses",
+        type=int,
+        default=10,
+        help="Number of times a nested field of each hit is read (default: 10)",
+    )
+    args = parser.parse_args()
+
+    json_size, size, size_after_reads = memory(args.hits)
+    print(f"JSON size of the response: {json_size / 2**20:.1f} MiB")
+    print(f"Memory used by the wrapped hits: {size / 2**20:.1f} MiB")
+    print(
+        f"Memory used after reading hit.user.name: {size_after_reads / 2**20:.1f} MiB"
+    )
+    print(
+        f"Reads of hit.user.name: {throughput(args.hits, args.accesses):,.0f} per second"
+    )
+
+
+if __name__ == "__main__":
+    main()
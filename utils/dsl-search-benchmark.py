@@ -0,0 +1,88 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Measures how many searches per second can be built with a chain of
+builder calls and serialized with ``to_dict()``, and the time to clone
+a search. Doesn't need an Elasticsearch server.
+"""
+
+import argparse
+import timeit
+
+from elasticsearch.dsl import Search
+
+
+def build(user_filters):
+    s = Search(index="logs")
+    for field, value in user_filters.items():
+        s = s.filter("term", **{field: value})
+    s = s.filter("range", age={"gte": 18}).exclude("term", banned=True)
+    s = s.query("match", title="python")
+    s = s.sort("-date", "title").source(["title", "date"])
+    s = s.highlight("title").highlight_options(order="score")
+    s = s.extra(track_total_hits=True).params(routing="user-1")
+    s = s.suggest("title-suggestion", "pyton", term={"field": "title"})
+    s = s.script_fields(double_likes="doc['likes'].value * 2")
+    s = s.collapse("user")[10:20]
+    s.aggs.bucket("tags", "terms", field="tags")
+    return s
+
+
+def best_of(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--filters",
+        type=int,
+        default=3,
+        help="Number of user filters added to each search (default: 3)",
+    )
+    parser.add_argument(
+        "--number",
+        type=int,
+        default=2_000,
+        help="Number of searches built per measurement (default: 2000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of measurements, the best one is reported (default: 5)",
+    )
+    args = parser.parse_args()
+
+    user_filters = {f"field_{i}": f"value_{i}" for i in range(args.filters)}
+    built = best_of(lambda: build(user_filters), args.number, args.repeat)
+    serialized = best_of(
+        lambda: build(user_filters).to_dict(), args.number, args.repeat
+    )
+    s = build(user_filters)
+    cloned = best_of(s._clone, args.number * 10, args.repeat)
+
+    print(f"Searches built: {1 / built:,.0f} per second ({built * 1e6:.1f} µs each)")
+    print(
+        f"Searches built and serialized: {1 / serialized:,.0f} per second "
+        f"({serialized * 1e6:.1f} µs each)"
+    )
+    print(f"Clones of a search: {cloned * 1e6:.2f} µs each")
+
+
+if __name__ == "__main__":
+    main()
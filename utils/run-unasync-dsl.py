@@ -53,6 +53,7 @@ def main(check=False):
         "AsyncSearch": "Search",
         "AsyncMultiSearch": "MultiSearch",
         "AsyncEmptySearch": "EmptySearch",
+        "AsyncCompiledSearch": "CompiledSearch",
         "AsyncDocument": "Document",
         "AsyncIndexMeta": "IndexMeta",
         "AsyncIndexTemplate": "IndexTemplate",
@@ -67,6 +68,8 @@ def main(check=False):
         "async_scan": "scan",
         "async_simulate": "simulate",
         "async_bulk": "bulk",
+        "async_streaming_bulk": "streaming_bulk",
+        "async_parallel_bulk": "parallel_bulk",
         "async_mock_client": "mock_client",
         "async_client": "client",
         "async_data_client": "data_client",
@@ -74,6 +77,9 @@ def main(check=False):
         "async_pull_request": "pull_request",
         "async_examples": "examples",
         "async_sleep": "sleep",
+        "_async_concurrent_map": "_concurrent_map",
+        "_async_merge_iterators": "_merge_iterators",
+        "aclosing": "closing",
         "assert_awaited_once_with": "assert_called_once_with",
         "asynccontextmanager": "contextmanager",
     }
@@ -24,9 +24,8 @@ from pathlib import Path
 import unasync
 
 
-def cleanup(source_dir: Path, output_dir: Path, patterns: list[str]):
-    for file in glob("*.py", root_dir=source_dir):
-        path = output_dir / file
+def cleanup(output_paths: list[Path], patterns: list[str]):
+    for path in output_paths:
         for pattern in patterns:
             subprocess.check_call(["sed", "-i.bak", pattern, str(path)])
         subprocess.check_call(["rm", f"{path}.bak"])
@@ -56,7 +55,14 @@ def run(
     unasync.unasync_files(filepaths, [rule])
 
     if cleanup_patterns:
-        cleanup(source_dir, output_dir, cleanup_patterns)
+        # Only files generated by unasync are cleaned up.
+        cleanup(
+            [
+                output_dir / os.path.relpath(filepath, source_dir)
+                for filepath in filepaths
+            ],
+            cleanup_patterns,
+        )
 
     if check:
         subprocess.check_call(["black", output_dir])
@@ -87,8 +93,16 @@ def main(check: bool = False):
                 "AsyncSearchClient": "AsyncSearchClient",
                 # Handling typing.Awaitable[...] isn't done yet by unasync.
                 "_TYPE_ASYNC_SNIFF_CALLBACK": "_TYPE_SYNC_SNIFF_CALLBACK",
+                "_AsyncRequestCoalescer": "_RequestCoalescer",
+                "_AsyncMicroBatcher": "_MicroBatcher",
+                "_AsyncRequestHedger": "_RequestHedger",
+                "AsyncBatchedClient": "BatchedClient",
             },
         ),
+        cleanup_patterns=[
+            # docstrings aren't rewritten by unasync
+            "s/~elasticsearch\\.AsyncElasticsearch\\./~elasticsearch.Elasticsearch./g",
+        ],
         check=check,
     )
 